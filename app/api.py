@@ -0,0 +1,389 @@
+"""JSON API for partner institutions, mounted on the Reflex backend under /api/v1.
+
+Requests authenticate with ``Authorization: Bearer <token>``; issue tokens with
+``python -m app.api create-token user@example.com``. ``python -m app.api bench``
+measures requests per second against the app in-process, on a scratch database.
+"""
+
+import argparse
+import asyncio
+import datetime
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Optional
+
+import reflex as rx
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import UploadFile
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.services.jobs import enqueue_post_submission
+from app.services.storage import remove_upload
+from app.state import LIST_PAGE_SIZE, PROPOSAL_STATUSES, Database, Proposal, User, db
+from app.states.proposal_state import (
+    ALLOWED_EXTENSIONS,
+    MAX_UPLOAD_SIZE_BYTES,
+    proposal_field_errors,
+)
+
+
+MAX_PAGE_SIZE = 500
+MAX_BATCH_SIZE = 1000
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+BENCH_REQUESTS = 2000
+BENCH_CONCURRENCY = 32
+BENCH_PROPOSALS = 1000
+REQUIRED_FIELDS = ("full_name", "email", "affiliation", "phone_number", "title", "description")
+PUBLIC_FIELDS = tuple(Proposal.__annotations__)
+
+
+class ApiError(Exception):
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+def _error(exc: ApiError) -> JSONResponse:
+    return JSONResponse({"error": exc.message}, status_code=exc.status_code)
+
+
+def _database(request: Request) -> Database:
+    """The database the serving app was built with (see ``build_api``)."""
+    return request.app.state.db
+
+
+async def _authenticate(request: Request) -> User:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise ApiError(401, "Missing bearer token.")
+    user = await run_in_threadpool(_database(request).get_api_token_user, token.strip())
+    if not user:
+        raise ApiError(401, "Invalid token.")
+    return user
+
+
+def _project(proposal: Proposal, fields: tuple[str, ...]) -> dict[str, Any]:
+    return {field: proposal[field] for field in fields}
+
+
+def _parse_fields(value: Optional[str]) -> tuple[str, ...]:
+    if not value:
+        return PUBLIC_FIELDS
+    fields = tuple(field.strip() for field in value.split(",") if field.strip())
+    unknown = sorted(set(fields) - set(PUBLIC_FIELDS))
+    if unknown:
+        raise ApiError(400, f"Unknown fields: {', '.join(unknown)}.")
+    return fields
+
+
+def _parse_int(value: Optional[str], default: int, name: str) -> int:
+    if value in (None, ""):
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ApiError(400, f"{name} must be an integer.") from None
+    if number < 0:
+        raise ApiError(400, f"{name} must not be negative.")
+    return number
+
+
+async def list_proposals(request: Request) -> JSONResponse:
+    try:
+        user = await _authenticate(request)
+        params = request.query_params
+        fields = _parse_fields(params.get("fields"))
+        limit = min(_parse_int(params.get("limit"), LIST_PAGE_SIZE, "limit"), MAX_PAGE_SIZE)
+        offset = _parse_int(params.get("offset"), 0, "offset")
+    except ApiError as exc:
+        return _error(exc)
+    database = _database(request)
+    filters = {
+        # Partners only ever see their own proposals; admins may filter by owner.
+        "user_email": params.get("user_email") if user.is_admin else user.email,
+        "status": params.get("status") or "All",
+        "search": (params.get("q") or "").strip(),
+        "search_fields": ("title", "description", "full_name", "user_email"),
+    }
+    total = await run_in_threadpool(lambda: database.count_proposals(**filters))
+    proposals = await run_in_threadpool(
+        lambda: database.query_proposals(**filters, limit=limit, offset=offset)
+    )
+    return JSONResponse(
+        {
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "items": [_project(proposal, fields) for proposal in proposals],
+        }
+    )
+
+
+async def get_proposal(request: Request) -> JSONResponse:
+    try:
+        user = await _authenticate(request)
+        fields = _parse_fields(request.query_params.get("fields"))
+    except ApiError as exc:
+        return _error(exc)
+    proposal = await run_in_threadpool(
+        _database(request).get_proposal, request.path_params["proposal_id"]
+    )
+    if not proposal or not (user.is_admin or proposal["user_email"] == user.email):
+        return _error(ApiError(404, "Proposal not found."))
+    return JSONResponse(_project(proposal, fields))
+
+
+async def _store_upload(upload: UploadFile) -> str:
+    """Copies a spooled multipart upload into the upload dir chunk by chunk."""
+    original_name = Path(upload.filename or "").name
+    if not original_name:
+        raise ApiError(400, "A proposal document is required.")
+    extension = Path(original_name).suffix.lower()
+    if extension not in ALLOWED_EXTENSIONS:
+        allowed = ", ".join(sorted(ext.lstrip(".") for ext in ALLOWED_EXTENSIONS))
+        raise ApiError(400, f"Only the following file types are allowed: {allowed}.")
+    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+    safe_path = Path(original_name)
+    unique_name = f"{safe_path.stem}_{timestamp}_{uuid.uuid4().hex[:8]}{safe_path.suffix}"
+    file_path = rx.get_upload_dir() / unique_name
+    size = 0
+    try:
+        with file_path.open("wb") as f:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_UPLOAD_SIZE_BYTES:
+                    raise ApiError(413, "File exceeds the 50 MB size limit.")
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+    except ApiError:
+        remove_upload(unique_name)
+        raise
+    except OSError:
+        remove_upload(unique_name)
+        raise ApiError(500, "Could not store the uploaded file.") from None
+    return unique_name
+
+
+async def create_proposal(request: Request) -> JSONResponse:
+    try:
+        user = await _authenticate(request)
+        async with request.form(max_files=1, max_fields=len(REQUIRED_FIELDS) + 1) as form:
+            values = {field: str(form.get(field) or "").strip() for field in REQUIRED_FIELDS}
+            errors = proposal_field_errors(values, require_file=False)
+            if errors:
+                raise ApiError(400, " ".join(errors.values()))
+            upload = form.get("file")
+            if not isinstance(upload, UploadFile):
+                raise ApiError(400, "A proposal document is required.")
+            file_name = await _store_upload(upload)
+    except ApiError as exc:
+        return _error(exc)
+    timestamp = datetime.datetime.now().isoformat()
+    proposal = Proposal(
+        id=str(uuid.uuid4()),
+        user_email=user.email,
+        proposal_file=file_name,
+        created_at=timestamp,
+        updated_at=timestamp,
+        status="Submitted",
+        review_results="",
+        file_hash="",
+        version=1,
+        **values,
+    )
+    database = _database(request)
+    await run_in_threadpool(database.add_proposal, proposal, f"api:{user.email}")
+    await run_in_threadpool(enqueue_post_submission, proposal["id"], file_name, database)
+    return JSONResponse(proposal, status_code=201)
+
+
+async def update_statuses(request: Request) -> JSONResponse:
+    """Body: {"updates": [{"id": ..., "status": ..., "review_results": ..., "version": ...}, ...]}.
+
+    Items with a ``version`` are only applied if the proposal is still at that
+    version; the others are reported under ``conflicts``.
+    """
+    try:
+        user = await _authenticate(request)
+        if not user.is_admin:
+            raise ApiError(403, "Only administrators can change proposal status.")
+        try:
+            body = await request.json()
+        except ValueError:
+            raise ApiError(400, "Request body must be JSON.") from None
+        items = body.get("updates") if isinstance(body, dict) else None
+        if not isinstance(items, list) or not items:
+            raise ApiError(400, "updates must be a non-empty list.")
+        if len(items) > MAX_BATCH_SIZE:
+            raise ApiError(400, f"At most {MAX_BATCH_SIZE} updates per request.")
+        updates = []
+        for item in items:
+            if not isinstance(item, dict) or not isinstance(item.get("id"), str):
+                raise ApiError(400, "Each update needs an id.")
+            if item.get("status") not in PROPOSAL_STATUSES:
+                raise ApiError(400, f"Invalid status for {item['id']}.")
+            review = item.get("review_results")
+            version = item.get("version")
+            if version is not None and (not isinstance(version, int) or isinstance(version, bool)):
+                raise ApiError(400, f"version for {item['id']} must be an integer.")
+            updates.append(
+                (item["id"], item["status"], None if review is None else str(review), version)
+            )
+    except ApiError as exc:
+        return _error(exc)
+    updated, stale = await run_in_threadpool(
+        _database(request).update_proposal_statuses, updates, f"api:{user.email}"
+    )
+    missing = sorted({update[0] for update in updates} - set(updated) - set(stale))
+    return JSONResponse(
+        {"updated": len(updated), "missing": missing, "conflicts": sorted(set(stale))}
+    )
+
+
+def build_api(database: Database) -> Starlette:
+    """The API app, serving from ``database``."""
+    app = Starlette(
+        routes=[
+            Route("/api/v1/proposals", list_proposals, methods=["GET"]),
+            Route("/api/v1/proposals", create_proposal, methods=["POST"]),
+            Route("/api/v1/proposals/status", update_statuses, methods=["POST"]),
+            Route("/api/v1/proposals/{proposal_id}", get_proposal, methods=["GET"]),
+        ]
+    )
+    app.state.db = database
+    return app
+
+
+api = build_api(db)
+
+
+def _bench_seed(database: Database, proposals: int) -> tuple[str, list[str]]:
+    email = "bench-admin@example.com"
+    database.add_user(User(email, "x", is_admin=True))
+    now = datetime.datetime.now().isoformat()
+    ids = [str(uuid.uuid4()) for _ in range(proposals)]
+    database.import_proposals(
+        [
+            Proposal(
+                id=proposal_id,
+                user_email=email,
+                full_name="Benchmark",
+                email=email,
+                affiliation="Benchmark",
+                phone_number="000",
+                title=f"Benchmark proposal {number}",
+                description="Written by the API benchmark.",
+                proposal_file="",
+                created_at=now,
+                updated_at=now,
+                status="Submitted",
+                review_results="",
+                file_hash="",
+                version=1,
+            )
+            for number, proposal_id in enumerate(ids)
+        ]
+    )
+    return database.create_api_token(email, "bench"), ids
+
+
+async def _bench_endpoint(
+    client: Any, requests: int, concurrency: int, send
+) -> tuple[float, float, float]:
+    latencies: list[float] = []
+    numbers = iter(range(requests))
+
+    async def worker():
+        for number in numbers:
+            started = time.perf_counter()
+            response = await send(client, number)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                raise RuntimeError(f"Benchmark request failed: {response.status_code}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return (
+        requests / elapsed,
+        latencies[len(latencies) // 2] * 1000,
+        latencies[int(len(latencies) * 0.99)] * 1000,
+    )
+
+
+def benchmark(
+    requests: int = BENCH_REQUESTS,
+    concurrency: int = BENCH_CONCURRENCY,
+    proposals: int = BENCH_PROPOSALS,
+) -> dict[str, tuple[float, float, float]]:
+    """(requests/s, p50 ms, p99 ms) per endpoint, served in-process by its own API app.
+
+    Requests go through httpx's ASGI transport, so this measures the handlers
+    and the database, not the network or the Reflex websocket.
+    """
+    import httpx
+
+    with tempfile.TemporaryDirectory(prefix="api-bench-") as scratch:
+        database = Database(Path(scratch) / "bench.db")
+        database.open()
+        token, ids = _bench_seed(database, proposals)
+        headers = {"authorization": f"Bearer {token}"}
+        endpoints = {
+            "GET /proposals": lambda client, number: client.get(
+                "/api/v1/proposals", params={"offset": number % proposals}
+            ),
+            "GET /proposals/{id}": lambda client, number: client.get(
+                f"/api/v1/proposals/{ids[number % proposals]}"
+            ),
+            "POST /proposals/status": lambda client, number: client.post(
+                "/api/v1/proposals/status",
+                json={
+                    "updates": [
+                        {"id": ids[number % proposals], "status": PROPOSAL_STATUSES[number % 2]}
+                    ]
+                },
+            ),
+        }
+
+        async def run():
+            transport = httpx.ASGITransport(app=build_api(database))
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench", headers=headers
+            ) as client:
+                return {
+                    name: await _bench_endpoint(client, requests, concurrency, send)
+                    for name, send in endpoints.items()
+                }
+
+        return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage API tokens.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    create = commands.add_parser("create-token", help="issue a token for a user")
+    create.add_argument("email")
+    create.add_argument("--label", default="")
+    bench = commands.add_parser("bench", help="measure requests/s on a scratch database")
+    bench.add_argument("--requests", type=int, default=BENCH_REQUESTS, help="per endpoint")
+    bench.add_argument("--concurrency", type=int, default=BENCH_CONCURRENCY)
+    bench.add_argument("--proposals", type=int, default=BENCH_PROPOSALS)
+    args = parser.parse_args()
+    if args.command == "bench":
+        for name, (rate, p50, p99) in benchmark(
+            args.requests, args.concurrency, args.proposals
+        ).items():
+            print(f"{name:<24} {rate:>8.0f} req/s  p50 {p50:>6.1f} ms  p99 {p99:>6.1f} ms")
+    else:
+        if not db.get_user(args.email):
+            parser.error(f"No account found for {args.email}.")
+        print(db.create_api_token(args.email, args.label))
@@ -2,16 +2,32 @@ import reflex as rx
 from app.pages.signup import signup_page
 from app.pages.signin import signin_page
 from app.pages.dashboard import dashboard_page
-from app.state import AuthState
+from app.pages.proposals import create_proposal_page, proposals_page
+from app.pages.admin import admin_page, users_page
+from app.state import AuthState, SECTION_ROUTES
+from app.services.startup import app_startup
+from app.services.jobs import job_workers
+from app.services.storage import storage_reconciler
+from app.services.audit import audit_archiver
+from app.services.changes import change_log_maintainer
+from app.services.notifications import notification_dispatcher
+from app.services.var_profile import (
+    VAR_PROFILE_ENABLED,
+    VarProfileMiddleware,
+    var_profile_reporter,
+)
 
 
-@rx.page(on_load=AuthState.check_auth)
-def protected_dashboard() -> rx.Component:
-    return dashboard_page()
+def _partner_api(asgi_app):
+    """Serves the partner JSON API (/api/v1/...) in front of the Reflex backend.
 
+    Imported when the backend builds its ASGI app, not when the app module is
+    loaded, so compiling the frontend does not load the API.
+    """
+    from app.api import api
 
-def index() -> rx.Component:
-    return rx.cond(AuthState.is_authenticated, protected_dashboard(), signin_page())
+    api.mount("", asgi_app)
+    return api
 
 
 app = rx.App(
@@ -24,8 +40,31 @@ app = rx.App(
             rel="stylesheet",
         ),
     ],
+    api_transformer=_partner_api,
 )
-app.add_page(index)
+app.register_lifespan_task(app_startup)
+app.register_lifespan_task(job_workers)
+app.register_lifespan_task(storage_reconciler)
+app.register_lifespan_task(audit_archiver)
+app.register_lifespan_task(change_log_maintainer)
+app.register_lifespan_task(notification_dispatcher)
+if VAR_PROFILE_ENABLED:
+    app.add_middleware(VarProfileMiddleware())
+    app.register_lifespan_task(var_profile_reporter)
+app.add_page(signin_page, route="/", on_load=AuthState.redirect_if_authenticated)
 app.add_page(signup_page, route="/signup")
 app.add_page(signin_page, route="/signin")
-app.add_page(protected_dashboard, route="/dashboard")
\ No newline at end of file
+# Each section is a separate route, so its component tree (and the admin code)
+# only ships to clients that open it.
+for section, page in (
+    ("dashboard", dashboard_page),
+    ("create_proposal", create_proposal_page),
+    ("my_proposals", proposals_page),
+    ("admin_panel", admin_page),
+    ("user_panel", users_page),
+):
+    app.add_page(
+        page,
+        route=SECTION_ROUTES[section],
+        on_load=AuthState.open_section(section),
+    )
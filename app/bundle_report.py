@@ -0,0 +1,65 @@
+"""Reports the compiled JS size of every page, optionally against a baseline.
+
+python -m app.bundle_report [--save sizes.json] [--compare sizes.json]
+"""
+
+import argparse
+import gzip
+import json
+from pathlib import Path
+
+from reflex.compiler import compiler
+from reflex.compiler.compiler import into_component
+
+
+def page_sizes() -> dict[str, dict[str, int]]:
+    from app.app import app
+
+    sizes = {}
+    for route, page in sorted(app._unevaluated_pages.items()):
+        _, code = compiler.compile_page(route, into_component(page.component))
+        data = code.encode("utf-8")
+        sizes[route] = {"bytes": len(data), "gzip": len(gzip.compress(data))}
+    return sizes
+
+
+def _format_change(before: int, after: int) -> str:
+    if not before:
+        return ""
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def format_report(
+    sizes: dict[str, dict[str, int]],
+    baseline: dict[str, dict[str, int]] | None = None,
+) -> str:
+    baseline = baseline or {}
+    lines = [f"{'route':<16}{'bytes':>10}{'gzip':>10}{'change':>10}"]
+    total = {"bytes": 0, "gzip": 0}
+    before_total = {"bytes": 0, "gzip": 0}
+    for route, size in sizes.items():
+        before = baseline.get(route, {})
+        for key in total:
+            total[key] += size[key]
+            before_total[key] += before.get(key, 0)
+        lines.append(
+            f"{route:<16}{size['bytes']:>10}{size['gzip']:>10}"
+            f"{_format_change(before.get('bytes', 0), size['bytes']):>10}"
+        )
+    lines.append(
+        f"{'total':<16}{total['bytes']:>10}{total['gzip']:>10}"
+        f"{_format_change(before_total['bytes'], total['bytes']):>10}"
+    )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report compiled page sizes.")
+    parser.add_argument("--save", type=Path, help="write sizes to this JSON file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare with")
+    args = parser.parse_args()
+    sizes = page_sizes()
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print(format_report(sizes, baseline))
+    if args.save:
+        args.save.write_text(json.dumps(sizes, indent=2))
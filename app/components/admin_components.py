@@ -1,7 +1,8 @@
 import reflex as rx
 from app.states.admin_state import AdminState
-from app.state import Proposal, AuthState
-from app.components.dashboard_components import proposal_detail_modal
+from app.state import Proposal
+from app.components.dashboard_components import list_pager, proposal_detail_modal
+from app.components.theme import themed
 
 
 def _admin_proposal_card(proposal: Proposal) -> rx.Component:
@@ -9,16 +10,14 @@ def _admin_proposal_card(proposal: Proposal) -> rx.Component:
         rx.el.div(
             rx.el.h3(
                 proposal["title"],
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "text-md font-semibold text-white",
                     "text-md font-semibold text-slate-800",
                 ),
             ),
             rx.el.p(
                 f"By: {proposal['full_name']} ({proposal['user_email']})",
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "text-sm text-slate-300",
                     "text-sm text-slate-500",
                 ),
@@ -26,16 +25,14 @@ def _admin_proposal_card(proposal: Proposal) -> rx.Component:
             rx.el.div(
                 rx.el.p(
                     f"Created: {proposal['created_at'].replace('T', ' ')[:19]}",
-                    class_name=rx.cond(
-                        AdminState.dark_mode,
+                    class_name=themed(
                         "text-[11px] text-slate-400",
                         "text-[11px] text-slate-500",
                     ),
                 ),
                 rx.el.p(
                     f"Updated: {proposal.get('updated_at', proposal['created_at']).replace('T', ' ')[:19]}",
-                    class_name=rx.cond(
-                        AdminState.dark_mode,
+                    class_name=themed(
                         "text-[11px] text-slate-400",
                         "text-[11px] text-slate-500",
                     ),
@@ -52,10 +49,9 @@ def _admin_proposal_card(proposal: Proposal) -> rx.Component:
                 rx.el.option("Rejected", value="Rejected"),
                 default_value=proposal["status"],
                 on_change=lambda status: AdminState.update_proposal_status(
-                    proposal["id"], status
+                    proposal["id"], status, proposal["version"]
                 ),
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "rounded-xl border border-white/10 bg-white/5 text-sm text-slate-100 focus:border-cyan-400/80 focus:ring-cyan-400/40",
                     "rounded-xl border border-slate-200 bg-white text-sm text-slate-800 focus:border-cyan-500 focus:ring-cyan-500/40",
                 ),
@@ -63,8 +59,7 @@ def _admin_proposal_card(proposal: Proposal) -> rx.Component:
             rx.el.button(
                 "View Details",
                 on_click=lambda _: AdminState.view_proposal_details_admin(proposal["id"]),
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "px-3 py-1.5 text-sm font-semibold text-slate-900 rounded-full bg-gradient-to-r from-cyan-400 to-blue-500 shadow transition hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-4 focus:ring-cyan-300/40",
                     "px-3 py-1.5 text-sm font-semibold text-white rounded-full bg-gradient-to-r from-teal-500 to-cyan-600 shadow transition hover:from-teal-500 hover:to-emerald-500 focus:outline-none focus:ring-4 focus:ring-teal-300/40",
                 ),
@@ -76,10 +71,9 @@ def _admin_proposal_card(proposal: Proposal) -> rx.Component:
             ),
             class_name="flex items-center gap-4",
         ),
-        class_name=rx.cond(
-            AdminState.dark_mode,
-            "flex items-center justify-between gap-4 rounded-3xl border border-white/10 bg-white/5 p-4 shadow-lg backdrop-blur",
-            "flex items-center justify-between gap-4 rounded-3xl border border-white/60 bg-white p-4 shadow-lg",
+        class_name=themed(
+            "[content-visibility:auto] [contain-intrinsic-size:auto_120px] flex items-center justify-between gap-4 rounded-3xl border border-white/10 bg-white/5 p-4 shadow-lg backdrop-blur",
+            "[content-visibility:auto] [contain-intrinsic-size:auto_120px] flex items-center justify-between gap-4 rounded-3xl border border-white/60 bg-white p-4 shadow-lg",
         ),
     )
 
@@ -91,15 +85,13 @@ def _user_card(user: dict[str, rx.Var | str]) -> rx.Component:
 
     badge_text = rx.cond(is_admin, "ADMIN", "USER")
     badge_class = rx.cond(
-        AuthState.dark_mode,
-        rx.cond(
-            is_admin,
+        is_admin,
+        themed(
             "px-2 py-0.5 text-[10px] font-semibold tracking-wide uppercase rounded-full bg-cyan-400/15 text-cyan-200",
-            "px-2 py-0.5 text-[10px] font-medium tracking-wide uppercase rounded-full bg-white/10 text-slate-200",
-        ),
-        rx.cond(
-            is_admin,
             "px-2 py-0.5 text-[10px] font-semibold tracking-wide uppercase rounded-full bg-cyan-100 text-cyan-700",
+        ),
+        themed(
+            "px-2 py-0.5 text-[10px] font-medium tracking-wide uppercase rounded-full bg-white/10 text-slate-200",
             "px-2 py-0.5 text-[10px] font-medium tracking-wide uppercase rounded-full bg-slate-100 text-slate-600",
         ),
     )
@@ -107,8 +99,7 @@ def _user_card(user: dict[str, rx.Var | str]) -> rx.Component:
         rx.el.div(
             rx.icon(
                 tag="user",
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "h-10 w-10 rounded-full bg-white/10 p-2 text-cyan-200",
                     "h-10 w-10 rounded-full bg-cyan-100 p-2 text-cyan-600",
                 ),
@@ -116,24 +107,21 @@ def _user_card(user: dict[str, rx.Var | str]) -> rx.Component:
             rx.el.div(
                 rx.el.span(
                     email,
-                    class_name=rx.cond(
-                        AdminState.dark_mode,
+                    class_name=themed(
                         "text-sm font-semibold text-white",
                         "text-sm font-semibold text-slate-900",
                     ),
                 ),
                 rx.el.span(
                     "Joined: ",
-                    class_name=rx.cond(
-                        AdminState.dark_mode,
+                    class_name=themed(
                         "text-xs text-slate-300",
                         "text-xs text-slate-500",
                     ),
                 ),
                 rx.el.span(
                     created_label,
-                    class_name=rx.cond(
-                        AdminState.dark_mode,
+                    class_name=themed(
                         "text-xs text-slate-200",
                         "text-xs text-slate-600",
                     ),
@@ -143,10 +131,87 @@ def _user_card(user: dict[str, rx.Var | str]) -> rx.Component:
             rx.el.span(badge_text, class_name=badge_class),
             class_name="flex items-start justify-between gap-3",
         ),
-        class_name=rx.cond(
-            AdminState.dark_mode,
-            "rounded-3xl border border-white/10 bg-white/5 p-4 shadow-lg backdrop-blur",
-            "rounded-3xl border border-white/60 bg-white p-4 shadow",
+        class_name=themed(
+            "[content-visibility:auto] [contain-intrinsic-size:auto_100px] rounded-3xl border border-white/10 bg-white/5 p-4 shadow-lg backdrop-blur",
+            "[content-visibility:auto] [contain-intrinsic-size:auto_100px] rounded-3xl border border-white/60 bg-white p-4 shadow",
+        ),
+    )
+
+
+def _import_panel(upload_id: str, columns: str, on_import) -> rx.Component:
+    """Upload control for a bulk CSV/XLSX import, with its row-level error report."""
+    return rx.el.div(
+        rx.el.div(
+            rx.upload.root(
+                rx.el.div(
+                    rx.icon(tag="file-up", class_name="h-4 w-4"),
+                    rx.cond(
+                        rx.selected_files(upload_id).length() > 0,
+                        rx.selected_files(upload_id)[0],
+                        "Choose CSV or XLSX",
+                    ),
+                    class_name=themed(
+                        "flex items-center gap-2 rounded-full border border-dashed border-white/20 bg-white/5 px-4 py-2 text-sm text-slate-100 transition hover:bg-white/10",
+                        "flex items-center gap-2 rounded-full border border-dashed border-slate-300 bg-slate-50 px-4 py-2 text-sm text-slate-700 transition hover:bg-slate-100",
+                    ),
+                ),
+                id=upload_id,
+                accept={
+                    "text/csv": [".csv"],
+                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": [
+                        ".xlsx"
+                    ],
+                },
+                max_files=1,
+            ),
+            rx.el.button(
+                rx.cond(
+                    AdminState.importing,
+                    rx.spinner(class_name="mr-2 h-4 w-4"),
+                    rx.icon(tag="upload", class_name="mr-2 h-4 w-4"),
+                ),
+                "Import",
+                type="button",
+                on_click=on_import(rx.upload_files(upload_id=upload_id)),
+                disabled=AdminState.importing,
+                class_name=themed(
+                    "inline-flex items-center rounded-full border border-white/20 bg-white/10 px-4 py-2 text-sm font-semibold text-slate-100 shadow transition hover:bg-white/20 disabled:cursor-not-allowed disabled:opacity-60",
+                    "inline-flex items-center rounded-full border border-slate-200 bg-white px-4 py-2 text-sm font-semibold text-slate-700 shadow transition hover:bg-slate-100 disabled:cursor-not-allowed disabled:opacity-60",
+                ),
+            ),
+            rx.el.span(
+                f"Columns: {columns}",
+                class_name=themed("text-xs text-slate-400", "text-xs text-slate-500"),
+            ),
+            class_name="flex flex-wrap items-center gap-3",
+        ),
+        rx.cond(
+            AdminState.import_summary != "",
+            rx.el.div(
+                rx.el.p(
+                    AdminState.import_summary,
+                    class_name=themed(
+                        "text-sm font-medium text-slate-100",
+                        "text-sm font-medium text-slate-800",
+                    ),
+                ),
+                rx.el.ul(
+                    rx.foreach(
+                        AdminState.import_errors,
+                        lambda line: rx.el.li(line),
+                    ),
+                    class_name=themed(
+                        "mt-2 max-h-48 overflow-y-auto space-y-1 text-xs text-red-300",
+                        "mt-2 max-h-48 overflow-y-auto space-y-1 text-xs text-red-600",
+                    ),
+                ),
+                class_name="mt-3",
+            ),
+            None,
+        ),
+        class_name=themed(
+            "mb-6 rounded-3xl border border-white/10 bg-white/5 p-4 shadow-none backdrop-blur",
+            "mb-6 rounded-3xl border border-white/60 bg-white p-4 shadow",
         ),
     )
 
@@ -155,8 +220,7 @@ def admin_panel() -> rx.Component:
     return rx.el.div(
         rx.el.h1(
             "Admin Panel",
-            class_name=rx.cond(
-                AdminState.dark_mode,
+            class_name=themed(
                 "text-3xl font-semibold tracking-tight text-white mb-6",
                 "text-3xl font-semibold tracking-tight text-slate-900 mb-6",
             ),
@@ -166,8 +230,7 @@ def admin_panel() -> rx.Component:
                 rx.el.div(
                     rx.icon(
                         tag="search",
-                        class_name=rx.cond(
-                            AdminState.dark_mode,
+                        class_name=themed(
                             "h-5 w-5 text-slate-400",
                             "h-5 w-5 text-slate-400",
                         ),
@@ -176,12 +239,11 @@ def admin_panel() -> rx.Component:
                 ),
                 rx.el.form(
                     rx.el.input(
-                        placeholder="Search by title, description, or user...",
+                        placeholder="Search by title, description, user, or document text...",
                         value=AdminState.pending_search_query,
                         on_change=AdminState.on_search_input_change,
                         name="search",
-                        class_name=rx.cond(
-                            AdminState.dark_mode,
+                        class_name=themed(
                             "block w-full rounded-xl border border-white/10 bg-white/5 py-2.5 pl-10 pr-3 text-sm text-slate-100 transition focus:border-cyan-400/80 focus:outline-none focus:ring-2 focus:ring-cyan-400/30",
                             "block w-full rounded-xl border border-slate-200 bg-white py-2.5 pl-10 pr-3 text-sm text-slate-800 transition focus:border-cyan-500 focus:outline-none focus:ring-2 focus:ring-cyan-500/30",
                         ),
@@ -204,8 +266,7 @@ def admin_panel() -> rx.Component:
                 rx.el.option("Rejected", value="Rejected"),
                 on_change=AdminState.set_status_filter,
                 value=AdminState.status_filter,
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "rounded-xl border border-white/10 bg-white/5 py-2.5 pl-3 pr-8 text-sm text-slate-100 transition focus:border-cyan-400/80 focus:outline-none focus:ring-2 focus:ring-cyan-400/30",
                     "rounded-xl border border-slate-200 bg-white py-2.5 pl-3 pr-8 text-sm text-slate-800 transition focus:border-cyan-500 focus:outline-none focus:ring-2 focus:ring-cyan-500/30",
                 ),
@@ -214,18 +275,30 @@ def admin_panel() -> rx.Component:
                 rx.icon(tag="refresh_cw", class_name="mr-2 h-4 w-4"),
                 "Refresh",
                 on_click=AdminState.refresh_admin_data,
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "inline-flex items-center rounded-full bg-gradient-to-r from-cyan-400 to-blue-500 px-4 py-2 text-sm font-semibold text-slate-900 shadow-lg transition hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-4 focus:ring-cyan-300/40",
                     "inline-flex items-center rounded-full bg-gradient-to-r from-teal-500 to-cyan-600 px-4 py-2 text-sm font-semibold text-white shadow-lg transition hover:from-teal-500 hover:to-emerald-500 focus:outline-none focus:ring-4 focus:ring-teal-300/40",
                 ),
             ),
             class_name="flex flex-col sm:flex-row items-center gap-4 mb-6",
         ),
+        _import_panel(
+            "proposal_import",
+            "user_email, full_name, email, affiliation, phone_number, title, description, "
+            "proposal_file, optional status, review_results, created_at",
+            AdminState.handle_proposal_import,
+        ),
         rx.el.div(
             rx.foreach(AdminState.filtered_admin_proposals, _admin_proposal_card),
             class_name="space-y-4",
         ),
+        list_pager(
+            AdminState.current_admin_proposal_page,
+            AdminState.admin_proposal_page_count,
+            AdminState.filtered_admin_proposal_count,
+            AdminState.prev_admin_proposal_page,
+            AdminState.next_admin_proposal_page,
+        ),
         proposal_detail_modal(),
         admin_delete_confirmation_dialog(),
     )
@@ -236,16 +309,14 @@ def user_panel() -> rx.Component:
         rx.el.div(
             rx.el.h1(
                 "User Directory",
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "text-3xl font-semibold tracking-tight text-white",
                     "text-3xl font-semibold tracking-tight text-slate-900",
                 ),
             ),
             rx.el.p(
                 "Review who has access to the application and when they joined.",
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "text-sm text-slate-300 mt-2",
                     "text-sm text-slate-600 mt-2",
                 ),
@@ -257,32 +328,43 @@ def user_panel() -> rx.Component:
                 rx.icon(tag="refresh_cw", class_name="mr-2 h-4 w-4"),
                 "Refresh",
                 on_click=AdminState.refresh_admin_data,
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "inline-flex items-center rounded-full bg-gradient-to-r from-cyan-400 to-blue-500 px-4 py-2 text-sm font-semibold text-slate-900 shadow hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-4 focus:ring-cyan-300/40",
                     "inline-flex items-center rounded-full bg-gradient-to-r from-teal-500 to-cyan-600 px-4 py-2 text-sm font-semibold text-white shadow hover:from-teal-500 hover:to-emerald-500 focus:outline-none focus:ring-4 focus:ring-teal-300/40",
                 ),
             ),
             class_name="flex justify-end mb-6",
         ),
+        _import_panel(
+            "user_import",
+            "email, optional is_admin",
+            AdminState.handle_user_import,
+        ),
         rx.cond(
             AdminState.user_count > 0,
-            rx.el.div(
-                rx.foreach(AdminState.user_list, _user_card),
-                class_name="grid gap-4 sm:grid-cols-2 xl:grid-cols-3",
+            rx.fragment(
+                rx.el.div(
+                    rx.foreach(AdminState.user_list, _user_card),
+                    class_name="grid gap-4 sm:grid-cols-2 xl:grid-cols-3",
+                ),
+                list_pager(
+                    AdminState.current_user_page,
+                    AdminState.user_page_count,
+                    AdminState.user_count,
+                    AdminState.prev_user_page,
+                    AdminState.next_user_page,
+                ),
             ),
             rx.el.div(
                 rx.icon(tag="users", class_name="h-12 w-12 text-slate-400 mb-4"),
                 rx.el.p(
                     "No users found.",
-                    class_name=rx.cond(
-                        AdminState.dark_mode,
+                    class_name=themed(
                         "text-sm text-slate-300",
                         "text-sm text-slate-600",
                     ),
                 ),
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "flex flex-col items-center justify-center rounded-3xl border border-white/10 bg-white/5 p-10 text-center backdrop-blur",
                     "flex flex-col items-center justify-center rounded-3xl border border-white/60 bg-white p-10 text-center",
                 ),
@@ -297,16 +379,14 @@ def admin_delete_confirmation_dialog() -> rx.Component:
             rx.el.div(
                 rx.el.h2(
                     "Delete Proposal",
-                    class_name=rx.cond(
-                        AdminState.dark_mode,
+                    class_name=themed(
                         "text-lg font-semibold text-white",
                         "text-lg font-semibold text-slate-900",
                     ),
                 ),
                 rx.el.p(
                     "Deleting this proposal will remove all associated information and uploaded documents.",
-                    class_name=rx.cond(
-                        AdminState.dark_mode,
+                    class_name=themed(
                         "mt-3 text-sm text-slate-300",
                         "mt-3 text-sm text-slate-700",
                     ),
@@ -315,8 +395,7 @@ def admin_delete_confirmation_dialog() -> rx.Component:
                     AdminState.admin_pending_delete,
                     rx.el.p(
                         f'Proposal: {AdminState.admin_pending_delete["title"]}',
-                        class_name=rx.cond(
-                            AdminState.dark_mode,
+                        class_name=themed(
                             "mt-2 text-sm font-semibold text-white",
                             "mt-2 text-sm font-semibold text-slate-900",
                         ),
@@ -327,8 +406,7 @@ def admin_delete_confirmation_dialog() -> rx.Component:
                     rx.el.button(
                         "Cancel",
                         on_click=AdminState.cancel_delete_prompt_admin,
-                        class_name=rx.cond(
-                            AdminState.dark_mode,
+                        class_name=themed(
                             "inline-flex items-center rounded-md border border-white/20 px-4 py-2 text-sm font-medium text-slate-200 hover:bg-white/10 focus:outline-none focus:ring-2 focus:ring-white/20",
                             "inline-flex items-center rounded-md border border-slate-200 px-4 py-2 text-sm font-medium text-slate-700 hover:bg-slate-100 focus:outline-none focus:ring-2 focus:ring-slate-200",
                         ),
@@ -340,8 +418,7 @@ def admin_delete_confirmation_dialog() -> rx.Component:
                     ),
                     class_name="mt-6 flex items-center justify-end gap-3",
                 ),
-                class_name=rx.cond(
-                    AdminState.dark_mode,
+                class_name=themed(
                     "space-y-2 rounded-2xl bg-slate-900/90 p-6 shadow-2xl backdrop-blur text-white w-[90vw] max-w-md border border-white/10",
                     "space-y-2 rounded-2xl bg-white p-6 shadow-2xl w-[90vw] max-w-md border border-white/60",
                 ),
@@ -1,7 +1,9 @@
 import reflex as rx
 from app.state import AuthState, Proposal
-from app.states.proposal_state import ProposalState
+from app.states.proposal_state import FIELD_MAX_LENGTHS, ProposalState
 from app.states.admin_state import AdminState
+from app.states.selection_state import SelectionState
+from app.components.theme import themed, theme_root
 
 
 def _metric_card(
@@ -19,24 +21,21 @@ def _metric_card(
         rx.el.div(
             rx.el.span(
                 value,
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "text-3xl font-semibold text-white",
                     "text-3xl font-semibold text-slate-900",
                 ),
             ),
             rx.el.span(
                 subtext,
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "text-xs font-medium text-white/70",
                     "text-xs font-medium text-slate-500",
                 ),
             ),
             class_name="mt-4 flex flex-col",
         ),
-        class_name=rx.cond(
-            AuthState.dark_mode,
+        class_name=themed(
             "relative overflow-hidden rounded-2xl border border-white/10 bg-white/10 p-5 shadow-xl backdrop-blur-xl",
             "relative overflow-hidden rounded-2xl border border-white/60 bg-white p-5 shadow-xl backdrop-blur-sm",
         ),
@@ -56,16 +55,14 @@ def dashboard_topbar() -> rx.Component:
                     ("user_panel", "User directory"),
                     "Dashboard",
                 ),
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "text-3xl font-semibold tracking-tight text-white",
                     "text-3xl font-semibold tracking-tight text-slate-900",
                 ),
             ),
             rx.el.p(
                 "Manage submissions, track reviews, and collaborate effortlessly.",
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "text-sm mt-2 max-w-2xl text-slate-300",
                     "text-sm mt-2 max-w-2xl text-slate-600",
                 ),
@@ -84,8 +81,7 @@ def dashboard_topbar() -> rx.Component:
                 ),
                 rx.cond(AuthState.dark_mode, "Light Mode", "Dark Mode"),
                 on_click=AuthState.toggle_dark_mode,
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "inline-flex items-center gap-2 rounded-full border border-white/20 bg-white/10 px-4 py-2 text-xs font-semibold uppercase tracking-wide text-white shadow-lg backdrop-blur transition hover:bg-white/20",
                     "inline-flex items-center gap-2 rounded-full border border-slate-200 bg-white px-4 py-2 text-xs font-semibold uppercase tracking-wide text-slate-700 shadow-md transition hover:bg-slate-100",
                 ),
@@ -103,16 +99,14 @@ def force_password_change_modal() -> rx.Component:
             rx.el.div(
                 rx.el.h2(
                     "Update Password",
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "text-lg font-semibold text-white",
                         "text-lg font-semibold text-slate-900",
                     ),
                 ),
                 rx.el.p(
                     "A temporary password was issued for your account. Please choose a new password to continue.",
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "text-sm text-slate-300",
                         "text-sm text-slate-600",
                     ),
@@ -122,8 +116,7 @@ def force_password_change_modal() -> rx.Component:
                     type="password",
                     value=AuthState.new_password,
                     on_change=AuthState.set_new_password,
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "mt-4 w-full rounded-xl border border-white/10 bg-white/5 p-3 text-sm text-slate-100 placeholder:text-slate-400 focus:border-cyan-400/80 focus:outline-none focus:ring-2 focus:ring-cyan-400/30",
                         "mt-4 w-full rounded-xl border border-slate-200 bg-white p-3 text-sm text-slate-900 placeholder:text-slate-400 focus:border-cyan-500 focus:outline-none focus:ring-2 focus:ring-cyan-500/30",
                     ),
@@ -133,8 +126,7 @@ def force_password_change_modal() -> rx.Component:
                     type="password",
                     value=AuthState.new_password_confirm,
                     on_change=AuthState.set_new_password_confirm,
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "mt-3 w-full rounded-xl border border-white/10 bg-white/5 p-3 text-sm text-slate-100 placeholder:text-slate-400 focus:border-cyan-400/80 focus:outline-none focus:ring-2 focus:ring-cyan-400/30",
                         "mt-3 w-full rounded-xl border border-slate-200 bg-white p-3 text-sm text-slate-900 placeholder:text-slate-400 focus:border-cyan-500 focus:outline-none focus:ring-2 focus:ring-cyan-500/30",
                     ),
@@ -143,8 +135,7 @@ def force_password_change_modal() -> rx.Component:
                     AuthState.new_password_error,
                     rx.el.p(
                         AuthState.new_password_error,
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "mt-2 text-sm text-red-300",
                             "mt-2 text-sm text-red-600",
                         ),
@@ -155,8 +146,7 @@ def force_password_change_modal() -> rx.Component:
                     rx.el.button(
                         "Update Password",
                         on_click=AuthState.submit_new_password,
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "inline-flex items-center rounded-full bg-gradient-to-r from-cyan-400 to-blue-500 px-4 py-2 text-sm font-semibold text-slate-900 shadow hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-2 focus:ring-cyan-300/40",
                             "inline-flex items-center rounded-full bg-gradient-to-r from-teal-500 to-cyan-600 px-4 py-2 text-sm font-semibold text-white shadow hover:from-teal-500 hover:to-emerald-500 focus:outline-none focus:ring-2 focus:ring-teal-300/40",
                         ),
@@ -164,16 +154,14 @@ def force_password_change_modal() -> rx.Component:
                     rx.el.button(
                         "Sign out",
                         on_click=AuthState.logout,
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "inline-flex items-center rounded-full border border-white/20 bg-white/10 px-4 py-2 text-sm font-semibold text-slate-100 hover:bg-white/20 focus:outline-none focus:ring-2 focus:ring-white/20",
                             "inline-flex items-center rounded-full border border-slate-200 bg-white px-4 py-2 text-sm font-semibold text-slate-700 hover:bg-slate-100 focus:outline-none focus:ring-2 focus:ring-slate-200",
                         ),
                     ),
                     class_name="mt-6 flex items-center justify-end gap-3",
                 ),
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "w-[90vw] max-w-md rounded-3xl border border-white/10 bg-slate-950/95 p-6 shadow-2xl backdrop-blur-2xl",
                     "w-[90vw] max-w-md rounded-3xl border border-white/60 bg-white p-6 shadow-2xl",
                 ),
@@ -193,8 +181,7 @@ def dashboard_home() -> rx.Component:
             ),
             rx.el.p(
                 "Here is a quick snapshot of your proposal activity.",
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "text-sm text-slate-300",
                     "text-sm text-slate-500",
                 ),
@@ -233,8 +220,7 @@ def dashboard_home() -> rx.Component:
                 ),
                 rx.el.p(
                     "Keep an eye on new review results or comments from the team.",
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "text-sm text-slate-300",
                         "text-sm text-slate-500",
                     ),
@@ -247,8 +233,7 @@ def dashboard_home() -> rx.Component:
                     "No new notifications — you're all caught up!",
                     class_name="flex items-center gap-2 text-sm",
                 ),
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "rounded-2xl border border-white/10 bg-white/5 p-6 backdrop-blur-xl",
                     "rounded-2xl border border-white/60 bg-white p-6 backdrop-blur",
                 ),
@@ -262,38 +247,40 @@ def dashboard_home() -> rx.Component:
 def _form_field(
     label: str,
     placeholder: str,
+    name: str,
     value: rx.Var,
-    on_change: rx.event.EventHandler,
     error: rx.Var[str],
     type: str = "text",
+    pattern: str | None = None,
 ) -> rx.Component:
-    label_class = rx.cond(
-        AuthState.dark_mode,
+    label_class = themed(
         "block text-sm font-medium text-slate-200 mb-2",
         "block text-sm font-medium text-slate-700 mb-2",
     )
-    input_base = rx.cond(
-        AuthState.dark_mode,
+    input_base = themed(
         "block w-full rounded-xl border border-white/10 bg-white/5 p-3 text-sm text-slate-100 placeholder:text-slate-400 transition-all duration-150 ease-in-out focus:border-cyan-400/80 focus:outline-none focus:ring-2 focus:ring-cyan-400/30",
         "block w-full rounded-xl border border-slate-200 bg-white p-3 text-sm text-slate-900 placeholder:text-slate-400 transition-all duration-150 ease-in-out focus:border-cyan-500 focus:outline-none focus:ring-2 focus:ring-cyan-500/30",
     )
-    input_error = rx.cond(
-        AuthState.dark_mode,
+    input_error = themed(
         "block w-full rounded-xl border border-red-400 bg-red-900/40 p-3 text-sm text-red-100 placeholder:text-red-200 transition-all duration-150 ease-in-out focus:border-red-400 focus:outline-none focus:ring-2 focus:ring-red-400/30",
         "block w-full rounded-xl border border-red-300 bg-red-50 p-3 text-sm text-red-900 placeholder:text-red-400 transition-all duration-150 ease-in-out focus:border-red-500 focus:outline-none focus:ring-2 focus:ring-red-500/30",
     )
-    error_text = rx.cond(
-        AuthState.dark_mode,
+    error_text = themed(
         "mt-1 text-xs text-red-300",
         "mt-1 text-xs text-red-600",
     )
     return rx.el.div(
         rx.el.label(label, class_name=label_class),
+        # Uncontrolled: the browser checks required/pattern/maxLength and the
+        # value reaches the server only with the submitted form.
         rx.el.input(
             placeholder=placeholder,
+            name=name,
             default_value=value,
-            on_change=on_change,
             type=type,
+            required=True,
+            max_length=FIELD_MAX_LENGTHS[name],
+            pattern=pattern,
             class_name=rx.cond(error, input_error, input_base),
         ),
         rx.cond(error, rx.el.p(error, class_name=error_text), None),
@@ -304,8 +291,7 @@ def create_proposal_form() -> rx.Component:
     return rx.el.div(
         rx.el.h1(
             rx.cond(ProposalState.is_editing, "Edit Proposal", "Create New Proposal"),
-            class_name=rx.cond(
-                AuthState.dark_mode,
+            class_name=themed(
                 "text-3xl font-semibold tracking-tight text-white",
                 "text-3xl font-semibold tracking-tight text-slate-900",
             ),
@@ -315,55 +301,56 @@ def create_proposal_form() -> rx.Component:
                 _form_field(
                     "Full Name",
                     "John Doe",
+                    "full_name",
                     ProposalState.full_name,
-                    ProposalState.set_full_name,
                     ProposalState.full_name_error,
                 ),
                 _form_field(
                     "Email",
                     "john.doe@example.com",
+                    "email",
                     ProposalState.proposal_email,
-                    ProposalState.set_proposal_email,
                     ProposalState.proposal_email_error,
                     type="email",
+                    pattern="[^@]+@[^@]+\\.[^@]+",
                 ),
                 _form_field(
                     "Affiliation",
                     "University of Reflex",
+                    "affiliation",
                     ProposalState.affiliation,
-                    ProposalState.set_affiliation,
                     ProposalState.affiliation_error,
                 ),
                 _form_field(
                     "Phone Number",
                     "(123) 456-7890",
+                    "phone_number",
                     ProposalState.phone_number,
-                    ProposalState.set_phone_number,
                     ProposalState.phone_number_error,
                     type="tel",
                 ),
                 _form_field(
                     "Proposal Title",
                     "A new study on...",
+                    "title",
                     ProposalState.title,
-                    ProposalState.set_title,
                     ProposalState.title_error,
                 ),
                 rx.el.div(
                     rx.el.label(
                         "Description",
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "block text-sm font-medium text-slate-200 mb-2",
                             "block text-sm font-medium text-slate-700 mb-2",
                         ),
                     ),
                     rx.el.textarea(
                         placeholder="Detailed description of your proposal...",
+                        name="description",
                         default_value=ProposalState.description,
-                        on_change=ProposalState.set_description,
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        required=True,
+                        max_length=FIELD_MAX_LENGTHS["description"],
+                        class_name=themed(
                             "block w-full rounded-xl border border-white/10 bg-white/5 p-3 text-sm text-slate-100 placeholder:text-slate-400 transition-all duration-150 ease-in-out focus:border-cyan-400/80 focus:outline-none focus:ring-2 focus:ring-cyan-400/30 min-h-[140px]",
                             "block w-full rounded-xl border border-slate-200 bg-white p-3 text-sm text-slate-900 placeholder:text-slate-400 transition-all duration-150 ease-in-out focus:border-cyan-500 focus:outline-none focus:ring-2 focus:ring-cyan-500/30 min-h-[140px]",
                         ),
@@ -372,8 +359,7 @@ def create_proposal_form() -> rx.Component:
                         ProposalState.description_error,
                         rx.el.p(
                             ProposalState.description_error,
-                            class_name=rx.cond(
-                                AuthState.dark_mode,
+                            class_name=themed(
                                 "mt-1 text-xs text-red-300",
                                 "mt-1 text-xs text-red-600",
                             ),
@@ -384,8 +370,7 @@ def create_proposal_form() -> rx.Component:
                 rx.el.div(
                     rx.el.label(
                         "Proposal Document",
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "block text-sm font-medium text-slate-200 mb-2",
                             "block text-sm font-medium text-slate-700 mb-2",
                         ),
@@ -394,8 +379,7 @@ def create_proposal_form() -> rx.Component:
                         rx.el.div(
                             rx.icon(
                                 tag="cloud_upload",
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                class_name=themed(
                                     "h-8 w-8 text-cyan-300",
                                     "h-8 w-8 text-cyan-500",
                                 ),
@@ -403,14 +387,12 @@ def create_proposal_form() -> rx.Component:
                             rx.el.p("Drag & drop or click to upload"),
                             rx.el.span(
                                 "PDF, DOC, DOCX, HWP up to 50MB",
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                class_name=themed(
                                     "text-xs text-slate-300",
                                     "text-xs text-slate-500",
                                 ),
                             ),
-                            class_name=rx.cond(
-                                AuthState.dark_mode,
+                            class_name=themed(
                                 "flex flex-col items-center justify-center gap-1 rounded-2xl border-2 border-dashed border-white/20 bg-white/5 p-6 text-slate-100 transition hover:bg-white/10",
                                 "flex flex-col items-center justify-center gap-1 rounded-2xl border-2 border-dashed border-slate-200 bg-slate-50 p-6 text-slate-700 transition hover:bg-slate-100",
                             ),
@@ -435,16 +417,14 @@ def create_proposal_form() -> rx.Component:
                                 rx.el.div(
                                     rx.icon(
                                         "file-text",
-                                        class_name=rx.cond(
-                                            AuthState.dark_mode,
+                                        class_name=themed(
                                             "h-4 w-4 text-cyan-300",
                                             "h-4 w-4 text-cyan-600",
                                         ),
                                     ),
                                     rx.el.span(
                                         file_name,
-                                        class_name=rx.cond(
-                                            AuthState.dark_mode,
+                                        class_name=themed(
                                             "flex-1 text-sm text-slate-100 truncate",
                                             "flex-1 text-sm text-slate-700 truncate",
                                         ),
@@ -454,11 +434,11 @@ def create_proposal_form() -> rx.Component:
                                 rx.el.button(
                                     rx.icon(tag="trash-2", class_name="mr-1 h-4 w-4"),
                                     "Remove",
+                                    type="button",
                                     on_click=ProposalState.remove_selected_upload,
                                     class_name="inline-flex items-center rounded-md bg-red-500 px-3 py-1.5 text-xs font-medium text-white shadow-sm transition duration-150 hover:bg-red-600 focus:outline-none focus:ring-4 focus:ring-red-200/60",
                                 ),
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                class_name=themed(
                                     "flex items-center justify-between gap-4 rounded-xl border border-white/10 bg-white/5 p-3 text-sm backdrop-blur",
                                     "flex items-center justify-between gap-4 rounded-xl border border-slate-200 bg-slate-50 p-3 text-sm",
                                 ),
@@ -469,8 +449,7 @@ def create_proposal_form() -> rx.Component:
                         ProposalState.proposal_file_error,
                         rx.el.p(
                             ProposalState.proposal_file_error,
-                            class_name=rx.cond(
-                                AuthState.dark_mode,
+                            class_name=themed(
                                 "mt-1 text-xs text-red-300",
                                 "mt-1 text-xs text-red-600",
                             ),
@@ -484,26 +463,26 @@ def create_proposal_form() -> rx.Component:
                 rx.el.button(
                     rx.cond(
                         ProposalState.loading,
-                        rx.spinner(class_name="h-5 w-5"),
+                        rx.cond(
+                            ProposalState.upload_queue_position > 0,
+                            rx.el.span(
+                                rx.spinner(class_name="mr-2 h-4 w-4"),
+                                "Waiting to upload: #",
+                                ProposalState.upload_queue_position,
+                                " in line",
+                                class_name="inline-flex items-center",
+                            ),
+                            rx.spinner(class_name="h-5 w-5"),
+                        ),
                         rx.cond(
                             ProposalState.is_editing,
                             "Update Proposal",
                             "Submit Proposal",
                         ),
                     ),
-                    type="button",
-                    on_click=rx.cond(
-                        ProposalState.is_editing,
-                        ProposalState.handle_update_proposal(
-                            rx.upload_files(upload_id="proposal_upload")
-                        ),
-                        ProposalState.handle_create_proposal(
-                            rx.upload_files(upload_id="proposal_upload")
-                        ),
-                    ),
+                    type="submit",
                     disabled=ProposalState.loading,
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "flex-1 inline-flex items-center justify-center rounded-full bg-gradient-to-r from-cyan-400 to-blue-500 px-5 py-3 text-sm font-semibold text-slate-900 shadow-xl transition duration-150 hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-4 focus:ring-cyan-300/40 disabled:cursor-not-allowed disabled:opacity-60",
                         "flex-1 inline-flex items-center justify-center rounded-full bg-gradient-to-r from-teal-500 to-cyan-600 px-5 py-3 text-sm font-semibold text-white shadow-xl transition duration-150 hover:from-teal-500 hover:to-emerald-500 focus:outline-none focus:ring-4 focus:ring-teal-300/40 disabled:cursor-not-allowed disabled:opacity-60",
                     ),
@@ -514,8 +493,7 @@ def create_proposal_form() -> rx.Component:
                         "Cancel",
                         type="button",
                         on_click=ProposalState.cancel_edit,
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "flex-1 inline-flex items-center justify-center rounded-full border border-white/20 bg-white/10 px-5 py-3 text-sm font-semibold text-slate-100 shadow-md transition duration-150 hover:bg-white/20 focus:outline-none focus:ring-4 focus:ring-white/10",
                             "flex-1 inline-flex items-center justify-center rounded-full border border-slate-200 bg-white px-5 py-3 text-sm font-semibold text-slate-700 shadow-md transition duration-150 hover:bg-slate-100 focus:outline-none focus:ring-4 focus:ring-slate-200",
                         ),
@@ -524,8 +502,16 @@ def create_proposal_form() -> rx.Component:
                 ),
                 class_name="mt-8 flex gap-4 w-full",
             ),
-            class_name=rx.cond(
-                AuthState.dark_mode,
+            # One event carries every field, then the upload handler runs.
+            on_submit=[
+                ProposalState.submit_form_fields,
+                ProposalState.handle_submit_proposal(
+                    rx.upload_files(upload_id="proposal_upload")
+                ),
+            ],
+            reset_on_submit=False,
+            key=ProposalState.edit_proposal_id,
+            class_name=themed(
                 "mt-8 max-w-2xl mx-auto rounded-3xl border border-white/10 bg-white/5 p-8 shadow-2xl backdrop-blur-2xl",
                 "mt-8 max-w-2xl mx-auto rounded-3xl border border-white/60 bg-white p-8 shadow-xl backdrop-blur",
             ),
@@ -565,8 +551,7 @@ def _proposal_card(proposal: Proposal) -> rx.Component:
             rx.el.div(
                 rx.el.h3(
                     proposal["title"],
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "text-lg font-semibold text-white",
                         "text-lg font-semibold text-slate-900",
                     ),
@@ -576,24 +561,21 @@ def _proposal_card(proposal: Proposal) -> rx.Component:
             ),
             rx.el.p(
                 f"Affiliation: {proposal['affiliation']}",
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "text-sm text-slate-300 mt-1",
                     "text-sm text-slate-600 mt-1",
                 ),
             ),
             rx.el.p(
                 f"Submitted: {proposal['created_at'].to_string().replace('T', ' ').split('.')[0]}",
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "text-xs text-slate-400 mt-1",
                     "text-xs text-slate-500 mt-1",
                 ),
             ),
             rx.el.p(
                 f"Updated: {proposal['updated_at'].replace('T', ' ')[:19]}",
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "text-xs text-slate-500",
                     "text-xs text-slate-500",
                 ),
@@ -604,8 +586,7 @@ def _proposal_card(proposal: Proposal) -> rx.Component:
             rx.el.button(
                 "View Details",
                 on_click=lambda _: ProposalState.view_proposal_details(proposal),
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "px-4 py-2 text-sm font-semibold text-slate-900 rounded-full bg-gradient-to-r from-cyan-400 to-blue-500 shadow-lg transition hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-4 focus:ring-cyan-300/40",
                     "px-4 py-2 text-sm font-semibold text-white rounded-full bg-gradient-to-r from-teal-500 to-cyan-600 shadow-lg transition hover:from-teal-500 hover:to-emerald-500 focus:outline-none focus:ring-4 focus:ring-teal-300/40",
                 ),
@@ -623,10 +604,10 @@ def _proposal_card(proposal: Proposal) -> rx.Component:
             ),
             class_name="flex items-center gap-2 mt-4 sm:mt-0 sm:ml-4",
         ),
-        class_name=rx.cond(
-            AuthState.dark_mode,
-            "flex flex-col items-start justify-between gap-4 rounded-3xl border border-white/10 bg-white/5 p-6 shadow-xl backdrop-blur sm:flex-row sm:items-center",
-            "flex flex-col items-start justify-between gap-4 rounded-3xl border border-white/60 bg-white p-6 shadow-xl sm:flex-row sm:items-center",
+        class_name=themed(
+            # content-visibility lets the browser skip layout and paint of off-screen rows.
+            "[content-visibility:auto] [contain-intrinsic-size:auto_160px] flex flex-col items-start justify-between gap-4 rounded-3xl border border-white/10 bg-white/5 p-6 shadow-xl backdrop-blur sm:flex-row sm:items-center",
+            "[content-visibility:auto] [contain-intrinsic-size:auto_160px] flex flex-col items-start justify-between gap-4 rounded-3xl border border-white/60 bg-white p-6 shadow-xl sm:flex-row sm:items-center",
         ),
     )
 
@@ -636,8 +617,7 @@ def my_proposals_page() -> rx.Component:
         rx.el.div(
             rx.el.h1(
                 "My Proposals",
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "text-3xl font-semibold tracking-tight text-white mb-6",
                     "text-3xl font-semibold tracking-tight text-slate-900 mb-6",
                 ),
@@ -646,8 +626,7 @@ def my_proposals_page() -> rx.Component:
                 rx.el.div(
                     rx.icon(
                         tag="search",
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "h-5 w-5 text-slate-400",
                             "h-5 w-5 text-slate-400",
                         ),
@@ -655,10 +634,9 @@ def my_proposals_page() -> rx.Component:
                     class_name="pointer-events-none absolute inset-y-0 left-0 flex items-center pl-3",
                 ),
                 rx.el.input(
-                    placeholder="Search by title or description...",
+                    placeholder="Search by title, description, or document text...",
                     on_change=ProposalState.set_search_query.debounce(300),
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "block w-full rounded-xl border border-white/10 bg-white/5 py-2.5 pl-10 pr-3 text-sm text-slate-100 transition focus:border-cyan-400/80 focus:outline-none focus:ring-2 focus:ring-cyan-400/30",
                         "block w-full rounded-xl border border-slate-200 bg-white py-2.5 pl-10 pr-3 text-sm text-slate-800 transition focus:border-cyan-500 focus:outline-none focus:ring-2 focus:ring-cyan-500/30",
                     ),
@@ -673,8 +651,7 @@ def my_proposals_page() -> rx.Component:
                 rx.el.option("Rejected", value="Rejected"),
                 on_change=ProposalState.set_status_filter,
                 default_value="All",
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "rounded-xl border border-white/10 bg-white/5 py-2.5 pl-3 pr-8 text-sm text-slate-100 transition focus:border-cyan-400/80 focus:outline-none focus:ring-2 focus:ring-cyan-400/30",
                     "rounded-xl border border-slate-200 bg-white py-2.5 pl-3 pr-8 text-sm text-slate-800 transition focus:border-cyan-500 focus:outline-none focus:ring-2 focus:ring-cyan-500/30",
                 ),
@@ -683,8 +660,7 @@ def my_proposals_page() -> rx.Component:
                 rx.icon(tag="refresh_cw", class_name="mr-2 h-4 w-4"),
                 "Refresh",
                 on_click=ProposalState.refresh_proposals,
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "inline-flex items-center rounded-full bg-gradient-to-r from-cyan-400 to-blue-500 px-4 py-2 text-sm font-semibold text-slate-900 shadow-lg transition hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-4 focus:ring-cyan-300/40",
                     "inline-flex items-center rounded-full bg-gradient-to-r from-teal-500 to-cyan-600 px-4 py-2 text-sm font-semibold text-white shadow-lg transition hover:from-teal-500 hover:to-emerald-500 focus:outline-none focus:ring-4 focus:ring-teal-300/40",
                 ),
@@ -695,11 +671,160 @@ def my_proposals_page() -> rx.Component:
             rx.foreach(ProposalState.filtered_proposals, _proposal_card),
             class_name="space-y-4",
         ),
+        list_pager(
+            ProposalState.current_proposal_page,
+            ProposalState.proposal_page_count,
+            ProposalState.filtered_proposal_count,
+            ProposalState.prev_proposal_page,
+            ProposalState.next_proposal_page,
+        ),
         proposal_detail_modal(),
         delete_confirmation_dialog(),
     )
 
 
+def list_pager(
+    current_page: rx.Var[int],
+    page_count: rx.Var[int],
+    total: rx.Var[int],
+    on_prev: rx.event.EventHandler,
+    on_next: rx.event.EventHandler,
+) -> rx.Component:
+    """Previous/next controls for a server-side paginated list."""
+    button_class = themed(
+        "inline-flex items-center rounded-full border border-white/20 px-3 py-1.5 text-sm text-slate-100 transition hover:bg-white/10 disabled:cursor-not-allowed disabled:opacity-40",
+        "inline-flex items-center rounded-full border border-slate-200 px-3 py-1.5 text-sm text-slate-700 transition hover:bg-slate-100 disabled:cursor-not-allowed disabled:opacity-40",
+    )
+    return rx.cond(
+        page_count > 1,
+        rx.el.div(
+            rx.el.button(
+                rx.icon(tag="chevron_left", class_name="h-4 w-4"),
+                on_click=on_prev,
+                disabled=current_page <= 1,
+                class_name=button_class,
+            ),
+            rx.el.span(
+                f"Page {current_page} of {page_count} · {total} total",
+                class_name=themed(
+                    "text-sm text-slate-300",
+                    "text-sm text-slate-600",
+                ),
+            ),
+            rx.el.button(
+                rx.icon(tag="chevron_right", class_name="h-4 w-4"),
+                on_click=on_next,
+                disabled=current_page >= page_count,
+                class_name=button_class,
+            ),
+            class_name="flex items-center justify-center gap-4 mt-6",
+        ),
+    )
+
+
+def _job_status_row(job: dict[str, str]) -> rx.Component:
+    return rx.el.li(
+        rx.el.span(
+            job["label"],
+            class_name=themed(
+                "flex-1 text-sm text-slate-200",
+                "flex-1 text-sm text-slate-700",
+            ),
+        ),
+        rx.el.span(
+            job["status"],
+            title=job["last_error"],
+            class_name=rx.match(
+                job["status"],
+                (
+                    "done",
+                    "bg-green-100 text-green-800 text-xs font-medium px-2.5 py-0.5 rounded-full",
+                ),
+                (
+                    "failed",
+                    "bg-red-100 text-red-800 text-xs font-medium px-2.5 py-0.5 rounded-full",
+                ),
+                (
+                    "running",
+                    "bg-yellow-100 text-yellow-800 text-xs font-medium px-2.5 py-0.5 rounded-full",
+                ),
+                "bg-gray-100 text-gray-800 text-xs font-medium px-2.5 py-0.5 rounded-full",
+            ),
+        ),
+        class_name="flex items-center justify-between gap-4",
+    )
+
+
+def _history_row(event: dict[str, str]) -> rx.Component:
+    return rx.el.li(
+        rx.el.div(
+            rx.el.span(event["action"], class_name="font-medium"),
+            rx.el.span(
+                event["when"],
+                class_name=themed(
+                    "text-xs text-slate-400",
+                    "text-xs text-slate-500",
+                ),
+            ),
+            class_name="flex items-center justify-between gap-4",
+        ),
+        rx.el.p(
+            event["actor"],
+            class_name=themed(
+                "text-xs text-slate-400",
+                "text-xs text-slate-500",
+            ),
+        ),
+        rx.cond(
+            event["summary"],
+            rx.el.p(event["summary"], class_name="text-xs mt-1 break-words"),
+            None,
+        ),
+        class_name=themed(
+            "text-sm text-slate-200 border-l-2 border-white/20 pl-3",
+            "text-sm text-slate-700 border-l-2 border-slate-200 pl-3",
+        ),
+    )
+
+
+def _document_preview() -> rx.Component:
+    preview = SelectionState.selected_proposal_preview
+    return rx.el.div(
+        rx.el.h3("Document Preview", class_name="font-semibold mt-4 mb-2"),
+        rx.cond(
+            preview["image"],
+            rx.el.img(
+                src=preview["image"],
+                alt="First page preview",
+                class_name="max-h-80 rounded-xl border border-slate-200 bg-white object-contain shadow-sm",
+            ),
+            None,
+        ),
+        rx.cond(
+            preview["excerpt"],
+            rx.el.p(
+                preview["excerpt"],
+                class_name=themed(
+                    "mt-2 max-h-48 overflow-y-auto whitespace-pre-wrap text-xs text-slate-300 bg-white/5 p-3 rounded-xl border border-white/10",
+                    "mt-2 max-h-48 overflow-y-auto whitespace-pre-wrap text-xs text-slate-600 bg-slate-50 p-3 rounded-xl border border-slate-200",
+                ),
+            ),
+            None,
+        ),
+        rx.cond(
+            preview["image"] | preview["excerpt"],
+            None,
+            rx.el.p(
+                "A preview is being prepared. Use Refresh to check again.",
+                class_name=themed(
+                    "text-sm text-slate-400",
+                    "text-sm text-slate-500",
+                ),
+            ),
+        ),
+    )
+
+
 def proposal_detail_modal() -> rx.Component:
     return rx.radix.primitives.dialog.root(
         rx.radix.primitives.dialog.trigger(rx.el.div()),
@@ -707,39 +832,36 @@ def proposal_detail_modal() -> rx.Component:
             rx.radix.primitives.dialog.overlay(class_name="fixed inset-0 bg-black/50"),
             rx.radix.primitives.dialog.content(
                 rx.cond(
-                    ProposalState.selected_proposal,
+                    SelectionState.selected_proposal,
                     rx.el.div(
                         rx.el.div(
                             rx.el.h2(
-                                ProposalState.selected_proposal["title"],
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                SelectionState.selected_proposal["title"],
+                                class_name=themed(
                                     "text-xl font-bold text-white",
                                     "text-xl font-bold text-slate-900",
                                 ),
                             ),
-                            _status_badge(ProposalState.selected_proposal["status"]),
+                            _status_badge(SelectionState.selected_proposal["status"]),
                             class_name="flex items-start justify-between",
                         ),
                         rx.el.div(
                             rx.el.div(
                                     rx.el.h3("Applicant", class_name="font-semibold"),
-                                rx.el.p(ProposalState.selected_proposal["full_name"]),
-                                rx.el.p(ProposalState.selected_proposal["email"]),
+                                rx.el.p(SelectionState.selected_proposal["full_name"]),
+                                rx.el.p(SelectionState.selected_proposal["email"]),
                                 rx.el.p(
-                                    ProposalState.selected_proposal["phone_number"]
+                                    SelectionState.selected_proposal["phone_number"]
                                 ),
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                class_name=themed(
                                     "text-sm text-slate-200",
                                     "text-sm text-slate-700",
                                 ),
                             ),
                             rx.el.div(
                                 rx.el.h3("Affiliation", class_name="font-semibold"),
-                                rx.el.p(ProposalState.selected_proposal["affiliation"]),
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                rx.el.p(SelectionState.selected_proposal["affiliation"]),
+                                class_name=themed(
                                     "text-sm text-slate-200",
                                     "text-sm text-slate-700",
                                 ),
@@ -747,13 +869,12 @@ def proposal_detail_modal() -> rx.Component:
                             rx.el.div(
                                 rx.el.h3("Submitted On", class_name="font-semibold"),
                                 rx.el.p(
-                                    ProposalState.selected_proposal["created_at"]
+                                    SelectionState.selected_proposal["created_at"]
                                     .to_string()
                                     .replace("T", " ")
                                     .split(".")[0][1:]
                                 ),
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                class_name=themed(
                                     "text-sm text-slate-200",
                                     "text-sm text-slate-700",
                                 ),
@@ -761,13 +882,12 @@ def proposal_detail_modal() -> rx.Component:
                             rx.el.div(
                                 rx.el.h3("Last Updated", class_name="font-semibold"),
                                 rx.el.p(
-                                    ProposalState.selected_proposal["updated_at"]
+                                    SelectionState.selected_proposal["updated_at"]
                                     .to_string()
                                     .replace("T", " ")
                                     .split(".")[0][1:]
                                 ),
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                class_name=themed(
                                     "text-sm text-slate-200",
                                     "text-sm text-slate-700",
                                 ),
@@ -779,37 +899,39 @@ def proposal_detail_modal() -> rx.Component:
                                 "Description", class_name="font-semibold mt-4 mb-2"
                             ),
                             rx.el.p(
-                                ProposalState.selected_proposal["description"],
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                SelectionState.selected_proposal["description"],
+                                class_name=themed(
                                     "text-sm text-slate-200 bg-white/5 p-3 rounded-xl border border-white/10",
                                     "text-sm text-slate-700 bg-slate-50 p-3 rounded-xl border border-slate-200",
                                 ),
                             ),
                         ),
+                        rx.cond(
+                            SelectionState.has_selected_proposal_files,
+                            _document_preview(),
+                            None,
+                        ),
                         rx.el.div(
                             rx.el.h3(
                                 "Uploaded Files", class_name="font-semibold mt-4 mb-2"
                             ),
                             rx.cond(
-                                ProposalState.has_selected_proposal_files,
+                                SelectionState.has_selected_proposal_files,
                                 rx.el.ul(
                                     rx.foreach(
-                                        ProposalState.selected_proposal_files,
+                                        SelectionState.selected_proposal_files,
                                         lambda file_name: rx.el.li(
                                             rx.el.div(
                                                 rx.icon(
                                                     tag="file-text",
-                                                    class_name=rx.cond(
-                                                        AuthState.dark_mode,
+                                                    class_name=themed(
                                                         "h-4 w-4 text-cyan-300",
                                                         "h-4 w-4 text-cyan-600",
                                                     ),
                                                 ),
                                                 rx.el.span(
                                                     file_name,
-                                                    class_name=rx.cond(
-                                                        AuthState.dark_mode,
+                                                    class_name=themed(
                                                         "flex-1 text-sm text-slate-200 truncate",
                                                         "flex-1 text-sm text-slate-700 truncate",
                                                     ),
@@ -822,17 +944,15 @@ def proposal_detail_modal() -> rx.Component:
                                                     class_name="mr-2 h-4 w-4",
                                                 ),
                                                 "Download",
-                                                on_click=lambda _: ProposalState.download_proposal_file(
+                                                on_click=lambda _: SelectionState.download_proposal_file(
                                                     filename=file_name
                                                 ),
-                                                class_name=rx.cond(
-                                                    AuthState.dark_mode,
+                                                class_name=themed(
                                                     "inline-flex items-center rounded-md bg-gradient-to-r from-cyan-400 to-blue-500 px-3 py-1.5 text-xs font-medium text-slate-900 shadow-sm transition duration-150 hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-4 focus:ring-cyan-300/40",
                                                     "inline-flex items-center rounded-md bg-gradient-to-r from-teal-500 to-cyan-600 px-3 py-1.5 text-xs font-medium text-white shadow-sm transition duration-150 hover:from-teal-600 hover:to-cyan-700 focus:outline-none focus:ring-4 focus:ring-teal-300",
                                                 ),
                                             ),
-                                            class_name=rx.cond(
-                                                AuthState.dark_mode,
+                                            class_name=themed(
                                                 "flex items-center justify-between gap-4 rounded-lg border border-white/10 bg-white/5 p-3 shadow-sm backdrop-blur",
                                                 "flex items-center justify-between gap-4 rounded-lg border border-slate-200 bg-white p-3 shadow-sm",
                                             ),
@@ -842,8 +962,7 @@ def proposal_detail_modal() -> rx.Component:
                                 ),
                                 rx.el.p(
                                     "No files uploaded.",
-                                    class_name=rx.cond(
-                                        AuthState.dark_mode,
+                                    class_name=themed(
                                         "text-sm text-slate-400",
                                         "text-sm text-slate-500",
                                     ),
@@ -851,16 +970,47 @@ def proposal_detail_modal() -> rx.Component:
                             ),
                         ),
                         rx.cond(
-                            ProposalState.selected_proposal["review_results"],
+                            SelectionState.selected_proposal_jobs,
+                            rx.el.div(
+                                rx.el.h3(
+                                    "Processing", class_name="font-semibold mt-4 mb-2"
+                                ),
+                                rx.el.ul(
+                                    rx.foreach(
+                                        SelectionState.selected_proposal_jobs,
+                                        _job_status_row,
+                                    ),
+                                    class_name="space-y-1",
+                                ),
+                            ),
+                            None,
+                        ),
+                        rx.cond(
+                            SelectionState.selected_proposal_history,
+                            rx.el.div(
+                                rx.el.h3(
+                                    "History", class_name="font-semibold mt-4 mb-2"
+                                ),
+                                rx.el.ul(
+                                    rx.foreach(
+                                        SelectionState.selected_proposal_history,
+                                        _history_row,
+                                    ),
+                                    class_name="space-y-2",
+                                ),
+                            ),
+                            None,
+                        ),
+                        rx.cond(
+                            SelectionState.selected_proposal["review_results"],
                             rx.el.div(
                                 rx.el.h3(
                                     "Review Results",
                                     class_name="font-semibold mt-4 mb-2",
                                 ),
                                 rx.el.p(
-                                    ProposalState.selected_proposal["review_results"],
-                                    class_name=rx.cond(
-                                        AuthState.dark_mode,
+                                    SelectionState.selected_proposal["review_results"],
+                                    class_name=themed(
                                         "text-sm text-slate-200 bg-cyan-500/10 p-3 rounded-xl border border-cyan-400/40",
                                         "text-sm text-slate-700 bg-blue-50 p-3 rounded-xl border border-blue-200",
                                     ),
@@ -872,22 +1022,20 @@ def proposal_detail_modal() -> rx.Component:
                             rx.el.button(
                                 rx.icon(tag="download", class_name="mr-2 h-4 w-4"),
                                 "Download Document",
-                                on_click=ProposalState.download_proposal_file,
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                on_click=SelectionState.download_proposal_file,
+                                class_name=themed(
                                     "inline-flex items-center rounded-full bg-gradient-to-r from-cyan-400 to-blue-500 px-4 py-2 text-sm font-semibold text-slate-900 shadow hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-4 focus:ring-cyan-300/40",
                                     "inline-flex items-center rounded-full bg-gradient-to-r from-teal-500 to-cyan-600 px-4 py-2 text-sm font-semibold text-white shadow hover:from-teal-500 hover:to-emerald-500 focus:outline-none focus:ring-4 focus:ring-teal-300/40",
                                 ),
                             ),
                             rx.cond(
-                ProposalState.selected_proposal["user_email"]
+                SelectionState.selected_proposal["user_email"]
                 == AuthState.authenticated_user,
                 rx.el.button(
                     rx.icon(tag="copy", class_name="mr-2 h-4 w-4"),
                     "Edit Proposal",
                     on_click=ProposalState.load_proposal_for_edit,
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "inline-flex items-center rounded-full border border-white/20 bg-white/10 px-4 py-2 text-sm font-semibold text-slate-100 shadow hover:bg-white/20 focus:outline-none focus:ring-4 focus:ring-white/20",
                         "inline-flex items-center rounded-full bg-blue-600 px-4 py-2 text-sm font-semibold text-white shadow hover:bg-blue-700 focus:outline-none focus:ring-4 focus:ring-blue-300/60",
                     ),
@@ -911,15 +1059,15 @@ def proposal_detail_modal() -> rx.Component:
                                         ),
                                         rx.el.option("Approved", value="Approved"),
                                         rx.el.option("Rejected", value="Rejected"),
-                                        default_value=ProposalState.selected_proposal[
+                                        default_value=SelectionState.selected_proposal[
                                             "status"
                                         ],
                                         on_change=lambda status: AdminState.update_proposal_status(
-                                            ProposalState.selected_proposal["id"],
+                                            SelectionState.selected_proposal["id"],
                                             status,
+                                            SelectionState.selected_proposal["version"],
                                         ),
-                                        class_name=rx.cond(
-                                            AuthState.dark_mode,
+                                        class_name=themed(
                                             "rounded-xl border border-white/10 bg-white/5 text-sm text-slate-100 focus:border-cyan-400/80 focus:ring-cyan-400/40 w-full sm:w-auto mb-2",
                                             "rounded-xl border border-slate-200 bg-white text-sm text-slate-800 focus:border-teal-500 focus:ring-teal-500/40 w-full sm:w-auto mb-2",
                                         ),
@@ -928,8 +1076,7 @@ def proposal_detail_modal() -> rx.Component:
                                         placeholder="Add review results...",
                                         default_value=AdminState.review_results_input,
                                         on_change=AdminState.set_review_results_input,
-                                        class_name=rx.cond(
-                                            AuthState.dark_mode,
+                                        class_name=themed(
                                             "block w-full rounded-xl border border-white/10 bg-white/5 p-2 text-sm text-slate-100 transition focus:border-cyan-400/80 focus:outline-none focus:ring-2 focus:ring-cyan-400/40 min-h-[80px]",
                                             "block w-full rounded-xl border border-slate-200 bg-white p-2 text-sm text-slate-800 transition focus:border-teal-500 focus:outline-none focus:ring-2 focus:ring-teal-500/30 min-h-[80px]",
                                         ),
@@ -939,8 +1086,7 @@ def proposal_detail_modal() -> rx.Component:
                                             rx.icon(tag="save", class_name="mr-2 h-4 w-4"),
                                             "Save Review",
                                             on_click=AdminState.save_review_results,
-                                            class_name=rx.cond(
-                                                AuthState.dark_mode,
+                                            class_name=themed(
                                                 "inline-flex items-center rounded-full bg-gradient-to-r from-cyan-400 to-blue-500 px-4 py-2 text-sm font-semibold text-slate-900 shadow transition hover:from-cyan-300 hover:to-indigo-400 focus:outline-none focus:ring-4 focus:ring-cyan-300/40",
                                                 "inline-flex items-center rounded-full bg-gradient-to-r from-teal-500 to-cyan-600 px-4 py-2 text-sm font-semibold text-white shadow transition hover:from-teal-500 hover:to-emerald-500 focus:outline-none focus:ring-4 focus:ring-teal-300/40",
                                             ),
@@ -949,8 +1095,7 @@ def proposal_detail_modal() -> rx.Component:
                                     ),
                                     class_name="space-y-2",
                                 ),
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                class_name=themed(
                                     "p-4 bg-white/5 border border-white/10 rounded-2xl mt-4 backdrop-blur",
                                     "p-4 bg-teal-50 border border-teal-200 rounded-2xl mt-4",
                                 ),
@@ -960,26 +1105,27 @@ def proposal_detail_modal() -> rx.Component:
                         rx.radix.primitives.dialog.close(
                             rx.el.button(
                                 rx.icon(tag="x", class_name="h-4 w-4"),
-                                class_name=rx.cond(
-                                    AuthState.dark_mode,
+                                class_name=themed(
                                     "absolute top-3 right-3 p-1 rounded-full text-slate-400 hover:bg-white/10",
                                     "absolute top-3 right-3 p-1 rounded-full text-slate-500 hover:bg-slate-100",
                                 ),
-                                on_click=ProposalState.close_detail_modal,
+                                on_click=SelectionState.close_detail_modal,
                             )
                         ),
                         class_name="space-y-4",
                     ),
                     rx.el.div("No proposal selected."),
                 ),
-                class_name=rx.cond(
-                    AuthState.dark_mode,
-                    "fixed top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-[90vw] max-w-3xl max-h-[85vh] rounded-3xl border border-white/10 bg-slate-950/95 p-6 text-slate-100 shadow-2xl backdrop-blur-2xl overflow-y-auto",
-                    "fixed top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-[90vw] max-w-3xl max-h-[85vh] rounded-3xl border border-white/60 bg-white p-6 text-slate-900 shadow-2xl backdrop-blur overflow-y-auto",
+                # The portal renders outside the page root, so it carries its own theme class.
+                class_name=theme_root(
+                    themed(
+                        "fixed top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-[90vw] max-w-3xl max-h-[85vh] rounded-3xl border border-white/10 bg-slate-950/95 p-6 text-slate-100 shadow-2xl backdrop-blur-2xl overflow-y-auto",
+                        "fixed top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-[90vw] max-w-3xl max-h-[85vh] rounded-3xl border border-white/60 bg-white p-6 text-slate-900 shadow-2xl backdrop-blur overflow-y-auto",
+                    )
                 ),
             ),
         ),
-        open=ProposalState.show_detail_modal,
+        open=SelectionState.show_detail_modal,
     )
 
 
@@ -990,16 +1136,14 @@ def delete_confirmation_dialog() -> rx.Component:
             rx.el.div(
                 rx.el.h2(
                     "Delete Proposal",
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "text-lg font-semibold text-white",
                         "text-lg font-semibold text-slate-900",
                     ),
                 ),
                 rx.el.p(
                     "Deleting this proposal will remove all associated information and uploaded documents.",
-                    class_name=rx.cond(
-                        AuthState.dark_mode,
+                    class_name=themed(
                         "mt-3 text-sm text-slate-300",
                         "mt-3 text-sm text-slate-700",
                     ),
@@ -1008,8 +1152,7 @@ def delete_confirmation_dialog() -> rx.Component:
                     ProposalState.pending_delete_proposal,
                     rx.el.p(
                         f'Proposal: {ProposalState.pending_delete_proposal["title"]}',
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "mt-2 text-sm font-semibold text-white",
                             "mt-2 text-sm font-semibold text-slate-900",
                         ),
@@ -1020,8 +1163,7 @@ def delete_confirmation_dialog() -> rx.Component:
                     rx.el.button(
                         "Cancel",
                         on_click=ProposalState.cancel_delete_prompt,
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "inline-flex items-center rounded-md border border-white/20 px-4 py-2 text-sm font-medium text-slate-100 hover:bg-white/10 focus:outline-none focus:ring-2 focus:ring-white/20",
                             "inline-flex items-center rounded-md border border-slate-200 px-4 py-2 text-sm font-medium text-slate-700 hover:bg-slate-100 focus:outline-none focus:ring-2 focus:ring-slate-200",
                         ),
@@ -1033,8 +1175,7 @@ def delete_confirmation_dialog() -> rx.Component:
                     ),
                     class_name="mt-6 flex items-center justify-end gap-3",
                 ),
-                class_name=rx.cond(
-                    AuthState.dark_mode,
+                class_name=themed(
                     "space-y-2 rounded-2xl bg-slate-950/95 border border-white/10 p-6 shadow-2xl backdrop-blur w-[90vw] max-w-md",
                     "space-y-2 rounded-2xl bg-white border border-white/60 p-6 shadow-2xl w-[90vw] max-w-md",
                 ),
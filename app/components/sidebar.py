@@ -1,24 +1,22 @@
 import reflex as rx
 from app.state import AuthState
 from app.states.proposal_state import ProposalState
+from app.components.theme import themed
 
 
 def _nav_item(
     icon: str, text: str, page: str, on_click=None
 ) -> rx.Component:
     handler = on_click or (lambda: AuthState.set_active_page(page))
-    icon_class = rx.cond(
-        AuthState.dark_mode,
+    icon_class = themed(
         "h-5 w-5 text-slate-200",
         "h-5 w-5 text-slate-600",
     )
-    active_class = rx.cond(
-        AuthState.dark_mode,
+    active_class = themed(
         "flex items-center gap-3 rounded-2xl bg-white/15 px-3 py-2 text-white shadow-lg transition hover:bg-white/20 cursor-pointer",
         "flex items-center gap-3 rounded-2xl bg-teal-100/90 px-3 py-2 text-teal-800 shadow-sm transition hover:bg-teal-100 cursor-pointer",
     )
-    inactive_class = rx.cond(
-        AuthState.dark_mode,
+    inactive_class = themed(
         "flex items-center gap-3 rounded-2xl px-3 py-2 text-slate-300 transition hover:bg-white/10 hover:text-white cursor-pointer",
         "flex items-center gap-3 rounded-2xl px-3 py-2 text-slate-600 transition hover:bg-slate-100 hover:text-slate-900 cursor-pointer",
     )
@@ -26,8 +24,7 @@ def _nav_item(
         rx.icon(tag=icon, class_name=icon_class),
         rx.el.span(
             text,
-            class_name=rx.cond(
-                AuthState.dark_mode,
+            class_name=themed(
                 "font-medium text-sm",
                 "font-medium text-sm",
             ),
@@ -44,8 +41,7 @@ def sidebar() -> rx.Component:
                 rx.el.div(
                     rx.icon(
                         "sparkles",
-                        class_name=rx.cond(
-                            AuthState.dark_mode,
+                        class_name=themed(
                             "h-8 w-8 text-cyan-400",
                             "h-8 w-8 text-cyan-500",
                         ),
@@ -53,16 +49,14 @@ def sidebar() -> rx.Component:
                     rx.el.div(
                         rx.el.span(
                             "Signed in as",
-                            class_name=rx.cond(
-                                AuthState.dark_mode,
+                            class_name=themed(
                                 "text-xs uppercase tracking-wide text-slate-400",
                                 "text-xs uppercase tracking-wide text-slate-500",
                             ),
                         ),
                         rx.el.span(
                             AuthState.authenticated_user,
-                            class_name=rx.cond(
-                                AuthState.dark_mode,
+                            class_name=themed(
                                 "text-sm font-semibold text-white truncate",
                                 "text-sm font-semibold text-slate-800 truncate",
                             ),
@@ -95,9 +89,11 @@ def sidebar() -> rx.Component:
             class_name="flex-1 overflow-auto py-2",
         ),
         rx.el.div(
-            _nav_item("log-out", "Logout", "logout"),
-            on_click=AuthState.logout,
+            _nav_item("log-out", "Logout", "logout", AuthState.logout),
             class_name="mt-auto p-4 border-t border-white/10",
         ),
-        class_name=AuthState.sidebar_classes,
+        class_name=themed(
+            "hidden md:flex md:flex-col min-h-screen w-64 shrink-0 border-r border-white/10 bg-slate-900/60 text-slate-100 backdrop-blur-xl",
+            "hidden md:flex md:flex-col min-h-screen w-64 shrink-0 border-r border-white/40 bg-white/70 text-slate-900 backdrop-blur-xl",
+        ),
     )
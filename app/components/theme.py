@@ -0,0 +1,43 @@
+import reflex as rx
+from app.state import AuthState
+
+
+def _utility_family(cls: str) -> str:
+    # "hover:bg-white/10" -> "hover:bg", "shadow-lg" -> ":shadow"
+    variants, _, utility = cls.rpartition(":")
+    return f"{variants}:{utility.lstrip('-').split('-')[0]}"
+
+
+def themed(dark: str, light: str) -> str:
+    """Folds a dark/light pair of class lists into a single static class string.
+
+    Shared classes are kept once, light-only classes stay as the default and
+    dark-only classes get Tailwind's ``dark:`` variant. Switching theme is then
+    just the ``dark`` class on the nearest ``theme_root`` instead of a
+    re-render of every conditional.
+
+    A light-only class also applies in dark mode unless a dark class of the
+    same family overrides it, so one is required (``shadow-none`` for
+    ``shadow``, say).
+    """
+    dark_classes = dark.split()
+    light_classes = light.split()
+    dark_families = {_utility_family(cls) for cls in dark_classes}
+    leaking = [
+        cls
+        for cls in light_classes
+        if cls not in dark_classes and _utility_family(cls) not in dark_families
+    ]
+    if leaking:
+        raise ValueError(
+            f"Light-only classes {leaking} would also apply in dark mode; "
+            "give the dark variant a class of the same family."
+        )
+    merged = list(light_classes)
+    merged.extend(f"dark:{cls}" for cls in dark_classes if cls not in light_classes)
+    return " ".join(merged)
+
+
+def theme_root(class_name: str) -> rx.Var:
+    """Class for an element that starts a themed subtree: page roots and portals."""
+    return rx.cond(AuthState.dark_mode, f"dark {class_name}", class_name)
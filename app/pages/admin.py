@@ -0,0 +1,11 @@
+import reflex as rx
+from app.pages.dashboard import dashboard_layout
+from app.components.admin_components import admin_panel, user_panel
+
+
+def admin_page() -> rx.Component:
+    return dashboard_layout(admin_panel())
+
+
+def users_page() -> rx.Component:
+    return dashboard_layout(user_panel())
@@ -0,0 +1,11 @@
+import reflex as rx
+from app.pages.dashboard import dashboard_layout
+from app.components.dashboard_components import create_proposal_form, my_proposals_page
+
+
+def create_proposal_page() -> rx.Component:
+    return dashboard_layout(create_proposal_form())
+
+
+def proposals_page() -> rx.Component:
+    return dashboard_layout(my_proposals_page())
@@ -0,0 +1,122 @@
+"""Admission control for proposal uploads and load shedding of optional work."""
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+# Uploads processed at once; later submitters wait in a FIFO queue. Reflex
+# has already received the whole file when the handler joins the queue, so
+# this bounds the copying, validation and saving, not upload bandwidth or
+# the memory the upload takes; the 50 MB upload cap bounds those.
+MAX_CONCURRENT_UPLOADS = int(os.environ.get("MAX_CONCURRENT_UPLOADS", "4"))
+# How often a waiting submitter's queue position is refreshed in the UI.
+QUEUE_POSITION_REFRESH_SECONDS = 1.0
+# Optional work (refresh, search, paging the user list) is shed while the
+# average wait for the database lock (which decays while the lock is idle)
+# or the process RSS is above these.
+SHED_LOCK_WAIT_SECONDS = float(os.environ.get("SHED_LOCK_WAIT_MS", "200")) / 1000
+SHED_MEMORY_BYTES = int(os.environ.get("SHED_MEMORY_MB", "1536")) * 1024 * 1024
+SHED_CHECK_INTERVAL_SECONDS = 0.5
+
+
+class Ticket:
+    def __init__(self):
+        self._admitted = asyncio.get_running_loop().create_future()
+
+    @property
+    def admitted(self) -> bool:
+        return self._admitted.done()
+
+    def _admit(self):
+        if not self._admitted.done():
+            self._admitted.set_result(True)
+
+
+class AdmissionQueue:
+    """A counting semaphore that admits waiters strictly in arrival order.
+
+    Used only from the event loop, so it needs no locking of its own.
+    """
+
+    def __init__(self, slots: int = MAX_CONCURRENT_UPLOADS):
+        self.slots = max(slots, 1)
+        self._active = 0
+        self._waiting: deque[Ticket] = deque()
+
+    def join(self) -> Ticket:
+        ticket = Ticket()
+        self._waiting.append(ticket)
+        self._admit_waiting()
+        return ticket
+
+    def position(self, ticket: Ticket) -> int:
+        """1 for the next in line; 0 once admitted."""
+        if ticket.admitted:
+            return 0
+        try:
+            return self._waiting.index(ticket) + 1
+        except ValueError:
+            return 0
+
+    async def wait(self, ticket: Ticket, timeout: float) -> bool:
+        """Waits up to ``timeout`` seconds for admission; returns whether admitted."""
+        try:
+            await asyncio.wait_for(asyncio.shield(ticket._admitted), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return ticket.admitted
+
+    def leave(self, ticket: Ticket):
+        if ticket.admitted:
+            self._active -= 1
+        else:
+            try:
+                self._waiting.remove(ticket)
+            except ValueError:
+                pass
+        self._admit_waiting()
+
+    def _admit_waiting(self):
+        while self._active < self.slots and self._waiting:
+            self._active += 1
+            self._waiting.popleft()._admit()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiting)
+
+
+def _resident_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class LoadShedder:
+    def __init__(
+        self,
+        lock_wait: Callable[[], float],
+        lock_wait_limit: float = SHED_LOCK_WAIT_SECONDS,
+        memory_limit: int = SHED_MEMORY_BYTES,
+    ):
+        self.lock_wait = lock_wait
+        self.lock_wait_limit = lock_wait_limit
+        self.memory_limit = memory_limit
+        self._checked_at = 0.0
+        self._shedding = False
+
+    def shedding(self) -> bool:
+        """Whether optional work should be refused right now (re-checked twice a second)."""
+        now = time.monotonic()
+        if now - self._checked_at >= SHED_CHECK_INTERVAL_SECONDS:
+            rss = _resident_bytes()
+            self._shedding = self.lock_wait() > self.lock_wait_limit or (
+                rss is not None and rss > self.memory_limit
+            )
+            self._checked_at = now
+        return self._shedding
@@ -0,0 +1,61 @@
+"""Archival of old audit events into monthly partitions."""
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import logging
+import threading
+from pathlib import Path
+
+from app.services.startup import wait_for_startup
+from app.state import db
+
+
+logger = logging.getLogger(__name__)
+
+AUDIT_ARCHIVE_DIR = Path(__file__).resolve().parent.parent.parent / "audit_archive"
+AUDIT_RETENTION_DAYS = 365
+AUDIT_ARCHIVE_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+def archive_old_events(retention_days: float = AUDIT_RETENTION_DAYS) -> int:
+    """Moves events older than the retention window to audit_archive/audit-YYYY-MM.db."""
+    cutoff = datetime.datetime.now() - datetime.timedelta(days=retention_days)
+    moved = db.archive_audit_events(cutoff.isoformat(), AUDIT_ARCHIVE_DIR)
+    if moved:
+        logger.info("Archived %d audit events older than %s", moved, cutoff.date())
+    return moved
+
+
+@contextlib.asynccontextmanager
+async def audit_archiver():
+    """App lifespan hook that archives old audit events once a day."""
+    stop = threading.Event()
+
+    def run():
+        if not wait_for_startup(stop):
+            return
+        while not stop.is_set():
+            try:
+                archive_old_events()
+            except Exception:
+                logger.exception("Audit archival failed")
+            stop.wait(AUDIT_ARCHIVE_INTERVAL_SECONDS)
+
+    thread = threading.Thread(target=run, name="audit-archiver", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        await asyncio.to_thread(thread.join, 10)
+
+
+if __name__ == "__main__":
+    # python -m app.services.audit [--retention-days 365]
+    parser = argparse.ArgumentParser(description="Archive old audit events.")
+    parser.add_argument("--retention-days", type=float, default=AUDIT_RETENTION_DAYS)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    print(f"Archived {archive_old_events(args.retention_days)} audit events.")
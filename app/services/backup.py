@@ -0,0 +1,244 @@
+"""Online backups of the database and upload store, without stopping the app.
+
+python -m app.services.backup create [--dest backups]
+python -m app.services.backup verify backups/snapshots/20250101T000000
+python -m app.services.backup restore SNAPSHOT --db proposal_app.db --uploads uploaded_files
+
+Each snapshot holds a consistent copy of the database and a manifest of the
+upload store. File contents live once in a shared, content-addressed
+``objects/`` directory, so a snapshot only copies files that changed. With
+DATABASE_SHARDS above 1 every shard file is copied, and restored next to the
+``--db`` path under the same names the app uses.
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from app.services.storage import upload_dirs
+from app.state import SCHEMA_VERSION, db, shard_path
+
+
+logger = logging.getLogger(__name__)
+
+BACKUP_DIR = Path(
+    os.environ.get("BACKUP_DIR", Path(__file__).resolve().parent.parent.parent / "backups")
+)
+BACKUP_STEP_PAGES = 256
+BACKUP_STEP_PAUSE_SECONDS = 0.005
+HASH_CHUNK_SIZE = 1024 * 1024
+DATABASE_FILE = "proposal_app.db"
+MANIFEST_FILE = "manifest.json"
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _object_path(objects_dir: Path, sha256: str) -> Path:
+    return objects_dir / sha256[:2] / sha256
+
+
+def _store_object(objects_dir: Path, source: Path, sha256: str):
+    target = _object_path(objects_dir, sha256)
+    if target.exists():
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp = target.with_name(f".{sha256}.tmp")
+    shutil.copyfile(source, temp)
+    os.replace(temp, target)
+
+
+def _database_files(manifest: dict[str, Any]) -> list[str]:
+    # Shard 0 first; snapshots taken before sharding have no "shards" entry.
+    return [manifest["database"], *manifest.get("shards", [])]
+
+
+def _latest_manifest(backup_dir: Path) -> dict[str, Any]:
+    snapshots = sorted((backup_dir / "snapshots").glob(f"*/{MANIFEST_FILE}"))
+    return json.loads(snapshots[-1].read_text()) if snapshots else {}
+
+
+def snapshot_uploads(
+    objects_dir: Path, previous: Optional[dict[str, Any]] = None
+) -> dict[str, dict[str, Any]]:
+    """Adds changed uploads to the object store and returns the new file manifest.
+
+    Files whose size and mtime match the previous manifest are not re-read.
+    """
+    previous_files = (previous or {}).get("files", {})
+    files: dict[str, dict[str, Any]] = {}
+    for base in upload_dirs():
+        if not base.is_dir():
+            continue
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if entry.name in files or not entry.is_file(follow_symlinks=False):
+                    continue
+                stat = entry.stat()
+                known = previous_files.get(entry.name)
+                if (
+                    known
+                    and known["size"] == stat.st_size
+                    and known["mtime_ns"] == stat.st_mtime_ns
+                    and _object_path(objects_dir, known["sha256"]).exists()
+                ):
+                    files[entry.name] = known
+                    continue
+                path = Path(entry.path)
+                try:
+                    sha256 = _sha256(path)
+                    _store_object(objects_dir, path, sha256)
+                except FileNotFoundError:
+                    continue  # Deleted while we were looking at it.
+                files[entry.name] = {
+                    "sha256": sha256,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                }
+    return files
+
+
+def create_backup(backup_dir: Path = BACKUP_DIR) -> dict[str, Any]:
+    """Writes snapshots/<timestamp>/ with the database copy and upload manifest."""
+    started = time.perf_counter()
+    stamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+    snapshot_dir = backup_dir / "snapshots" / stamp
+    objects_dir = backup_dir / "objects"
+    previous = _latest_manifest(backup_dir)
+    partial_dir = snapshot_dir.with_name(f".{stamp}.partial")
+    partial_dir.mkdir(parents=True)
+    databases = [shard_path(Path(DATABASE_FILE), index).name for index in range(len(db.shards))]
+    restarts = sum(
+        shard.backup_to(partial_dir / name, BACKUP_STEP_PAGES, BACKUP_STEP_PAUSE_SECONDS)
+        for shard, name in zip(db.shards, databases)
+    )
+    files = snapshot_uploads(objects_dir, previous)
+    manifest = {
+        "created_at": datetime.datetime.now().isoformat(),
+        "schema_version": SCHEMA_VERSION,
+        "database": databases[0],
+        "shards": databases[1:],
+        "files": files,
+    }
+    (partial_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    # A snapshot only appears under its final name once it is complete.
+    os.replace(partial_dir, snapshot_dir)
+    reused = sum(1 for name, entry in files.items() if previous.get("files", {}).get(name) == entry)
+    return {
+        "snapshot": snapshot_dir,
+        "files": len(files),
+        "new_files": len(files) - reused,
+        "restarts": restarts,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def restore_backup(snapshot_dir: Path, db_path: Path, upload_dir: Path, force: bool = False):
+    """Recreates the database (every shard) and upload directory recorded in a snapshot."""
+    manifest = json.loads((snapshot_dir / MANIFEST_FILE).read_text())
+    databases = _database_files(manifest)
+    targets = [shard_path(db_path, index) for index in range(len(databases))]
+    for target_path in targets:
+        if target_path.exists() and not force:
+            raise FileExistsError(f"{target_path} exists; pass force=True to overwrite it.")
+    objects_dir = snapshot_dir.parent.parent / "objects"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    for name, target_path in zip(databases, targets):
+        source = sqlite3.connect(f"file:{snapshot_dir / name}?mode=ro", uri=True)
+        target = sqlite3.connect(target_path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    for name, entry in manifest["files"].items():
+        shutil.copyfile(_object_path(objects_dir, entry["sha256"]), upload_dir / name)
+
+
+def verify_backup(snapshot_dir: Path) -> list[str]:
+    """Restores a snapshot into a scratch directory and checks the result.
+
+    Returns a list of problems; an empty list means the snapshot restores cleanly.
+    """
+    problems = []
+    manifest = json.loads((snapshot_dir / MANIFEST_FILE).read_text())
+    with tempfile.TemporaryDirectory(prefix="restore-check-") as scratch:
+        db_path = Path(scratch) / DATABASE_FILE
+        upload_dir = Path(scratch) / "uploads"
+        try:
+            restore_backup(snapshot_dir, db_path, upload_dir)
+        except (OSError, sqlite3.Error) as exc:
+            return [f"Restore failed: {exc}"]
+        referenced: set[str] = set()
+        for index, name in enumerate(_database_files(manifest)):
+            conn = sqlite3.connect(shard_path(db_path, index))
+            try:
+                result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+                if result != "ok":
+                    problems.append(f"Database {name} integrity check failed: {result}")
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version != manifest["schema_version"]:
+                    problems.append(
+                        f"Database {name} schema version {version} does not match manifest {manifest['schema_version']}."
+                    )
+                referenced |= {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT proposal_file FROM proposals WHERE proposal_file != ''"
+                    )
+                }
+            finally:
+                conn.close()
+        for name in sorted(referenced - set(manifest["files"])):
+            problems.append(f"Proposal document {name} is not in the snapshot.")
+        for name, entry in manifest["files"].items():
+            if _sha256(upload_dir / name) != entry["sha256"]:
+                problems.append(f"Restored {name} does not match its recorded hash.")
+    return problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Back up, verify or restore the app data.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    create = commands.add_parser("create", help="take a snapshot while the app runs")
+    create.add_argument("--dest", type=Path, default=BACKUP_DIR)
+    verify = commands.add_parser("verify", help="trial-restore a snapshot and check it")
+    verify.add_argument("snapshot", type=Path)
+    restore = commands.add_parser("restore", help="restore a snapshot")
+    restore.add_argument("snapshot", type=Path)
+    restore.add_argument("--db", type=Path, required=True)
+    restore.add_argument("--uploads", type=Path, required=True)
+    restore.add_argument("--force", action="store_true", help="overwrite an existing database")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "create":
+        report = create_backup(args.dest)
+        print(
+            f"Snapshot {report['snapshot']} in {report['seconds']:.1f}s: "
+            f"{report['files']} files ({report['new_files']} new), "
+            f"{report['restarts']} database copy restarts."
+        )
+    elif args.command == "verify":
+        problems = verify_backup(args.snapshot)
+        for problem in problems:
+            print(problem)
+        print("Snapshot restores cleanly." if not problems else f"{len(problems)} problems found.")
+        raise SystemExit(1 if problems else 0)
+    else:
+        restore_backup(args.snapshot, args.db, args.uploads, args.force)
+        print(f"Restored {args.snapshot} to {args.db} and {args.uploads}.")
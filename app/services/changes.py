@@ -0,0 +1,145 @@
+"""Consumers of the proposals/users change log, and its compaction and retention.
+
+Triggers append one record per inserted, updated or deleted row to
+``change_log`` (see ``Database.read_changes``). A consumer keeps the offset
+of the last record it handled and asks only for what came after it, instead
+of rescanning the tables:
+
+    feed = ChangeFeed("search-index")
+    for change in feed.poll():
+        ...
+    feed.commit()
+
+Records older than CHANGE_LOG_COMPACT_AFTER_SECONDS are compacted down to the
+newest one per row. Records older than CHANGE_LOG_RETENTION_DAYS are dropped;
+a consumer that was further behind gets ChangeLogTruncatedError from poll()
+and must resynchronize from the tables, then call ``reset()``.
+
+With DATABASE_SHARDS above 1 every shard keeps its own log and offsets, so a
+feed saves one offset per shard.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+
+from app.services.startup import wait_for_startup
+from app.state import (
+    CHANGE_LOG_READ_LIMIT,
+    CHANGE_LOG_TABLES,
+    Change,
+    ChangeLogTruncatedError,
+    db,
+)
+
+
+logger = logging.getLogger(__name__)
+
+CHANGE_LOG_COMPACT_AFTER_SECONDS = 60 * 60
+CHANGE_LOG_RETENTION_DAYS = 7
+CHANGE_LOG_MAINTENANCE_INTERVAL_SECONDS = 60 * 60
+_OFFSET_KEY_PREFIX = "change_feed:"
+
+
+class ChangeFeed:
+    """A named consumer whose offsets, one per shard, are saved in maintenance_state."""
+
+    def __init__(self, name: str, tables: tuple[str, ...] = tuple(CHANGE_LOG_TABLES)):
+        self.name = name
+        self.tables = tables
+        saved = db.get_maintenance_value(_OFFSET_KEY_PREFIX + name, "0").split(",")
+        self.offsets = ([int(value) for value in saved] + [0] * len(db.shards))[: len(db.shards)]
+        self._pending = list(self.offsets)
+
+    def poll(self, limit: int = CHANGE_LOG_READ_LIMIT) -> list[Change]:
+        """The next records after the last ones polled; empty when caught up.
+
+        Offsets are only ordered within a shard; records from several shards
+        are interleaved by time.
+        """
+        changes: list[Change] = []
+        for index, shard in enumerate(db.shards):
+            shard_changes = shard.read_changes(self._pending[index], limit, self.tables)
+            if shard_changes:
+                self._pending[index] = shard_changes[-1]["offset"]
+                changes.extend(shard_changes)
+        changes.sort(key=lambda change: change["changed_at"])
+        return changes
+
+    def commit(self):
+        """Saves the offsets of everything polled so far as handled."""
+        if self._pending != self.offsets:
+            db.set_maintenance_value(
+                _OFFSET_KEY_PREFIX + self.name, ",".join(map(str, self._pending))
+            )
+            self.offsets = list(self._pending)
+
+    def reset(self):
+        """Starts from the end of the log, after a full resynchronization."""
+        self._pending = [shard.latest_change_offset() for shard in db.shards]
+        self.commit()
+
+
+def maintain_change_log(
+    compact_after: float = CHANGE_LOG_COMPACT_AFTER_SECONDS,
+    retention_days: float = CHANGE_LOG_RETENTION_DAYS,
+) -> tuple[int, int]:
+    """Compacts and expires old records; returns how many of each were removed."""
+    now = time.time()
+    expired = compacted = 0
+    for shard in db.shards:
+        expired += shard.expire_change_log(now - retention_days * 24 * 60 * 60)
+        compacted += shard.compact_change_log(now - compact_after)
+    if expired or compacted:
+        logger.info("Change log: %d records compacted, %d expired", compacted, expired)
+    return compacted, expired
+
+
+@contextlib.asynccontextmanager
+async def change_log_maintainer():
+    """App lifespan hook that compacts and expires the change log every hour."""
+    stop = threading.Event()
+
+    def run():
+        if not wait_for_startup(stop):
+            return
+        while not stop.is_set():
+            try:
+                maintain_change_log()
+            except Exception:
+                logger.exception("Change log maintenance failed")
+            stop.wait(CHANGE_LOG_MAINTENANCE_INTERVAL_SECONDS)
+
+    thread = threading.Thread(target=run, name="change-log-maintainer", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        await asyncio.to_thread(thread.join, 10)
+
+
+if __name__ == "__main__":
+    # python -m app.services.changes [--tail OFFSET [--shard N]]
+    parser = argparse.ArgumentParser(description="Maintain or print the change log.")
+    parser.add_argument("--tail", type=int, metavar="OFFSET", help="print records after OFFSET")
+    parser.add_argument("--shard", type=int, default=0, help="shard whose log --tail reads")
+    parser.add_argument("--retention-days", type=float, default=CHANGE_LOG_RETENTION_DAYS)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.tail is not None:
+        try:
+            changes = db.shards[args.shard].read_changes(args.tail)
+        except ChangeLogTruncatedError as exc:
+            raise SystemExit(f"{exc} Tail from {exc.truncated_through} or later.")
+        for change in changes:
+            print(
+                f"{change['offset']}\t{change['table']}\t{change['op']}\t"
+                f"{change['key']}\t{change['version'] if change['version'] is not None else ''}"
+            )
+    else:
+        compacted, expired = maintain_change_log(retention_days=args.retention_days)
+        print(f"Compacted {compacted} and expired {expired} change log records.")
@@ -0,0 +1,800 @@
+"""Local text extraction for uploaded proposal documents.
+
+Nothing in this module imports the app, so it can run inside a process pool:
+a malformed or oversized document only ever takes down its own worker.
+Every format is read as a sequence of chunks (PDF pages, HWP sections,
+slides, XML parts) and extraction stops as soon as the text cap is reached.
+"""
+
+import multiprocessing
+import re
+import struct
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Iterator, Optional
+from xml.etree import ElementTree
+
+
+MAX_TEXT_CHARS = 200_000
+MAX_STREAM_BYTES = 64 * 1024 * 1024
+# PDF and HWP files are parsed in memory; anything larger is refused unread.
+MAX_DOCUMENT_BYTES = 64 * 1024 * 1024
+WORKER_MEMORY_LIMIT_BYTES = 1024 * 1024 * 1024
+WORKER_COUNT = 2
+TASKS_PER_WORKER = 25
+EXTRACTION_TIMEOUT_SECONDS = 120
+
+SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".pptx", ".hwp", ".hwpx"}
+MAX_THUMBNAIL_BYTES = 512 * 1024
+
+
+class ExtractionError(Exception):
+    pass
+
+
+def _read_document(path: Path) -> bytes:
+    if path.stat().st_size > MAX_DOCUMENT_BYTES:
+        raise ExtractionError(f"{path.name} is larger than {MAX_DOCUMENT_BYTES} bytes.")
+    return path.read_bytes()
+
+
+def _inflate(data: bytes, raw: bool = False) -> bytes:
+    """Decompresses a deflate stream without letting it grow past the cap."""
+    decompressor = zlib.decompressobj(-15 if raw else zlib.MAX_WBITS)
+    try:
+        output = decompressor.decompress(data, MAX_STREAM_BYTES)
+    except zlib.error as exc:
+        raise ExtractionError(f"Corrupt compressed stream: {exc}") from exc
+    if decompressor.unconsumed_tail:
+        raise ExtractionError("Compressed stream exceeds the size limit.")
+    return output
+
+
+# --- OLE compound files (HWP 5.x) -------------------------------------------
+
+_OLE_SIGNATURE = bytes.fromhex("d0cf11e0a1b11ae1")
+_END_OF_CHAIN = 0xFFFFFFFE
+
+
+class _OleFile:
+    """Minimal reader for the compound file container used by HWP 5.x."""
+
+    def __init__(self, data: bytes):
+        if data[:8] != _OLE_SIGNATURE or len(data) < 512:
+            raise ExtractionError("Not an OLE compound file.")
+        self._data = data
+        self._sector_size = 1 << struct.unpack_from("<H", data, 0x1E)[0]
+        self._mini_sector_size = 1 << struct.unpack_from("<H", data, 0x20)[0]
+        (
+            fat_sector_count,
+            first_dir_sector,
+        ) = struct.unpack_from("<II", data, 0x2C)
+        (
+            self._mini_cutoff,
+            first_minifat_sector,
+            _minifat_count,
+            first_difat_sector,
+            difat_count,
+        ) = struct.unpack_from("<IIIII", data, 0x38)
+        difat = list(struct.unpack_from("<109I", data, 0x4C))
+        sector = first_difat_sector
+        for _ in range(difat_count):
+            if sector >= _END_OF_CHAIN:
+                break
+            entries = struct.unpack_from(
+                f"<{self._sector_size // 4}I", data, self._offset(sector)
+            )
+            difat.extend(entries[:-1])
+            sector = entries[-1]
+        self._fat: list[int] = []
+        for fat_sector in difat[:fat_sector_count]:
+            self._fat.extend(
+                struct.unpack_from(
+                    f"<{self._sector_size // 4}I", data, self._offset(fat_sector)
+                )
+            )
+        self._entries = self._read_directory(first_dir_sector)
+        root = self._entries[0]
+        self._mini_stream = self._read_chain(root["start"], root["size"])
+        minifat_data = (
+            self._read_chain(first_minifat_sector, None)
+            if first_minifat_sector < _END_OF_CHAIN
+            else b""
+        )
+        self._minifat = list(
+            struct.unpack_from(f"<{len(minifat_data) // 4}I", minifat_data)
+        )
+        self._paths: dict[str, dict] = {}
+        self._index_paths(root["child"], "")
+
+    def _offset(self, sector: int) -> int:
+        offset = (sector + 1) * self._sector_size
+        if offset + self._sector_size > len(self._data):
+            raise ExtractionError("Sector points past the end of the file.")
+        return offset
+
+    def _read_chain(self, start: int, size: Optional[int]) -> bytes:
+        chunks = []
+        sector = start
+        seen = 0
+        while sector < _END_OF_CHAIN:
+            seen += 1
+            if seen > len(self._fat) or sector >= len(self._fat):
+                raise ExtractionError("Broken sector chain.")
+            offset = self._offset(sector)
+            chunks.append(self._data[offset : offset + self._sector_size])
+            sector = self._fat[sector]
+        data = b"".join(chunks)
+        return data if size is None else data[:size]
+
+    def _read_mini_chain(self, start: int, size: int) -> bytes:
+        chunks = []
+        sector = start
+        seen = 0
+        while sector < _END_OF_CHAIN:
+            seen += 1
+            if seen > len(self._minifat) or sector >= len(self._minifat):
+                raise ExtractionError("Broken mini sector chain.")
+            offset = sector * self._mini_sector_size
+            chunks.append(self._mini_stream[offset : offset + self._mini_sector_size])
+            sector = self._minifat[sector]
+        return b"".join(chunks)[:size]
+
+    def _read_directory(self, first_sector: int) -> list[dict]:
+        raw = self._read_chain(first_sector, None)
+        entries = []
+        for offset in range(0, len(raw) - 127, 128):
+            name_length = struct.unpack_from("<H", raw, offset + 64)[0]
+            name = raw[offset : offset + max(name_length - 2, 0)].decode(
+                "utf-16-le", errors="replace"
+            )
+            entry_type = raw[offset + 66]
+            left, right, child = struct.unpack_from("<III", raw, offset + 68)
+            start, size = struct.unpack_from("<II", raw, offset + 116)
+            entries.append(
+                {
+                    "name": name,
+                    "type": entry_type,
+                    "left": left,
+                    "right": right,
+                    "child": child,
+                    "start": start,
+                    "size": size,
+                }
+            )
+        if not entries:
+            raise ExtractionError("Empty OLE directory.")
+        return entries
+
+    def _index_paths(self, entry_id: int, prefix: str, depth: int = 0):
+        # Siblings form a binary tree; storages (type 1) nest their own tree.
+        stack = [entry_id]
+        visited: set[int] = set()
+        while stack:
+            current = stack.pop()
+            if current >= len(self._entries) or current in visited:
+                continue
+            visited.add(current)
+            entry = self._entries[current]
+            path = f"{prefix}{entry['name']}"
+            self._paths[path] = entry
+            if entry["type"] == 1 and depth < 8:
+                self._index_paths(entry["child"], f"{path}/", depth + 1)
+            stack.extend((entry["left"], entry["right"]))
+
+    def list_streams(self) -> list[str]:
+        return [path for path, entry in self._paths.items() if entry["type"] == 2]
+
+    def read_stream(self, path: str) -> bytes:
+        entry = self._paths.get(path)
+        if entry is None or entry["type"] != 2:
+            raise ExtractionError(f"Missing stream {path}.")
+        if entry["size"] > MAX_STREAM_BYTES:
+            raise ExtractionError(f"Stream {path} exceeds the size limit.")
+        if entry["size"] < self._mini_cutoff:
+            return self._read_mini_chain(entry["start"], entry["size"])
+        return self._read_chain(entry["start"], entry["size"])
+
+
+# --- HWP 5.x -----------------------------------------------------------------
+
+_HWPTAG_PARA_TEXT = 0x10 + 51
+# Control characters that occupy a single WCHAR; every other code below 32
+# is an inline or extended control that spans eight WCHARs.
+_HWP_CHAR_CONTROLS = {0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31}
+
+
+def _hwp_para_text(payload: bytes) -> str:
+    out = bytearray()
+    index = 0
+    while index + 1 < len(payload):
+        code = payload[index] | (payload[index + 1] << 8)
+        if code >= 32:
+            out += payload[index : index + 2]
+            index += 2
+            continue
+        if code in (10, 13):
+            out += b"\n\x00"
+        elif code == 9:
+            out += b"\t\x00"
+        elif code in (30, 31):
+            out += b" \x00"
+        index += 2 if code in _HWP_CHAR_CONTROLS else 16
+    return out.decode("utf-16-le", errors="replace")
+
+
+def _iter_hwp_records(data: bytes) -> Iterator[tuple[int, bytes]]:
+    offset = 0
+    while offset + 4 <= len(data):
+        header = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        tag = header & 0x3FF
+        size = (header >> 20) & 0xFFF
+        if size == 0xFFF:
+            if offset + 4 > len(data):
+                return
+            size = struct.unpack_from("<I", data, offset)[0]
+            offset += 4
+        yield tag, data[offset : offset + size]
+        offset += size
+
+
+def _iter_hwp_text(path: Path) -> Iterator[str]:
+    ole = _OleFile(_read_document(path))
+    header = ole.read_stream("FileHeader")
+    if not header.startswith(b"HWP Document File"):
+        raise ExtractionError("Missing HWP file header.")
+    properties = struct.unpack_from("<I", header, 36)[0]
+    compressed = bool(properties & 0x1)
+    protected = bool(properties & 0x2) or bool(properties & 0x4)
+    sections = sorted(
+        (name for name in ole.list_streams() if name.startswith("BodyText/Section")),
+        key=lambda name: int(re.sub(r"\D", "", name) or 0),
+    )
+    if protected or not sections:
+        # Encrypted and distribution documents only expose the preview text.
+        if "PrvText" in ole.list_streams():
+            yield ole.read_stream("PrvText").decode("utf-16-le", errors="replace")
+        return
+    for name in sections:
+        data = ole.read_stream(name)
+        if compressed:
+            data = _inflate(data, raw=True)
+        paragraphs = [
+            _hwp_para_text(payload)
+            for tag, payload in _iter_hwp_records(data)
+            if tag == _HWPTAG_PARA_TEXT
+        ]
+        yield "\n".join(paragraphs)
+
+
+# --- Zip/XML containers (DOCX, PPTX, HWPX) -----------------------------------
+
+_ZIP_PARTS = {
+    ".docx": re.compile(r"^word/(document|header\d*|footer\d*|footnotes)\.xml$"),
+    ".pptx": re.compile(r"^ppt/slides/slide\d+\.xml$"),
+    ".hwpx": re.compile(r"^Contents/section\d+\.xml$"),
+}
+
+
+def _natural_key(name: str) -> list:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+def _iter_zip_text(path: Path, extension: str) -> Iterator[str]:
+    pattern = _ZIP_PARTS[extension]
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as exc:
+        raise ExtractionError(f"Invalid {extension} container.") from exc
+    with archive:
+        members = sorted(
+            (info for info in archive.infolist() if pattern.match(info.filename)),
+            key=lambda info: _natural_key(info.filename),
+        )
+        for info in members:
+            if info.file_size > MAX_STREAM_BYTES:
+                raise ExtractionError(f"{info.filename} exceeds the size limit.")
+            parts: list[str] = []
+            with archive.open(info) as stream:
+                for event, element in ElementTree.iterparse(stream, events=("end",)):
+                    local_name = element.tag.rsplit("}", 1)[-1]
+                    if local_name == "t" and element.text:
+                        parts.append(element.text)
+                    elif local_name in ("p", "br"):
+                        parts.append("\n")
+                    elif local_name == "tab":
+                        parts.append("\t")
+                    if local_name == "p":
+                        element.clear()
+            yield "".join(parts)
+
+
+# --- PDF -----------------------------------------------------------------------
+
+_PDF_OBJECT = re.compile(rb"(\d+)\s+(\d+)\s+obj\b(.*?)\bendobj", re.S)
+_PDF_REF = re.compile(rb"(\d+)\s+\d+\s+R")
+_PDF_TOKEN = re.compile(
+    rb"\((?:\\.|[^\\()])*\)|<[0-9A-Fa-f\s]*>|\[|\]|/[^\s/\[\]()<>{}%]+|[-+]?\d*\.?\d+|[A-Za-z'\"*]+",
+    re.S,
+)
+
+
+def _pdf_dict_value(dictionary: bytes, key: bytes) -> Optional[bytes]:
+    """Returns the raw value of ``/key`` at any depth, including nested dicts."""
+    match = re.search(rb"/" + re.escape(key) + rb"(?![A-Za-z0-9])\s*", dictionary)
+    if not match:
+        return None
+    start = match.end()
+    if dictionary[start : start + 2] == b"<<":
+        depth = 0
+        index = start
+        while index < len(dictionary) - 1:
+            pair = dictionary[index : index + 2]
+            if pair == b"<<":
+                depth += 1
+                index += 2
+                continue
+            if pair == b">>":
+                depth -= 1
+                index += 2
+                if depth == 0:
+                    return dictionary[start:index]
+                continue
+            index += 1
+        return dictionary[start:]
+    if dictionary[start : start + 1] == b"[":
+        end = dictionary.find(b"]", start)
+        return dictionary[start : end + 1 if end >= 0 else None]
+    ref = _PDF_REF.match(dictionary, start)
+    if ref:
+        return ref.group(0)
+    token = re.match(rb"/?[^\s/\[\]<>()]+", dictionary[start:])
+    return token.group(0) if token else None
+
+
+class _PdfDocument:
+    def __init__(self, data: bytes):
+        if b"/Encrypt" in data[-4096:]:
+            raise ExtractionError("Encrypted PDF.")
+        self.objects: dict[int, tuple[bytes, Optional[bytes]]] = {}
+        for match in _PDF_OBJECT.finditer(data):
+            body = match.group(3)
+            stream_at = body.find(b"stream")
+            if stream_at < 0:
+                self.objects[int(match.group(1))] = (body, None)
+                continue
+            raw = body[stream_at + 6 :]
+            if raw.startswith(b"\r\n"):
+                raw = raw[2:]
+            elif raw[:1] in (b"\r", b"\n"):
+                raw = raw[1:]
+            end = raw.rfind(b"endstream")
+            self.objects[int(match.group(1))] = (
+                body[:stream_at],
+                raw[:end] if end >= 0 else raw,
+            )
+        self._unpack_object_streams()
+        self._cmaps: dict[int, tuple[dict[bytes, str], int]] = {}
+
+    def _unpack_object_streams(self):
+        for number, (dictionary, raw) in list(self.objects.items()):
+            if raw is None or not re.search(rb"/Type\s*/ObjStm", dictionary):
+                continue
+            data = self.stream(number)
+            first = int((_pdf_dict_value(dictionary, b"First") or b"0"))
+            header = data[:first].split()
+            for index in range(0, len(header) - 1, 2):
+                object_number = int(header[index])
+                start = first + int(header[index + 1])
+                end = (
+                    first + int(header[index + 3])
+                    if index + 3 < len(header)
+                    else len(data)
+                )
+                self.objects.setdefault(object_number, (data[start:end], None))
+
+    def resolve(self, value: Optional[bytes]) -> bytes:
+        if value is None:
+            return b""
+        ref = _PDF_REF.fullmatch(value.strip())
+        if ref:
+            return self.objects.get(int(ref.group(1)), (b"", None))[0]
+        return value
+
+    def stream(self, number: int) -> bytes:
+        dictionary, raw = self.objects.get(number, (b"", None))
+        if raw is None:
+            return b""
+        filters = _pdf_dict_value(dictionary, b"Filter") or b""
+        if b"FlateDecode" in filters:
+            return _inflate(raw)
+        if filters:
+            return b""  # Image and legacy filters carry no extractable text.
+        return raw
+
+    def pages(self) -> list[int]:
+        roots = [
+            number
+            for number, (dictionary, _) in self.objects.items()
+            if re.search(rb"/Type\s*/Pages\b", dictionary)
+            and b"/Parent" not in dictionary
+        ]
+        ordered: list[int] = []
+        stack = list(reversed(roots))
+        seen: set[int] = set()
+        while stack:
+            number = stack.pop()
+            if number in seen:
+                continue
+            seen.add(number)
+            dictionary = self.objects.get(number, (b"", None))[0]
+            if re.search(rb"/Type\s*/Page\b", dictionary):
+                ordered.append(number)
+                continue
+            kids = self.resolve(_pdf_dict_value(dictionary, b"Kids"))
+            stack.extend(
+                reversed([int(ref) for ref in _PDF_REF.findall(kids)])
+            )
+        if ordered:
+            return ordered
+        return [
+            number
+            for number, (dictionary, _) in self.objects.items()
+            if re.search(rb"/Type\s*/Page\b", dictionary)
+        ]
+
+    def _inherited(self, page: int, key: bytes) -> Optional[bytes]:
+        number: Optional[int] = page
+        for _ in range(32):
+            if number is None:
+                return None
+            dictionary = self.objects.get(number, (b"", None))[0]
+            value = _pdf_dict_value(dictionary, key)
+            if value is not None:
+                return value
+            parent = _pdf_dict_value(dictionary, b"Parent")
+            ref = _PDF_REF.fullmatch(parent.strip()) if parent else None
+            number = int(ref.group(1)) if ref else None
+        return None
+
+    def page_fonts(self, page: int) -> dict[bytes, int]:
+        resources = self.resolve(self._inherited(page, b"Resources"))
+        fonts = self.resolve(_pdf_dict_value(resources, b"Font"))
+        return {
+            name: int(number)
+            for name, number in re.findall(
+                rb"/([^\s/\[\]()<>]+)\s*(\d+)\s+\d+\s+R", fonts
+            )
+        }
+
+    def page_content(self, page: int) -> bytes:
+        dictionary = self.objects.get(page, (b"", None))[0]
+        contents = _pdf_dict_value(dictionary, b"Contents") or b""
+        if contents.startswith(b"[") or _PDF_REF.fullmatch(contents.strip()):
+            refs = [int(ref) for ref in _PDF_REF.findall(contents)]
+            if len(refs) == 1 and self.objects.get(refs[0], (b"", None))[1] is None:
+                # An indirect array of content streams.
+                refs = [
+                    int(ref) for ref in _PDF_REF.findall(self.resolve(contents))
+                ]
+            return b"\n".join(self.stream(ref) for ref in refs)
+        return b""
+
+    def font_cmap(self, font: int) -> tuple[dict[bytes, str], int]:
+        if font in self._cmaps:
+            return self._cmaps[font]
+        dictionary = self.objects.get(font, (b"", None))[0]
+        value = _pdf_dict_value(dictionary, b"ToUnicode")
+        ref = _PDF_REF.fullmatch(value.strip()) if value else None
+        cmap: dict[bytes, str] = {}
+        code_length = 2 if b"Type0" in dictionary else 1
+        if ref:
+            data = self.stream(int(ref.group(1)))
+            cmap, code_length = _parse_cmap(data, code_length)
+        self._cmaps[font] = (cmap, code_length)
+        return self._cmaps[font]
+
+
+def _hex_to_text(value: bytes) -> str:
+    try:
+        return bytes.fromhex(value.decode("ascii")).decode("utf-16-be", errors="replace")
+    except ValueError:
+        return ""
+
+
+def _parse_cmap(data: bytes, default_length: int) -> tuple[dict[bytes, str], int]:
+    cmap: dict[bytes, str] = {}
+    code_length = default_length
+    space = re.search(rb"begincodespacerange\s*<([0-9A-Fa-f]+)>", data)
+    if space:
+        code_length = max(len(space.group(1)) // 2, 1)
+    for block in re.findall(rb"beginbfchar(.*?)endbfchar", data, re.S):
+        for source, target in re.findall(
+            rb"<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]*)>", block
+        ):
+            cmap[bytes.fromhex(source.decode("ascii"))] = _hex_to_text(target)
+    for block in re.findall(rb"beginbfrange(.*?)endbfrange", data, re.S):
+        for start, end, target in re.findall(
+            rb"<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]+>|\[[^\]]*\])",
+            block,
+        ):
+            low = int(start, 16)
+            high = min(int(end, 16), low + 0xFFFF)
+            width = len(start) // 2
+            if target.startswith(b"["):
+                targets = re.findall(rb"<([0-9A-Fa-f]*)>", target)
+                for offset, item in enumerate(targets[: high - low + 1]):
+                    cmap[(low + offset).to_bytes(width, "big")] = _hex_to_text(item)
+                continue
+            base = int(target[1:-1], 16)
+            target_width = (len(target) - 2) // 2
+            for offset in range(high - low + 1):
+                cmap[(low + offset).to_bytes(width, "big")] = _hex_to_text(
+                    b"%0*x" % (target_width * 2, base + offset)
+                )
+    return cmap, code_length
+
+
+def _pdf_literal(token: bytes) -> bytes:
+    body = token[1:-1]
+    out = bytearray()
+    index = 0
+    escapes = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+    while index < len(body):
+        char = body[index : index + 1]
+        if char != b"\\":
+            out += char
+            index += 1
+            continue
+        following = body[index + 1 : index + 2]
+        if following in escapes:
+            out += escapes[following]
+            index += 2
+        elif following.isdigit():
+            octal = re.match(rb"[0-7]{1,3}", body[index + 1 :])
+            out.append(int(octal.group(0), 8) & 0xFF)
+            index += 1 + len(octal.group(0))
+        elif following in (b"\r", b"\n"):
+            index += 2
+        else:
+            out += following
+            index += 2
+    return bytes(out)
+
+
+def _decode_pdf_string(raw: bytes, cmap: dict[bytes, str], code_length: int) -> str:
+    if not cmap:
+        return raw.decode("latin-1")
+    out = []
+    for index in range(0, len(raw) - code_length + 1, code_length):
+        out.append(cmap.get(raw[index : index + code_length], ""))
+    return "".join(out)
+
+
+def _pdf_content_text(document: _PdfDocument, page: int) -> str:
+    fonts = document.page_fonts(page)
+    cmap: dict[bytes, str] = {}
+    code_length = 1
+    operands: list[bytes] = []
+    out: list[str] = []
+
+    def emit(token: bytes):
+        if token.startswith(b"("):
+            raw = _pdf_literal(token)
+        else:
+            raw = bytes.fromhex(re.sub(rb"\s", b"", token[1:-1]).decode("ascii").ljust(2, "0"))
+        out.append(_decode_pdf_string(raw, cmap, code_length))
+
+    for match in _PDF_TOKEN.finditer(document.page_content(page)):
+        token = match.group(0)
+        if token[:1] in (b"(", b"<", b"[", b"]", b"/") or re.fullmatch(
+            rb"[-+]?\d*\.?\d+", token
+        ):
+            operands.append(token)
+            continue
+        if token == b"Tf" and len(operands) >= 2:
+            font = fonts.get(operands[-2].lstrip(b"/"))
+            cmap, code_length = (
+                document.font_cmap(font) if font is not None else ({}, 1)
+            )
+        elif token in (b"Tj", b"'", b'"') and operands:
+            if token != b"Tj":
+                out.append("\n")
+            if operands[-1][:1] in (b"(", b"<"):
+                emit(operands[-1])
+        elif token == b"TJ":
+            for item in operands:
+                if item[:1] in (b"(", b"<"):
+                    emit(item)
+                elif re.fullmatch(rb"[-+]?\d*\.?\d+", item) and float(item) < -200:
+                    out.append(" ")
+        elif token in (b"Td", b"TD", b"T*", b"ET"):
+            out.append("\n")
+        operands = []
+    text = "".join(out)
+    return re.sub(r"[ \t]*\n\s*", "\n", text).strip()
+
+
+def _iter_pdf_text(path: Path) -> Iterator[str]:
+    data = _read_document(path)
+    if not data.startswith(b"%PDF"):
+        raise ExtractionError("Not a PDF document.")
+    document = _PdfDocument(data)
+    for page in document.pages():
+        yield _pdf_content_text(document, page)
+
+
+# --- Entry points ------------------------------------------------------------
+
+
+def iter_document_text(path: str | Path) -> Iterator[str]:
+    """Yields text chunks (pages, sections or slides) in document order."""
+    path = Path(path)
+    extension = path.suffix.lower()
+    if extension == ".pdf":
+        return _iter_pdf_text(path)
+    if extension == ".hwp":
+        return _iter_hwp_text(path)
+    if extension in _ZIP_PARTS:
+        return _iter_zip_text(path, extension)
+    raise ExtractionError(f"Unsupported document type: {extension or 'none'}")
+
+
+def extract_text(path: str | Path, max_chars: int = MAX_TEXT_CHARS) -> str:
+    chunks: list[str] = []
+    total = 0
+    for chunk in iter_document_text(path):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        chunks.append(chunk[: max_chars - total])
+        total += len(chunks[-1]) + 1
+        if total >= max_chars:
+            break
+    return "\n".join(chunks)
+
+
+_IMAGE_SIGNATURES = {
+    b"\x89PNG\r\n\x1a\n": "image/png",
+    b"\xff\xd8\xff": "image/jpeg",
+    b"GIF87a": "image/gif",
+    b"GIF89a": "image/gif",
+    b"BM": "image/bmp",
+}
+_ZIP_THUMBNAILS = (
+    "Preview/PrvImage.png",
+    "docProps/thumbnail.jpeg",
+    "docProps/thumbnail.jpg",
+    "docProps/thumbnail.png",
+)
+
+
+def _image_mime(data: bytes) -> Optional[str]:
+    for signature, mime in _IMAGE_SIGNATURES.items():
+        if data.startswith(signature):
+            return mime
+    return None
+
+
+def extract_thumbnail(path: str | Path) -> Optional[tuple[str, bytes]]:
+    """Returns the first-page image a document ships with, if any.
+
+    HWP stores one in its ``PrvImage`` stream and most zip-based formats keep
+    one under ``Preview/`` or ``docProps/``; PDFs need a renderer, so they
+    fall back to a text excerpt.
+    """
+    path = Path(path)
+    extension = path.suffix.lower()
+    data = b""
+    if extension == ".hwp":
+        ole = _OleFile(_read_document(path))
+        if "PrvImage" in ole.list_streams():
+            data = ole.read_stream("PrvImage")
+    elif extension in _ZIP_PARTS:
+        try:
+            with zipfile.ZipFile(path) as archive:
+                names = set(archive.namelist())
+                for candidate in _ZIP_THUMBNAILS:
+                    if candidate in names:
+                        info = archive.getinfo(candidate)
+                        if info.file_size <= MAX_THUMBNAIL_BYTES:
+                            data = archive.read(info)
+                        break
+        except zipfile.BadZipFile as exc:
+            raise ExtractionError(f"Invalid {extension} container.") from exc
+    mime = _image_mime(data)
+    if not mime or len(data) > MAX_THUMBNAIL_BYTES:
+        return None
+    return mime, data
+
+
+def extract_preview(
+    path: str | Path, max_chars: int
+) -> tuple[Optional[tuple[str, bytes]], str]:
+    """Thumbnail (when available) plus a short excerpt from the first pages."""
+    thumbnail = None
+    try:
+        thumbnail = extract_thumbnail(path)
+    except ExtractionError:
+        pass
+    return thumbnail, extract_text(path, max_chars=max_chars)
+
+
+def _limit_worker_memory():
+    try:
+        import resource
+    except ImportError:  # Not available on Windows.
+        return
+    resource.setrlimit(
+        resource.RLIMIT_AS, (WORKER_MEMORY_LIMIT_BYTES, WORKER_MEMORY_LIMIT_BYTES)
+    )
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned workers import only this module, never the app or its database.
+            _pool = ProcessPoolExecutor(
+                max_workers=WORKER_COUNT,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_limit_worker_memory,
+                max_tasks_per_child=TASKS_PER_WORKER,
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor, kill: bool = False):
+    # The next call starts a fresh pool. A worker stuck past the timeout keeps
+    # its slot until killed; tasks running beside it fail as crashed and retry.
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    if kill:
+        for process in list((pool._processes or {}).values()):
+            process.kill()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_in_pool(func, path: str | Path, *args):
+    pool = _get_pool()
+    try:
+        return pool.submit(func, str(path), *args).result(timeout=EXTRACTION_TIMEOUT_SECONDS)
+    except TimeoutError:
+        _discard_pool(pool, kill=True)
+        raise ExtractionError(
+            f"Extraction of {Path(path).name} took longer than {EXTRACTION_TIMEOUT_SECONDS} s."
+        ) from None
+    except BrokenProcessPool:
+        # A worker was killed (usually by the memory limit); start fresh next time.
+        _discard_pool(pool)
+        raise ExtractionError(f"Extraction worker crashed on {Path(path).name}.")
+
+
+def extract_text_in_pool(path: str | Path) -> str:
+    """Runs :func:`extract_text` in the shared process pool."""
+    return _run_in_pool(extract_text, path)
+
+
+def extract_preview_in_pool(
+    path: str | Path, max_chars: int
+) -> tuple[Optional[tuple[str, bytes]], str]:
+    return _run_in_pool(extract_preview, path, max_chars)
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,270 @@
+"""Bulk import of applicants and proposals from CSV or XLSX files.
+
+python -m app.services.imports users applicants.csv --credentials passwords.csv
+python -m app.services.imports proposals registry.xlsx
+"""
+
+import argparse
+import csv
+import datetime
+import io
+import logging
+import os
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator
+
+import bcrypt
+import reflex as rx
+
+from app.services.jobs import enqueue_post_submission
+from app.state import PROPOSAL_STATUSES, Proposal, User, db, temporary_password
+from app.states.proposal_state import proposal_field_errors
+
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 500
+# bcrypt releases the GIL, so threads hash on every core without extra processes.
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+USER_COLUMNS = ("email",)
+PROPOSAL_COLUMNS = (
+    "user_email",
+    "full_name",
+    "email",
+    "affiliation",
+    "phone_number",
+    "title",
+    "description",
+    "proposal_file",
+)
+TRUE_VALUES = {"1", "true", "yes", "y", "x"}
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportReport:
+    def __init__(self):
+        self.imported = 0
+        self.errors: list[tuple[int, str]] = []
+        self.credentials: list[tuple[str, str]] = []
+
+    def summary(self, noun: str) -> str:
+        text = f"Imported {self.imported} {noun}."
+        if self.errors:
+            text += f" {len(self.errors)} rows were skipped."
+        return text
+
+    def error_lines(self, limit: int = MAX_REPORTED_ERRORS) -> list[str]:
+        return [f"Row {row}: {message}" for row, message in self.errors[:limit]]
+
+    def credentials_csv(self) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["email", "temporary_password"])
+        writer.writerows(self.credentials)
+        return buffer.getvalue()
+
+
+def _column(name: Any) -> str:
+    return str(name or "").strip().lower().replace(" ", "_")
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return str(value).strip()
+
+
+def read_rows(
+    stream: BinaryIO, file_name: str, required: Iterable[str] = ()
+) -> Iterator[tuple[int, dict[str, str]]]:
+    """Streams (row number, row) pairs; row 1 is the header, blank rows are skipped."""
+    suffix = Path(file_name).suffix.lower()
+    if suffix == ".xlsx":
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError("XLSX import needs openpyxl (pip install openpyxl).") from None
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+        rows: Iterator[Any] = workbook.active.iter_rows(values_only=True)
+    elif suffix == ".csv":
+        rows = csv.reader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    else:
+        raise ValueError("Only .csv and .xlsx files can be imported.")
+    names = [_column(name) for name in next(rows, ())]
+    missing = [column for column in required if column not in names]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}.")
+    for number, values in enumerate(rows, start=2):
+        row = {name: _cell(value) for name, value in zip(names, values) if name}
+        if any(row.values()):
+            yield number, row
+
+
+def _batches(
+    rows: Iterable[tuple[int, dict[str, str]]], size: int
+) -> Iterator[list[tuple[int, dict[str, str]]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+def import_users(
+    rows: Iterable[tuple[int, dict[str, str]]],
+    actor: str = "",
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> ImportReport:
+    """Creates accounts with temporary passwords that must be changed at first sign-in."""
+    report = ImportReport()
+    seen: set[str] = set()
+    with ThreadPoolExecutor(HASH_WORKERS, thread_name_prefix="import-hash") as pool:
+        for batch in _batches(rows, batch_size):
+            candidates = []
+            for number, row in batch:
+                email = row.get("email", "")
+                if not re.match("[^@]+@[^@]+\\.[^@]+", email):
+                    report.errors.append((number, "Invalid email address."))
+                elif email in seen:
+                    report.errors.append((number, f"{email} appears more than once."))
+                else:
+                    seen.add(email)
+                    candidates.append((number, email, row.get("is_admin", "").lower() in TRUE_VALUES))
+            existing = db.existing_user_emails([email for _, email, _ in candidates])
+            for number, email, _ in candidates:
+                if email in existing:
+                    report.errors.append((number, f"{email} already has an account."))
+            candidates = [candidate for candidate in candidates if candidate[1] not in existing]
+            passwords = [temporary_password() for _ in candidates]
+            users = [
+                User(email, password_hash, is_admin=is_admin, must_reset_password=True)
+                for (_, email, is_admin), password_hash in zip(
+                    candidates, pool.map(_hash_password, passwords)
+                )
+            ]
+            try:
+                inserted = db.import_users(users, actor)
+            except Exception as exc:
+                logger.exception("User import batch failed")
+                report.errors.extend((number, f"Not saved: {exc}") for number, _, _ in candidates)
+                continue
+            report.imported += len(inserted)
+            # An account created since the check above keeps its own password.
+            for number, email, _ in candidates:
+                if email not in inserted:
+                    report.errors.append((number, f"{email} already has an account."))
+            report.credentials.extend(
+                (user.email, password)
+                for user, password in zip(users, passwords)
+                if user.email in inserted
+            )
+    report.errors.sort()
+    return report
+
+
+def _proposal_from_row(
+    row: dict[str, str], owners: set[str], upload_dir: Path
+) -> tuple[Proposal | None, str]:
+    values = {field: row.get(field, "") for field in PROPOSAL_COLUMNS}
+    errors = list(proposal_field_errors(values).values())
+    file_name = Path(values["proposal_file"]).name
+    if file_name and not (upload_dir / file_name).is_file():
+        errors.append(f"{file_name} is not in the upload directory.")
+    if values["user_email"] not in owners:
+        errors.append(f"No account found for {values['user_email'] or 'the owner'}.")
+    status = row.get("status") or "Submitted"
+    if status not in PROPOSAL_STATUSES:
+        errors.append(f"Unknown status {status}.")
+    created_at = row.get("created_at") or datetime.datetime.now().isoformat()
+    try:
+        created_at = datetime.datetime.fromisoformat(created_at).isoformat()
+    except ValueError:
+        errors.append("created_at must be an ISO date.")
+    if errors:
+        return None, " ".join(errors)
+    proposal = Proposal(
+        id=str(uuid.uuid4()),
+        created_at=created_at,
+        updated_at=created_at,
+        status=status,
+        review_results=row.get("review_results", ""),
+        file_hash="",
+        version=1,
+        **{**values, "proposal_file": file_name},
+    )
+    return proposal, ""
+
+
+def import_proposals(
+    rows: Iterable[tuple[int, dict[str, str]]],
+    actor: str = "",
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> ImportReport:
+    """Registers proposals whose documents are already in the upload directory."""
+    report = ImportReport()
+    upload_dir = rx.get_upload_dir()
+    for batch in _batches(rows, batch_size):
+        owners = db.existing_user_emails(
+            sorted({row.get("user_email", "") for _, row in batch})
+        )
+        proposals = []
+        numbers = []
+        for number, row in batch:
+            proposal, error = _proposal_from_row(row, owners, upload_dir)
+            if proposal:
+                proposals.append(proposal)
+                numbers.append(number)
+            else:
+                report.errors.append((number, error))
+        try:
+            report.imported += db.import_proposals(proposals, actor)
+        except Exception as exc:
+            logger.exception("Proposal import batch failed")
+            report.errors.extend((number, f"Not saved: {exc}") for number in numbers)
+            continue
+        for proposal in proposals:
+            enqueue_post_submission(proposal["id"], proposal["proposal_file"])
+    report.errors.sort()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import users or proposals.")
+    parser.add_argument("kind", choices=("users", "proposals"))
+    parser.add_argument("file", type=Path, help="a .csv or .xlsx file")
+    parser.add_argument("--actor", default="cli import", help="name recorded in the audit log")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    parser.add_argument(
+        "--credentials",
+        type=Path,
+        help="where to write temporary passwords for imported users",
+    )
+    args = parser.parse_args()
+    if args.kind == "users" and not args.credentials:
+        parser.error("--credentials is required when importing users.")
+    logging.basicConfig(level=logging.INFO)
+    with args.file.open("rb") as stream:
+        if args.kind == "users":
+            report = import_users(
+                read_rows(stream, args.file.name, USER_COLUMNS), args.actor, args.batch_size
+            )
+            args.credentials.write_text(report.credentials_csv())
+        else:
+            report = import_proposals(
+                read_rows(stream, args.file.name, PROPOSAL_COLUMNS), args.actor, args.batch_size
+            )
+    print(report.summary(args.kind))
+    for line in report.error_lines(limit=len(report.errors)):
+        print(line)
@@ -0,0 +1,228 @@
+"""SQLite-backed job queue for work that runs after a proposal is stored."""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from app.services import previews
+from app.services.startup import wait_for_startup
+from app.services.storage import locate_upload
+from app.state import Database, db
+
+
+logger = logging.getLogger(__name__)
+
+WORKER_COUNT = 2
+POLL_INTERVAL_SECONDS = 1.0
+RETRY_BASE_DELAY_SECONDS = 5.0
+STALE_JOB_SECONDS = 10 * 60
+HASH_CHUNK_SIZE = 1024 * 1024
+
+JobHandler = Callable[[str, dict[str, Any]], None]
+
+_handlers: dict[str, JobHandler] = {}
+_labels: dict[str, str] = {}
+_post_submission_kinds: list[str] = []
+
+
+def job_handler(kind: str, label: str, post_submission: bool = False):
+    """Registers a handler for a job kind.
+
+    Handlers receive the proposal id and the job payload. Raising marks the
+    attempt as failed and schedules a retry with exponential backoff.
+    """
+
+    def decorator(func: JobHandler) -> JobHandler:
+        _handlers[kind] = func
+        _labels[kind] = label
+        if post_submission and kind not in _post_submission_kinds:
+            _post_submission_kinds.append(kind)
+        return func
+
+    return decorator
+
+
+def job_label(kind: str) -> str:
+    return _labels.get(kind, kind.replace("_", " ").title())
+
+
+def enqueue_post_submission(
+    proposal_id: str, file_name: str, database: Optional[Database] = None
+) -> list[int]:
+    """Queues every post-submission job for a freshly stored upload.
+
+    Jobs go to ``database`` (the app database by default), next to the proposal.
+    """
+    database = db if database is None else database
+    return [
+        database.enqueue_job(proposal_id, kind, {"file_name": file_name})
+        for kind in _post_submission_kinds
+    ]
+
+
+def run_job(job: dict[str, Any]) -> bool:
+    """Executes a claimed job and records the outcome. Returns True on success."""
+    handler = _handlers.get(job["kind"])
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job kind '{job['kind']}'.")
+        handler(job["proposal_id"], job["payload"])
+    except Exception as exc:
+        delay = RETRY_BASE_DELAY_SECONDS * (2 ** max(job["attempts"] - 1, 0))
+        retrying = db.fail_job(job["id"], f"{type(exc).__name__}: {exc}", delay)
+        logger.warning(
+            "Job %s (%s) failed on attempt %s%s",
+            job["id"],
+            job["kind"],
+            job["attempts"],
+            ", will retry" if retrying else ", giving up",
+            exc_info=True,
+        )
+        return False
+    db.complete_job(job["id"])
+    return True
+
+
+class JobWorkerPool:
+    """Polls the jobs table from a small pool of daemon threads."""
+
+    def __init__(
+        self,
+        workers: int = WORKER_COUNT,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+    ):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self):
+        if self._threads:
+            return
+        db.requeue_stale_jobs(STALE_JOB_SECONDS)
+        self._stop.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"job-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run_once(self) -> bool:
+        """Processes a single due job, if any. Returns False when the queue is idle."""
+        job = db.claim_job()
+        if job is None:
+            return False
+        run_job(job)
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                busy = self.run_once()
+            except Exception:
+                logger.exception("Job worker loop error")
+                busy = False
+            if not busy:
+                self._stop.wait(self.poll_interval)
+
+
+@contextlib.asynccontextmanager
+async def job_workers():
+    """App lifespan hook that runs the worker pool alongside the backend."""
+    pool = JobWorkerPool()
+    stop = threading.Event()
+
+    def start():
+        if wait_for_startup(stop):
+            pool.start()
+
+    starter = threading.Thread(target=start, name="job-worker-start", daemon=True)
+    starter.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        await asyncio.to_thread(starter.join, 10)
+        await asyncio.to_thread(pool.stop)
+        from app.services import extraction
+
+        extraction.shutdown_pool()
+
+
+@job_handler("hash_file", "Checksum", post_submission=True)
+def hash_uploaded_file(proposal_id: str, payload: dict[str, Any]):
+    path = locate_upload(payload.get("file_name", ""))
+    if path is None:
+        raise FileNotFoundError(payload.get("file_name", ""))
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    file_hash = digest.hexdigest()
+    db.set_proposal_file_hash(proposal_id, file_hash)
+    if not previews.has_preview(file_hash):
+        db.enqueue_job(
+            proposal_id,
+            "preview",
+            {"file_name": payload.get("file_name", ""), "file_hash": file_hash},
+        )
+
+
+@job_handler("extract_text", "Text indexing", post_submission=True)
+def index_document_text(proposal_id: str, payload: dict[str, Any]):
+    # Loaded on first use: the process pool machinery and parsers are only
+    # needed where jobs run, not for compiling or serving pages.
+    from app.services import extraction
+
+    file_name = payload.get("file_name", "")
+    if Path(file_name).suffix.lower() not in extraction.SUPPORTED_EXTENSIONS:
+        # Legacy binary .doc/.ppt have no local extractor; clear any stale text.
+        db.index_proposal_document(proposal_id, "")
+        return
+    path = locate_upload(file_name)
+    if path is None:
+        raise FileNotFoundError(file_name)
+    db.index_proposal_document(proposal_id, extraction.extract_text_in_pool(path))
+
+
+@job_handler("preview", "Preview")
+def render_preview(proposal_id: str, payload: dict[str, Any]):
+    file_name = payload.get("file_name", "")
+    file_hash = payload.get("file_hash", "")
+    if not file_hash or previews.has_preview(file_hash):
+        return
+    from app.services import extraction
+
+    if Path(file_name).suffix.lower() not in extraction.SUPPORTED_EXTENSIONS:
+        return
+    path = locate_upload(file_name)
+    if path is None:
+        raise FileNotFoundError(file_name)
+    previews.build_preview(path, file_hash)
+
+
+if __name__ == "__main__":
+    # Standalone worker process: python -m app.services.jobs
+    logging.basicConfig(level=logging.INFO)
+    worker_pool = JobWorkerPool()
+    worker_pool.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        worker_pool.stop()
+        from app.services import extraction
+
+        extraction.shutdown_pool()
@@ -0,0 +1,158 @@
+"""Delivers the notification outbox to applicants as per-recipient email digests."""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import smtplib
+import threading
+from email.message import EmailMessage
+from typing import Any
+
+from app.services.startup import wait_for_startup
+from app.state import db
+
+
+logger = logging.getLogger(__name__)
+
+SMTP_HOST = os.environ.get("SMTP_HOST", "")
+SMTP_PORT = int(os.environ.get("SMTP_PORT", "25"))
+SMTP_USERNAME = os.environ.get("SMTP_USERNAME", "")
+SMTP_PASSWORD = os.environ.get("SMTP_PASSWORD", "")
+SMTP_STARTTLS = os.environ.get("SMTP_STARTTLS", "") == "1"
+SMTP_FROM = os.environ.get("SMTP_FROM", "no-reply@localhost")
+
+# Changes made within this window after a recipient's first pending message
+# are folded into the same digest.
+DIGEST_SETTLE_SECONDS = 60
+MAX_RECIPIENTS_PER_BATCH = 100
+DISPATCH_INTERVAL_SECONDS = 15
+MAX_SEND_ATTEMPTS = 5
+RETRY_BASE_DELAY_SECONDS = 60
+STALE_CLAIM_SECONDS = 10 * 60
+
+
+def compose_digest(recipient: str, messages: list[dict[str, Any]]) -> EmailMessage:
+    """One email covering every pending change for a recipient, latest state per proposal."""
+    latest: dict[str, dict[str, Any]] = {}
+    for message in messages:
+        latest[message["proposal_id"]] = message["payload"]
+    if len(latest) == 1:
+        (payload,) = latest.values()
+        subject = f'Update on your proposal "{payload["title"]}"'
+    else:
+        subject = f"Updates on {len(latest)} of your proposals"
+    lines = ["Hello,", "", "There are updates to your proposals:", ""]
+    for payload in latest.values():
+        lines.append(f'- "{payload["title"]}" is now {payload["status"]}.')
+        if payload.get("review_results"):
+            lines.append(f"  Review: {payload['review_results']}")
+    lines += ["", "You can see the details after signing in."]
+    email = EmailMessage()
+    email["From"] = SMTP_FROM
+    email["To"] = recipient
+    email["Subject"] = subject
+    email.set_content("\n".join(lines))
+    return email
+
+
+def _connect() -> smtplib.SMTP:
+    smtp = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+    if SMTP_STARTTLS:
+        smtp.starttls()
+    if SMTP_USERNAME:
+        smtp.login(SMTP_USERNAME, SMTP_PASSWORD)
+    return smtp
+
+
+def _retry_delay(attempts: int) -> float:
+    return RETRY_BASE_DELAY_SECONDS * 2 ** max(attempts - 1, 0)
+
+
+def dispatch_once(
+    settle_seconds: float = DIGEST_SETTLE_SECONDS, connect=_connect
+) -> int:
+    """Claims settled recipients and sends their digests over one SMTP connection.
+
+    Returns the number of digests delivered.
+    """
+    db.release_stale_notifications(STALE_CLAIM_SECONDS)
+    messages = db.claim_notifications(settle_seconds, MAX_RECIPIENTS_PER_BATCH)
+    if not messages:
+        return 0
+    by_recipient: dict[str, list[dict[str, Any]]] = {}
+    for message in messages:
+        by_recipient.setdefault(message["recipient"], []).append(message)
+
+    def fail(batch: list[dict[str, Any]], error: str):
+        attempts = max(message["attempts"] for message in batch)
+        db.fail_notifications(
+            [message["id"] for message in batch],
+            error,
+            _retry_delay(attempts),
+            MAX_SEND_ATTEMPTS,
+        )
+
+    try:
+        smtp = connect()
+    except (OSError, smtplib.SMTPException) as exc:
+        logger.warning("Could not connect to SMTP server: %s", exc)
+        fail(messages, str(exc))
+        return 0
+    batches = list(by_recipient.items())
+    delivered = 0
+    with smtp:
+        for index, (recipient, batch) in enumerate(batches):
+            try:
+                smtp.send_message(compose_digest(recipient, batch))
+            except (smtplib.SMTPServerDisconnected, OSError) as exc:
+                # The connection is gone; this and every later digest goes back.
+                logger.warning("SMTP connection lost: %s", exc)
+                for _, unsent in batches[index:]:
+                    fail(unsent, str(exc))
+                break
+            except smtplib.SMTPException as exc:
+                logger.warning("Could not notify %s: %s", recipient, exc)
+                fail(batch, str(exc))
+                continue
+            db.mark_notifications_sent([message["id"] for message in batch])
+            delivered += 1
+    return delivered
+
+
+@contextlib.asynccontextmanager
+async def notification_dispatcher():
+    """App lifespan hook that drains the outbox; idle when SMTP_HOST is unset."""
+    if not SMTP_HOST:
+        logger.info("SMTP_HOST not set; notifications stay in the outbox.")
+        yield
+        return
+    stop = threading.Event()
+
+    def run():
+        if not wait_for_startup(stop):
+            return
+        while not stop.is_set():
+            try:
+                dispatch_once()
+            except Exception:
+                logger.exception("Notification dispatch failed")
+            stop.wait(DISPATCH_INTERVAL_SECONDS)
+
+    thread = threading.Thread(target=run, name="notification-dispatcher", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        await asyncio.to_thread(thread.join, 10)
+
+
+if __name__ == "__main__":
+    # python -m app.services.notifications [--settle-seconds 60]
+    parser = argparse.ArgumentParser(description="Send pending notifications once.")
+    parser.add_argument("--settle-seconds", type=float, default=DIGEST_SETTLE_SECONDS)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    print(f"Delivered {dispatch_once(args.settle_seconds)} digests.")
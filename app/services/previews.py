@@ -0,0 +1,102 @@
+"""Disk cache of first-page previews, keyed by upload content hash."""
+
+import base64
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from app.state import Proposal, db
+
+
+PREVIEW_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "preview_cache"
+PREVIEW_CACHE_MAX_BYTES = 256 * 1024 * 1024
+EXCERPT_CHARS = 1500
+
+_eviction_lock = threading.Lock()
+
+
+def _cache_path(file_hash: str) -> Path:
+    return PREVIEW_CACHE_DIR / f"{file_hash}.json"
+
+
+def get_preview(file_hash: str) -> Optional[dict[str, str]]:
+    """Reads a cached preview and marks it as recently used."""
+    if not file_hash:
+        return None
+    path = _cache_path(file_hash)
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            preview = json.load(f)
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return preview
+
+
+def has_preview(file_hash: str) -> bool:
+    return bool(file_hash) and _cache_path(file_hash).exists()
+
+
+def build_preview(path: Path, file_hash: str) -> dict[str, str]:
+    """Renders the preview for an upload (in the extraction pool) and caches it."""
+    from app.services import extraction
+
+    thumbnail, excerpt = extraction.extract_preview_in_pool(path, EXCERPT_CHARS)
+    preview = {"image": "", "excerpt": excerpt}
+    if thumbnail:
+        mime, data = thumbnail
+        preview["image"] = f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+    PREVIEW_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    target = _cache_path(file_hash)
+    temp = target.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    with temp.open("w", encoding="utf-8") as f:
+        json.dump(preview, f, ensure_ascii=False)
+    os.replace(temp, target)
+    evict()
+    return preview
+
+
+def evict(max_bytes: int = PREVIEW_CACHE_MAX_BYTES) -> int:
+    """Drops least recently used previews until the cache fits in ``max_bytes``."""
+    with _eviction_lock:
+        entries = []
+        total = 0
+        try:
+            for entry in os.scandir(PREVIEW_CACHE_DIR):
+                if not entry.name.endswith(".json"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        except OSError:
+            return 0
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+
+def ensure_preview(proposal: Optional[Proposal]):
+    """Queues preview generation for a proposal whose preview is not cached yet."""
+    if not proposal or not proposal.get("proposal_file"):
+        return
+    file_hash = proposal.get("file_hash", "")
+    # Without a hash the checksum job is still pending and will chain the preview.
+    if not file_hash or has_preview(file_hash):
+        return
+    if db.has_pending_job(proposal["id"], "preview"):
+        return
+    db.enqueue_job(
+        proposal["id"],
+        "preview",
+        {"file_name": proposal["proposal_file"], "file_hash": file_hash},
+    )
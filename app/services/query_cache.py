@@ -0,0 +1,90 @@
+"""Query results shared by every session in the process, computed once per change.
+
+Keys include the version of the tables a result was read from (see
+``Database.table_version``), so a write in any worker makes the old entries
+unreachable and they age out of the LRU. When several sessions ask for the
+same missing key at once, one of them runs the query and the others wait for
+its result instead of running it too.
+
+This coordination is per process only. After a write every worker finds its
+entries stale and runs the query once for itself, so N workers cost N
+queries per version and key, not one. Those are single indexed pages or
+counts, and sharing them across workers would need a write to the database
+(or another store) on every miss, which costs more than the read it saves.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+SHARED_QUERY_CACHE_SIZE = 256
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SharedQueryCache:
+    def __init__(self, size: int = SHARED_QUERY_CACHE_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._results: OrderedDict[Hashable, Any] = OrderedDict()
+        self._in_flight: dict[Hashable, _Flight] = {}
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """A private copy of the cached result for ``key``, computing it at most once at a time.
+
+        Sessions may mutate what they get back without affecting each other.
+        """
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._results[key])
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+                self.misses += 1
+            else:
+                self.waits += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.value)
+        try:
+            flight.value = compute()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                if flight.error is None:
+                    self._results[key] = flight.value
+                    while len(self._results) > self.size:
+                        self._results.popitem(last=False)
+            flight.done.set()
+        return copy.deepcopy(flight.value)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._results),
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
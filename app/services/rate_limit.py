@@ -0,0 +1,176 @@
+"""Token-bucket rate limiting and lockouts for sign-in and password resets."""
+
+import os
+import threading
+import time
+from typing import Any, Callable, NamedTuple
+
+
+class RateLimitPolicy(NamedTuple):
+    name: str
+    capacity: int
+    per_seconds: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.per_seconds
+
+
+SIGNIN_PER_IP = RateLimitPolicy("signin.ip", 20, 60)
+SIGNIN_PER_ACCOUNT = RateLimitPolicy("signin.account", 10, 5 * 60)
+RESET_PER_IP = RateLimitPolicy("reset.ip", 5, 60 * 60)
+RESET_PER_ACCOUNT = RateLimitPolicy("reset.account", 3, 60 * 60)
+
+# Consecutive failed sign-ins before an account is locked, and the lockout
+# length, which doubles with every further failure up to the cap.
+LOCKOUT_THRESHOLD = 5
+LOCKOUT_BASE_SECONDS = 30
+LOCKOUT_MAX_SECONDS = 15 * 60
+
+# "memory" keeps counters per process; "database" shares them between workers.
+RATE_LIMIT_BACKEND = os.environ.get("RATE_LIMIT_BACKEND", "memory")
+
+_MEMORY_PRUNE_SIZE = 10_000
+
+
+def _lockout_seconds(failures: int) -> float:
+    if failures < LOCKOUT_THRESHOLD:
+        return 0.0
+    exponent = min(failures - LOCKOUT_THRESHOLD, 16)
+    return min(LOCKOUT_BASE_SECONDS * 2**exponent, LOCKOUT_MAX_SECONDS)
+
+
+class MemoryStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+        # key -> (failures, locked_until, time of the last failure)
+        self._failures: dict[str, tuple[int, float, float]] = {}
+
+    def take_token(
+        self, key: str, capacity: float, refill_per_second: float, now: float
+    ) -> float:
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            elapsed = max(now - updated_at, 0.0)
+            tokens = min(capacity, tokens + elapsed * refill_per_second)
+            retry_after = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                retry_after = (1 - tokens) / refill_per_second
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > _MEMORY_PRUNE_SIZE:
+                self._prune(now)
+        return retry_after
+
+    def _prune(self, now: float):
+        # Buckets idle for an hour have refilled under every policy above, and
+        # failure counts are forgotten an hour after the last failure unless
+        # the account is still locked.
+        self._buckets = {
+            key: value
+            for key, value in self._buckets.items()
+            if now - value[1] < 60 * 60
+        }
+        self._failures = {
+            key: value
+            for key, value in self._failures.items()
+            if value[1] > now or now - value[2] < 60 * 60
+        }
+
+    def get_lockout(self, key: str) -> tuple[int, float]:
+        with self._lock:
+            failures, locked_until, _ = self._failures.get(key, (0, 0.0, 0.0))
+        return failures, locked_until
+
+    def set_lockout(self, key: str, failures: int, locked_until: float):
+        with self._lock:
+            if failures <= 0:
+                self._failures.pop(key, None)
+            else:
+                self._failures[key] = (failures, locked_until, time.time())
+
+    def add_failure(
+        self, key: str, lockout_for: Callable[[int], float], now: float
+    ) -> float:
+        with self._lock:
+            failures = self._failures.get(key, (0, 0.0, now))[0] + 1
+            lockout = lockout_for(failures)
+            self._failures[key] = (failures, now + lockout if lockout else 0.0, now)
+            if len(self._failures) > _MEMORY_PRUNE_SIZE:
+                self._prune(now)
+        return lockout
+
+
+class DatabaseStore:
+    """Keeps counters in the application database so every worker sees them."""
+
+    def __init__(self, database: Any):
+        self.db = database
+        self._calls = 0
+
+    def take_token(
+        self, key: str, capacity: float, refill_per_second: float, now: float
+    ) -> float:
+        self._calls += 1
+        if self._calls % 1000 == 0:
+            self.db.prune_rate_limits(now - 60 * 60)
+        return self.db.take_rate_limit_token(key, capacity, refill_per_second, now)
+
+    def get_lockout(self, key: str) -> tuple[int, float]:
+        return self.db.get_auth_lockout(key)
+
+    def set_lockout(self, key: str, failures: int, locked_until: float):
+        self.db.set_auth_lockout(key, failures, locked_until)
+
+    def add_failure(
+        self, key: str, lockout_for: Callable[[int], float], now: float
+    ) -> float:
+        return self.db.add_auth_failure(key, lockout_for, now)
+
+
+class RateLimiter:
+    def __init__(self, store=None):
+        self.store = store or MemoryStore()
+
+    def admit(self, *checks: tuple[RateLimitPolicy, str]) -> float:
+        """Takes a token from each bucket in order, stopping at the first that is empty.
+
+        Returns 0 when the attempt may proceed, otherwise seconds to wait.
+        """
+        now = time.time()
+        for policy, key in checks:
+            retry_after = self.store.take_token(
+                f"{policy.name}:{key}",
+                policy.capacity,
+                policy.refill_per_second,
+                now,
+            )
+            if retry_after > 0:
+                return retry_after
+        return 0.0
+
+    def lockout_remaining(self, account: str) -> float:
+        _, locked_until = self.store.get_lockout(f"lockout:{account}")
+        return max(locked_until - time.time(), 0.0)
+
+    def record_failure(self, account: str) -> float:
+        """Counts a failed sign-in and returns the resulting lockout in seconds."""
+        return self.store.add_failure(f"lockout:{account}", _lockout_seconds, time.time())
+
+    def record_success(self, account: str):
+        self.store.set_lockout(f"lockout:{account}", 0, 0.0)
+
+
+def retry_message(seconds: float) -> str:
+    seconds = max(int(seconds + 0.999), 1)
+    if seconds >= 120:
+        return f"Too many attempts. Please try again in {seconds // 60} minutes."
+    return f"Too many attempts. Please try again in {seconds} seconds."
+
+
+def build_limiter(database: Any) -> RateLimiter:
+    if RATE_LIMIT_BACKEND == "database":
+        return RateLimiter(DatabaseStore(database))
+    return RateLimiter(MemoryStore())
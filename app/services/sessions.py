@@ -0,0 +1,101 @@
+"""Server-side sign-in sessions with sliding expiry, revocation and an LRU cache."""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+# Sessions end after this much inactivity.
+SESSION_TTL_SECONDS = 7 * 24 * 60 * 60
+# The browser may keep the token longer; the server decides when it is dead.
+SESSION_COOKIE_MAX_AGE = 90 * 24 * 60 * 60
+# Activity pushes the expiry forward at most this often, so reads rarely write.
+SESSION_EXTEND_INTERVAL_SECONDS = 5 * 60
+# How long a cached session is trusted before the database is asked again. This
+# bounds how late a revocation made by another worker takes effect here.
+SESSION_CACHE_SECONDS = 60
+SESSION_CACHE_SIZE = 4096
+
+
+class SessionStore:
+    def __init__(
+        self,
+        database: Any,
+        ttl: float = SESSION_TTL_SECONDS,
+        cache_seconds: float = SESSION_CACHE_SECONDS,
+        cache_size: int = SESSION_CACHE_SIZE,
+    ):
+        self.db = database
+        self.ttl = ttl
+        self.cache_seconds = cache_seconds
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        # token -> (email, expires_at, checked_at), least recently used first.
+        self._cache: OrderedDict[str, tuple[str, float, float]] = OrderedDict()
+        self._created = 0
+
+    def _remember(self, token: str, email: str, expires_at: float, checked_at: float):
+        with self._lock:
+            self._cache[token] = (email, expires_at, checked_at)
+            self._cache.move_to_end(token)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _forget(self, token: str):
+        with self._lock:
+            self._cache.pop(token, None)
+
+    def create(self, email: str) -> str:
+        token = secrets.token_urlsafe(32)
+        now = time.time()
+        self.db.create_session(token, email, now + self.ttl)
+        self._remember(token, email, now + self.ttl, now)
+        self._created += 1
+        if self._created % 1000 == 0:
+            self.db.prune_sessions(now)
+        return token
+
+    def resolve(self, token: str) -> Optional[str]:
+        """The signed-in email for ``token``, or None if it expired or was revoked."""
+        if not token:
+            return None
+        now = time.time()
+        with self._lock:
+            cached = self._cache.get(token)
+            if cached:
+                self._cache.move_to_end(token)
+        if cached and now - cached[2] < self.cache_seconds and cached[1] > now:
+            return cached[0]
+        session = self.db.get_session(token)
+        if not session or session[1] <= now:
+            self._forget(token)
+            if session:
+                self.db.delete_session(token)
+            return None
+        email, expires_at = session
+        if now + self.ttl - expires_at > SESSION_EXTEND_INTERVAL_SECONDS:
+            expires_at = now + self.ttl
+            if not self.db.extend_session(token, expires_at):
+                self._forget(token)
+                return None
+        self._remember(token, email, expires_at, now)
+        return email
+
+    def revoke(self, token: str):
+        if token:
+            self.db.delete_session(token)
+            self._forget(token)
+
+    def revoke_user(self, email: str, keep: Optional[str] = None) -> int:
+        """Signs ``email`` out everywhere except the session for token ``keep``."""
+        revoked = self.db.delete_user_sessions(email, keep)
+        with self._lock:
+            for token in [
+                token
+                for token, (owner, _, _) in self._cache.items()
+                if owner == email and token != keep
+            ]:
+                del self._cache[token]
+        return revoked
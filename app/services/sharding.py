@@ -0,0 +1,156 @@
+"""Resharding and a write benchmark for DATABASE_SHARDS.
+
+python -m app.services.sharding reshard --from 1 --to 4 [--db proposal_app.db]
+python -m app.services.sharding bench [--shards 1 2 4 8] [--processes 8]
+
+Resharding moves every user, with their proposals, jobs, audit trail,
+pending notifications and document text, to the shard its email hashes to
+among the new count. Stop the app first, then start it again with
+DATABASE_SHARDS set to the new count. The moves are logged in each shard's
+change log like any other write, so change feeds keep working.
+"""
+
+import argparse
+import datetime
+import multiprocessing
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from app.state import (
+    DATABASE_PATH,
+    Database,
+    Proposal,
+    ShardedDatabase,
+    User,
+    shard_for_email,
+    shard_path,
+)
+
+
+BENCH_SHARD_COUNTS = (1, 2, 4, 8)
+# Writers are separate processes, like app workers, each with its own connections.
+BENCH_PROCESSES = 8
+BENCH_USERS_PER_PROCESS = 100
+
+
+def reshard(old: int, new: int, db_path: Path = DATABASE_PATH) -> dict[str, int]:
+    """Moves rows from ``old`` shard files to where they belong among ``new``.
+
+    Returns how many rows of each table moved. Shard files at or above
+    ``new`` are left empty of users and proposals and can be deleted.
+    """
+    shards = [Database(shard_path(db_path, index)) for index in range(max(old, new))]
+    for shard in shards:
+        shard.open()
+    totals: dict[str, int] = {}
+    for index, shard in enumerate(shards[:old]):
+        targets: dict[int, list[str]] = {}
+        for email in shard.get_owner_emails():
+            target = shard_for_email(email, new)
+            if target != index:
+                targets.setdefault(target, []).append(email)
+        for target, emails in sorted(targets.items()):
+            moved = shard.move_user_rows(emails, shard_path(db_path, target))
+            for table, count in moved.items():
+                totals[table] = totals.get(table, 0) + count
+    return totals
+
+
+def _bench_proposal(email: str) -> Proposal:
+    now = datetime.datetime.now().isoformat()
+    return Proposal(
+        id=str(uuid.uuid4()),
+        user_email=email,
+        full_name="Benchmark",
+        email=email,
+        affiliation="Benchmark",
+        phone_number="000",
+        title="Benchmark proposal",
+        description="Written by the sharding benchmark.",
+        proposal_file="",
+        created_at=now,
+        updated_at=now,
+        status="Submitted",
+        review_results="",
+        file_hash="",
+        version=1,
+    )
+
+
+def _bench_worker(path: Path, count: int, worker: int, users: int, ready, start, done):
+    database = ShardedDatabase(path, count) if count > 1 else Database(path)
+    database.open()
+    ready.put(worker)
+    start.wait()
+    for number in range(users):
+        email = f"bench-{worker}-{number}@example.com"
+        database.add_user(User(email, "x"))
+        database.add_proposal(_bench_proposal(email))
+    done.put(worker)
+
+
+def benchmark(
+    counts: tuple[int, ...] = BENCH_SHARD_COUNTS,
+    processes: int = BENCH_PROCESSES,
+    users_per_process: int = BENCH_USERS_PER_PROCESS,
+) -> list[tuple[int, float]]:
+    """Writes/s for concurrent signups plus first proposals, per shard count.
+
+    Each run uses fresh files in a scratch directory and one writer process
+    per simulated app worker.
+    """
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for count in counts:
+        with tempfile.TemporaryDirectory(prefix="shard-bench-") as scratch:
+            path = Path(scratch) / "bench.db"
+            ready, done, start = context.Queue(), context.Queue(), context.Event()
+            workers = [
+                context.Process(
+                    target=_bench_worker,
+                    args=(path, count, worker, users_per_process, ready, start, done),
+                )
+                for worker in range(processes)
+            ]
+            for worker in workers:
+                worker.start()
+            for _ in workers:
+                ready.get()
+            started = time.perf_counter()
+            start.set()
+            for _ in workers:
+                done.get()
+            elapsed = time.perf_counter() - started
+            for worker in workers:
+                worker.join()
+                if worker.exitcode:
+                    raise RuntimeError(f"Benchmark worker exited with {worker.exitcode}.")
+            results.append((count, processes * users_per_process * 2 / elapsed))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reshard the database or benchmark sharding.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    move = commands.add_parser("reshard", help="move rows to a new shard count (app stopped)")
+    move.add_argument("--from", dest="old", type=int, required=True)
+    move.add_argument("--to", dest="new", type=int, required=True)
+    move.add_argument("--db", type=Path, default=DATABASE_PATH)
+    bench = commands.add_parser("bench", help="measure write throughput per shard count")
+    bench.add_argument("--shards", type=int, nargs="+", default=list(BENCH_SHARD_COUNTS))
+    bench.add_argument("--processes", type=int, default=BENCH_PROCESSES)
+    bench.add_argument("--users", type=int, default=BENCH_USERS_PER_PROCESS, help="per process")
+    args = parser.parse_args()
+    if args.command == "reshard":
+        moved = reshard(args.old, args.new, args.db)
+        print(", ".join(f"{table}: {count}" for table, count in moved.items()) or "Nothing to move.")
+        for index in range(args.new, args.old):
+            print(f"{shard_path(args.db, index)} no longer holds users and can be removed.")
+        print(f"Start the app with DATABASE_SHARDS={args.new}.")
+    else:
+        baseline = None
+        for count, rate in benchmark(tuple(args.shards), args.processes, args.users):
+            baseline = baseline or rate
+            print(f"{count:>3} shards  {rate:>9.0f} writes/s  {rate / baseline:>5.2f}x")
@@ -0,0 +1,248 @@
+"""Upload store helpers and reconciliation of files against proposal rows."""
+
+import argparse
+import asyncio
+import contextlib
+import heapq
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import reflex as rx
+
+from app.services.startup import wait_for_startup
+from app.state import db
+
+
+logger = logging.getLogger(__name__)
+
+PROJECT_UPLOAD_DIR = Path(__file__).resolve().parent.parent.parent / "uploaded_files"
+ORPHAN_GRACE_SECONDS = 24 * 60 * 60
+RECONCILE_BATCH_SIZE = 500
+RECONCILE_INTERVAL_SECONDS = 60 * 60
+RECONCILE_DELETE_ORPHANS = False
+
+_FILE_CURSOR_KEY = "reconcile.file_cursor"
+_ROW_CURSOR_KEY = "reconcile.row_cursor"
+
+
+def upload_dirs() -> list[Path]:
+    """Directories an upload may live in, deduplicated, configured dir first."""
+    dirs: list[Path] = []
+    for base in (rx.get_upload_dir(), PROJECT_UPLOAD_DIR):
+        try:
+            resolved = Path(base).resolve()
+        except Exception:
+            continue
+        if resolved not in dirs:
+            dirs.append(resolved)
+    return dirs
+
+
+def _candidate_paths(file_name: str) -> list[Path]:
+    paths = []
+    for base in upload_dirs():
+        path = (base / file_name).resolve()
+        # Never follow names that escape the upload directory.
+        if path.parent == base:
+            paths.append(path)
+    return paths
+
+
+def locate_upload(file_name: str) -> Optional[Path]:
+    if not file_name:
+        return None
+    for path in _candidate_paths(file_name):
+        if path.is_file():
+            return path
+    return None
+
+
+def remove_upload(file_name: str) -> bool:
+    """Deletes an upload from every candidate directory.
+
+    Returns False when a copy could not be removed; the reconciler will pick
+    it up later as an orphan.
+    """
+    if not file_name:
+        return True
+    removed_all = True
+    for path in _candidate_paths(file_name):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            logger.warning("Could not remove upload %s", path, exc_info=True)
+            removed_all = False
+    return removed_all
+
+
+def _first_names_after(base: Path, after: str, limit: int) -> list[str]:
+    try:
+        with os.scandir(base) as entries:
+            # Keeps only ``limit`` names in memory however large the directory is.
+            return heapq.nsmallest(
+                limit,
+                (
+                    entry.name
+                    for entry in entries
+                    if entry.name > after
+                    and not entry.name.startswith(".")
+                    and entry.is_file(follow_symlinks=False)
+                ),
+            )
+    except FileNotFoundError:
+        return []
+
+
+def _iter_upload_names(after: str, limit: int) -> list[str]:
+    # The first ``limit`` names overall are among the first ``limit`` of each
+    # directory; the union also drops names present in both directories.
+    names: set[str] = set()
+    for base in upload_dirs():
+        names.update(_first_names_after(base, after, limit))
+    return sorted(names)[:limit]
+
+
+def reconcile_batch(
+    batch_size: int = RECONCILE_BATCH_SIZE,
+    grace_seconds: float = ORPHAN_GRACE_SECONDS,
+    delete: bool = RECONCILE_DELETE_ORPHANS,
+    scan_files: bool = True,
+    scan_rows: bool = True,
+) -> dict[str, Any]:
+    """Checks the next batch of files and of proposal rows, then saves the cursors.
+
+    Files are visited in name order and rows in id order, so a batch that is
+    interrupted simply resumes from the last saved position. ``files_done`` and
+    ``rows_done`` report when the respective scan has wrapped around.
+    """
+    file_cursor = db.get_maintenance_value(_FILE_CURSOR_KEY)
+    names = _iter_upload_names(file_cursor, batch_size) if scan_files else []
+    referenced = db.get_referenced_files(names)
+    cutoff = time.time() - grace_seconds
+    orphans: list[str] = []
+    removed: list[str] = []
+    for name in names:
+        if name in referenced:
+            continue
+        path = locate_upload(name)
+        if path is None:
+            continue
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue  # Possibly an upload whose proposal row is still being written.
+        except OSError:
+            continue
+        orphans.append(name)
+        # Re-check right before deleting in case a proposal adopted the file meanwhile.
+        if delete and not db.get_referenced_files([name]) and remove_upload(name):
+            removed.append(name)
+    files_done = len(names) < batch_size
+    if scan_files:
+        db.set_maintenance_value(_FILE_CURSOR_KEY, "" if files_done else names[-1])
+
+    row_cursor = db.get_maintenance_value(_ROW_CURSOR_KEY)
+    rows = db.get_proposal_files_after(row_cursor, batch_size) if scan_rows else []
+    missing = [
+        {"proposal_id": proposal_id, "proposal_file": file_name}
+        for proposal_id, file_name in rows
+        if file_name and locate_upload(file_name) is None
+    ]
+    rows_done = len(rows) < batch_size
+    if scan_rows:
+        db.set_maintenance_value(_ROW_CURSOR_KEY, "" if rows_done else rows[-1][0])
+
+    for name in orphans:
+        logger.info("Orphaned upload %s%s", name, " (removed)" if name in removed else "")
+    for row in missing:
+        logger.warning(
+            "Proposal %s references missing file %s",
+            row["proposal_id"],
+            row["proposal_file"],
+        )
+    return {
+        "files_checked": len(names),
+        "rows_checked": len(rows),
+        "orphans": orphans,
+        "removed": removed,
+        "missing": missing,
+        "files_done": files_done,
+        "rows_done": rows_done,
+    }
+
+
+def reconcile_uploads(
+    batch_size: int = RECONCILE_BATCH_SIZE,
+    grace_seconds: float = ORPHAN_GRACE_SECONDS,
+    delete: bool = RECONCILE_DELETE_ORPHANS,
+    stop: Optional[threading.Event] = None,
+) -> dict[str, Any]:
+    """Runs batches until a full pass over files and rows has completed."""
+    totals: dict[str, Any] = {
+        "files_checked": 0,
+        "rows_checked": 0,
+        "orphans": [],
+        "removed": [],
+        "missing": [],
+    }
+    scan_files = scan_rows = True
+    while (scan_files or scan_rows) and (stop is None or not stop.is_set()):
+        result = reconcile_batch(
+            batch_size, grace_seconds, delete, scan_files, scan_rows
+        )
+        for key in ("files_checked", "rows_checked"):
+            totals[key] += result[key]
+        for key in ("orphans", "removed", "missing"):
+            totals[key].extend(result[key])
+        scan_files = scan_files and not result["files_done"]
+        scan_rows = scan_rows and not result["rows_done"]
+    return totals
+
+
+@contextlib.asynccontextmanager
+async def storage_reconciler():
+    """App lifespan hook that reconciles the upload store periodically."""
+    stop = threading.Event()
+
+    def run():
+        if not wait_for_startup(stop):
+            return
+        while not stop.is_set():
+            try:
+                reconcile_uploads(stop=stop)
+            except Exception:
+                logger.exception("Upload reconciliation failed")
+            stop.wait(RECONCILE_INTERVAL_SECONDS)
+
+    thread = threading.Thread(target=run, name="upload-reconciler", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        await asyncio.to_thread(thread.join, 10)
+
+
+if __name__ == "__main__":
+    # python -m app.services.storage [--delete] [--grace-hours 24] [--batch-size 500]
+    parser = argparse.ArgumentParser(description="Reconcile uploads with proposals.")
+    parser.add_argument("--delete", action="store_true", help="remove orphaned files")
+    parser.add_argument(
+        "--grace-hours", type=float, default=ORPHAN_GRACE_SECONDS / 3600
+    )
+    parser.add_argument("--batch-size", type=int, default=RECONCILE_BATCH_SIZE)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    report = reconcile_uploads(
+        batch_size=args.batch_size,
+        grace_seconds=args.grace_hours * 3600,
+        delete=args.delete,
+    )
+    print(
+        f"Checked {report['files_checked']} files and {report['rows_checked']} proposals: "
+        f"{len(report['orphans'])} orphaned, {len(report['removed'])} removed, "
+        f"{len(report['missing'])} proposals missing their file."
+    )
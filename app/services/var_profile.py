@@ -0,0 +1,157 @@
+"""Computed vars with explicit dependencies, and a report of how often they recompute.
+
+Every computed var in the app is declared with ``@cached_var(...deps)``: it is
+cached and recomputed only when one of the listed vars changes. With
+``VAR_PROFILE=1`` each recomputation is also timed, attributed to the event
+being processed, and the totals are logged every VAR_PROFILE_LOG_SECONDS. A
+recomputation that returned the value already cached is counted as wasted.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable
+
+import reflex as rx
+from reflex.middleware import Middleware
+from reflex.vars.base import ComputedVar, Var
+
+
+logger = logging.getLogger(__name__)
+
+VAR_PROFILE_ENABLED = os.environ.get("VAR_PROFILE", "") not in ("", "0")
+VAR_PROFILE_LOG_SECONDS = float(os.environ.get("VAR_PROFILE_LOG_SECONDS", "60"))
+VAR_PROFILE_REPORT_ROWS = 30
+
+_NO_EVENT = "(initial state)"
+_MISSING = object()
+_current_event: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "var_profile_event", default=_NO_EVENT
+)
+_lock = threading.Lock()
+# (event, "State.var") -> [recomputes, wasted, seconds]
+_stats: dict[tuple[str, str], list[float]] = {}
+_event_counts: dict[str, int] = {}
+# state -> {var: value it last computed}. Reflex drops its own cached value
+# before recomputing, so the previous one is kept here, off the state, where
+# it is neither pickled nor sent to the client. A state restored from Redis is
+# a new instance, so its first recomputation is never counted as wasted.
+_last_values: "weakref.WeakKeyDictionary[Any, dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _timed(fget: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    name = fget.__name__
+
+    @functools.wraps(fget)
+    def wrapper(self):
+        started = time.perf_counter()
+        value = fget(self)
+        elapsed = time.perf_counter() - started
+        key = (_current_event.get(), f"{type(self).__name__}.{name}")
+        with _lock:
+            last = _last_values.setdefault(self, {})
+            previous = last.get(name, _MISSING)
+            last[name] = value
+            entry = _stats.setdefault(key, [0, 0, 0.0])
+            entry[0] += 1
+            entry[1] += previous is not _MISSING and previous == value
+            entry[2] += elapsed
+        return value
+
+    return wrapper
+
+
+def cached_var(*deps: str | Var) -> Callable[[Callable[[Any], Any]], ComputedVar]:
+    """``@rx.var`` that is cached and depends only on ``deps``.
+
+    ``deps`` are var names on the same state, or vars of another state such
+    as ``AuthState.authenticated_user``. Vars the function reads that are not
+    listed do not trigger a recomputation.
+    """
+
+    def decorator(fget: Callable[[Any], Any]) -> ComputedVar:
+        return rx.var(
+            _timed(fget) if VAR_PROFILE_ENABLED else fget,
+            cache=True,
+            deps=list(deps),
+            auto_deps=False,
+        )
+
+    return decorator
+
+
+class VarProfileMiddleware(Middleware):
+    """Tags recomputations with the name of the event that caused them."""
+
+    async def preprocess(self, app, state, event):
+        # "...app___states___admin_state____admin_state.refresh" -> "admin_state.refresh"
+        state_name, _, handler = event.name.rpartition(".")
+        name = f"{state_name.rpartition('____')[2]}.{handler}" if state_name else handler
+        _current_event.set(name)
+        with _lock:
+            _event_counts[name] = _event_counts.get(name, 0) + 1
+        return None
+
+
+def report(limit: int = VAR_PROFILE_REPORT_ROWS) -> list[dict[str, Any]]:
+    """The most expensive (event, var) pairs, by total recompute time."""
+    with _lock:
+        rows = [
+            {
+                "event": event,
+                "var": var,
+                "events": _event_counts.get(event, 0),
+                "recomputes": int(recomputes),
+                "wasted": int(wasted),
+                "total_ms": seconds * 1000,
+                "mean_ms": seconds * 1000 / recomputes if recomputes else 0.0,
+            }
+            for (event, var), (recomputes, wasted, seconds) in _stats.items()
+        ]
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows[:limit]
+
+
+def format_report(rows: list[dict[str, Any]]) -> str:
+    lines = [
+        f"{'event':<32} {'var':<44} {'events':>7} {'recomp':>7} {'wasted':>7} {'total ms':>10} {'mean ms':>8}"
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['event'][:32]:<32} {row['var'][:44]:<44} {row['events']:>7} "
+            f"{row['recomputes']:>7} {row['wasted']:>7} {row['total_ms']:>10.1f} {row['mean_ms']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+        _event_counts.clear()
+
+
+@contextlib.asynccontextmanager
+async def var_profile_reporter():
+    """App lifespan hook that logs the recompute report while VAR_PROFILE is on."""
+
+    async def run():
+        while True:
+            await asyncio.sleep(VAR_PROFILE_LOG_SECONDS)
+            rows = report()
+            if rows:
+                logger.info("Computed var recomputes:\n%s", format_report(rows))
+
+    task = asyncio.create_task(run())
+    try:
+        yield
+    finally:
+        task.cancel()
+        rows = report()
+        if rows:
+            logger.info("Computed var recomputes:\n%s", format_report(rows))
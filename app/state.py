@@ -1,14 +1,37 @@
 import reflex as rx
 import re
 import bcrypt
-from typing import Any, Optional, TypedDict
+from typing import Any, Callable, Iterable, Iterator, Optional, TypedDict
 import datetime
+import json
 import uuid
 import sqlite3
 import threading
+import time
 from pathlib import Path
 import secrets
 import string
+import contextlib
+import hashlib
+import heapq
+import itertools
+import os
+from collections import OrderedDict
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+from app.services.admission import AdmissionQueue, LoadShedder
+from app.services.sessions import SESSION_COOKIE_MAX_AGE, SessionStore
+from app.services.var_profile import cached_var
+from app.services.rate_limit import (
+    RESET_PER_ACCOUNT,
+    RESET_PER_IP,
+    SIGNIN_PER_ACCOUNT,
+    SIGNIN_PER_IP,
+    build_limiter,
+    retry_message,
+)
 
 
 class User:
@@ -33,81 +56,664 @@ class Proposal(TypedDict):
     updated_at: str
     status: str
     review_results: str
+    file_hash: str
+    version: int
+
+
+class Change(TypedDict):
+    offset: int
+    table: str
+    op: str
+    key: str
+    version: Optional[int]
+    changed_at: float
+
+
+class StaleProposalError(Exception):
+    """The proposal changed after the caller read the version it is editing."""
+
+    def __init__(self, current: Proposal):
+        super().__init__("The proposal was changed by someone else.")
+        self.current = current
+
+
+class ChangeLogTruncatedError(Exception):
+    """Records after the requested offset were dropped by change log retention."""
+
+    def __init__(self, truncated_through: int):
+        super().__init__(f"Change log records up to {truncated_through} were expired.")
+        self.truncated_through = truncated_through
+
+
+AUDITED_PROPOSAL_FIELDS = (
+    "full_name",
+    "email",
+    "affiliation",
+    "phone_number",
+    "title",
+    "description",
+    "proposal_file",
+    "status",
+    "review_results",
+)
+
+
+def _audit_value(value: Any) -> str:
+    if value in (None, ""):
+        return "(empty)"
+    text = str(value)
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+# Bump whenever _migrate gains a statement so existing databases pick it up.
+SCHEMA_VERSION = 8
+# Tables whose table_versions row is bumped by a trigger on every change.
+VERSIONED_TABLES = ("proposals", "users")
+# Tables whose changes triggers append to change_log: (key column, version column).
+CHANGE_LOG_TABLES = {"proposals": ("id", "version"), "users": ("email", None)}
+CHANGE_LOG_READ_LIMIT = 1000
+# maintenance_state key holding the highest offset dropped by retention.
+CHANGE_LOG_TRUNCATED_KEY = "change_log_truncated_through"
+# Proposal rows kept in memory by id, least recently used evicted first.
+PROPOSAL_CACHE_SIZE = 2048
+# Proposal id -> shard, remembered so lookups by id only search once.
+PROPOSAL_LOCATION_CACHE_SIZE = 65536
+# How long the first writer of a group commit waits for others to join it.
+GROUP_COMMIT_WINDOW_SECONDS = float(os.environ.get("GROUP_COMMIT_WINDOW_MS", "2")) / 1000
+# The moving average of lock waits that load shedding reads halves this often.
+LOCK_WAIT_HALF_LIFE_SECONDS = 5.0
+DATABASE_PATH = Path(__file__).resolve().parent.parent / "proposal_app.db"
+# Users and their proposals are spread over this many SQLite files by a hash
+# of the user's email; 1 keeps everything in DATABASE_PATH.
+DATABASE_SHARDS = max(int(os.environ.get("DATABASE_SHARDS", "1")), 1)
+
+
+@contextlib.contextmanager
+def _migration_lock(db_path: Path):
+    """Serializes schema migration between worker processes."""
+    lock_path = db_path.with_name(db_path.name + ".lock")
+    with open(lock_path, "a") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+_AUTOINCREMENT_TABLES = ("jobs", "notification_outbox", "audit_events")
+
+
+def shard_path(path: Path, index: int) -> Path:
+    """Shard 0 is ``path`` itself and also holds sessions, tokens and other shared tables."""
+    return path if index == 0 else path.with_name(f"{path.stem}.shard{index}{path.suffix}")
+
+
+def shard_for_email(email: str, shards: int) -> int:
+    digest = hashlib.sha256(email.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def _change_log_head(conn: sqlite3.Connection) -> int:
+    # The AUTOINCREMENT counter, which survives the log being emptied.
+    row = conn.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name = 'change_log'"
+    ).fetchone()
+    return row[0] if row else 0
+
+
+class _TimedLock:
+    """threading.Lock that tracks a moving average of how long callers waited.
+
+    The average also halves every LOCK_WAIT_HALF_LIFE_SECONDS, so it falls
+    back to zero once contention stops, even if nobody takes the lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._average_wait = 0.0
+        self._sampled_at = time.monotonic()
+
+    def _decayed(self, now: float) -> float:
+        return self._average_wait * 0.5 ** ((now - self._sampled_at) / LOCK_WAIT_HALF_LIFE_SECONDS)
+
+    @property
+    def average_wait(self) -> float:
+        return self._decayed(time.monotonic())
+
+    def acquire(self):
+        waited = 0.0
+        if not self._lock.acquire(blocking=False):
+            started = time.perf_counter()
+            self._lock.acquire()
+            waited = time.perf_counter() - started
+        # Updated while holding the lock, so it needs no synchronization of its own.
+        now = time.monotonic()
+        average = self._decayed(now)
+        self._average_wait = average + (waited - average) * 0.1
+        self._sampled_at = now
+
+    def release(self):
+        self._lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class _CommitBatch:
+    def __init__(self):
+        self.size = 0
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
 
 
 class Database:
     def __init__(self, db_path: Optional[str | Path] = None):
-        default_path = Path(__file__).resolve().parent.parent / "proposal_app.db"
-        self.db_path = Path(db_path) if db_path else default_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
-        self._lock = threading.Lock()
-        self._initialize()
+        self.db_path = Path(db_path) if db_path else DATABASE_PATH
+        self._connection: Optional[sqlite3.Connection] = None
+        self._open_lock = threading.Lock()
+        self._lock = _TimedLock()
+        self.fts_enabled = False
+        # Guarded by self._lock. Other workers write through their own
+        # connections: when PRAGMA data_version reports a commit this
+        # connection did not make, the proposals changed since
+        # _change_offset are read from change_log and evicted.
+        self._proposal_cache: OrderedDict[str, Proposal] = OrderedDict()
+        self._data_version: Optional[int] = None
+        self._change_offset: Optional[int] = None
+        self.proposal_cache_hits = 0
+        self.proposal_cache_misses = 0
+        # Writes waiting for the next group commit; guarded by self._lock.
+        self._commit_batch: Optional[_CommitBatch] = None
+        self.commit_window = GROUP_COMMIT_WINDOW_SECONDS
+        # Writers inside _group_write; the batch leader waits for them to join.
+        self._writers = threading.Condition()
+        self._active_writers = 0
+        # Proposals the running _group_write block cached; evicted if it fails.
+        self._block_cached: Optional[set[str]] = None
 
-    def _initialize(self):
-        with self._lock:
-            self._conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS users (
-                    email TEXT PRIMARY KEY,
-                    password_hash TEXT NOT NULL,
-                    is_admin INTEGER NOT NULL DEFAULT 0,
-                    created_at TEXT NOT NULL,
-                    must_reset_password INTEGER NOT NULL DEFAULT 0
+    @property
+    def shards(self) -> list["Database"]:
+        return [self]
+
+    @property
+    def lock_wait_seconds(self) -> float:
+        """Moving average of the wait for the connection lock; a contention signal."""
+        return self._lock.average_wait
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        conn = self._connection
+        if conn is None:
+            conn = self.open()
+        return conn
+
+    def open(self) -> sqlite3.Connection:
+        """Connects and brings the schema up to date. Safe to call repeatedly."""
+        with self._open_lock:
+            if self._connection is None:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                # Only the first worker to take the lock migrates; the rest see
+                # the bumped user_version and skip straight to serving.
+                with _migration_lock(self.db_path):
+                    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                        self._migrate(conn)
+                        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                        conn.commit()
+                self.fts_enabled = (
+                    conn.execute(
+                        "SELECT 1 FROM sqlite_master WHERE name = 'proposal_documents'"
+                    ).fetchone()
+                    is not None
                 )
-                """
+                self._data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                self._change_offset = _change_log_head(conn)
+                self._connection = conn
+        return self._connection
+
+    def _migrate(self, conn: sqlite3.Connection):
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS users (
+                email TEXT PRIMARY KEY,
+                password_hash TEXT NOT NULL,
+                is_admin INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                must_reset_password INTEGER NOT NULL DEFAULT 0
             )
-            self._conn.execute(
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS proposals (
+                id TEXT PRIMARY KEY,
+                user_email TEXT NOT NULL,
+                full_name TEXT NOT NULL,
+                email TEXT NOT NULL,
+                affiliation TEXT NOT NULL,
+                phone_number TEXT NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                proposal_file TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT '',
+                status TEXT NOT NULL,
+                review_results TEXT NOT NULL DEFAULT '',
+                file_hash TEXT NOT NULL DEFAULT '',
+                version INTEGER NOT NULL DEFAULT 1,
+                FOREIGN KEY (user_email) REFERENCES users(email) ON DELETE CASCADE
+            )
+            """
+        )
+        # Ensure schema includes updated_at and must_reset_password for existing databases.
+        cursor = conn.execute("PRAGMA table_info(proposals)")
+        proposal_columns = {row["name"] for row in cursor.fetchall()}
+        if "updated_at" not in proposal_columns:
+            conn.execute(
+                "ALTER TABLE proposals ADD COLUMN updated_at TEXT DEFAULT ''"
+            )
+            conn.execute(
                 """
-                CREATE TABLE IF NOT EXISTS proposals (
-                    id TEXT PRIMARY KEY,
-                    user_email TEXT NOT NULL,
-                    full_name TEXT NOT NULL,
-                    email TEXT NOT NULL,
-                    affiliation TEXT NOT NULL,
-                    phone_number TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    proposal_file TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL DEFAULT '',
-                    status TEXT NOT NULL,
-                    review_results TEXT NOT NULL DEFAULT '',
-                    FOREIGN KEY (user_email) REFERENCES users(email) ON DELETE CASCADE
-                )
+                UPDATE proposals
+                SET updated_at = CASE
+                    WHEN updated_at IS NULL OR updated_at = '' THEN created_at
+                    ELSE updated_at
+                END
                 """
             )
-            # Ensure schema includes updated_at and must_reset_password for existing databases.
-            cursor = self._conn.execute("PRAGMA table_info(proposals)")
-            proposal_columns = {row["name"] for row in cursor.fetchall()}
-            if "updated_at" not in proposal_columns:
-                self._conn.execute(
-                    "ALTER TABLE proposals ADD COLUMN updated_at TEXT DEFAULT ''"
-                )
-                self._conn.execute(
+        if "file_hash" not in proposal_columns:
+            conn.execute(
+                "ALTER TABLE proposals ADD COLUMN file_hash TEXT NOT NULL DEFAULT ''"
+            )
+        if "version" not in proposal_columns:
+            conn.execute(
+                "ALTER TABLE proposals ADD COLUMN version INTEGER NOT NULL DEFAULT 1"
+            )
+        cursor = conn.execute("PRAGMA table_info(users)")
+        user_columns = {row["name"] for row in cursor.fetchall()}
+        if "must_reset_password" not in user_columns:
+            conn.execute(
+                "ALTER TABLE users ADD COLUMN must_reset_password INTEGER NOT NULL DEFAULT 0"
+            )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_proposals_user_email ON proposals(user_email)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_proposals_status ON proposals(status)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_proposals_proposal_file ON proposals(proposal_file)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                proposal_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL DEFAULT '{}',
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                run_after TEXT NOT NULL,
+                locked_at TEXT NOT NULL DEFAULT '',
+                last_error TEXT NOT NULL DEFAULT '',
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_status_run_after ON jobs(status, run_after)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_proposal_id ON jobs(proposal_id)"
+        )
+        # Append-only: rows are only ever inserted here and moved out by
+        # archive_audit_events.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS audit_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT NOT NULL,
+                actor TEXT NOT NULL,
+                entity TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                action TEXT NOT NULL,
+                changes TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_events_entity ON audit_events(entity, entity_id, id)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_events_created_at ON audit_events(created_at)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS notification_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recipient TEXT NOT NULL,
+                proposal_id TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                send_after TEXT NOT NULL,
+                claimed_at TEXT NOT NULL DEFAULT '',
+                last_error TEXT NOT NULL DEFAULT '',
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notification_outbox_pending ON notification_outbox(status, recipient, created_at)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS api_tokens (
+                token_hash TEXT PRIMARY KEY,
+                email TEXT NOT NULL,
+                label TEXT NOT NULL DEFAULT '',
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                token_hash TEXT PRIMARY KEY,
+                email TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_email ON sessions(email)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions(expires_at)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS maintenance_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS auth_failures (
+                key TEXT PRIMARY KEY,
+                failures INTEGER NOT NULL,
+                locked_until REAL NOT NULL
+            )
+            """
+        )
+        # Shared query results are keyed by these versions, so the triggers
+        # make a write in any worker visible to every worker's cache.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS table_versions (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            )
+            """
+        )
+        for table in VERSIONED_TABLES:
+            conn.execute(
+                "INSERT OR IGNORE INTO table_versions (name, version) VALUES (?, 0)",
+                (table,),
+            )
+            for action in ("INSERT", "UPDATE", "DELETE"):
+                conn.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_{action.lower()}_version
+                    AFTER {action} ON {table}
+                    BEGIN
+                        UPDATE table_versions SET version = version + 1
+                        WHERE name = '{table}';
+                    END
                     """
-                    UPDATE proposals
-                    SET updated_at = CASE
-                        WHEN updated_at IS NULL OR updated_at = '' THEN created_at
-                        ELSE updated_at
+                )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS change_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                table_name TEXT NOT NULL,
+                op TEXT NOT NULL,
+                row_key TEXT NOT NULL,
+                version INTEGER,
+                changed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_change_log_key ON change_log(table_name, row_key, id)"
+        )
+        for table, (key, version) in CHANGE_LOG_TABLES.items():
+            for action, row in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")):
+                conn.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_{action.lower()}_log
+                    AFTER {action} ON {table}
+                    BEGIN
+                        INSERT INTO change_log (table_name, op, row_key, version, changed_at)
+                        VALUES (
+                            '{table}',
+                            '{action.lower()}',
+                            {row}.{key},
+                            {f"{row}.{version}" if version else "NULL"},
+                            (julianday('now') - 2440587.5) * 86400.0
+                        );
                     END
                     """
                 )
-            cursor = self._conn.execute("PRAGMA table_info(users)")
-            user_columns = {row["name"] for row in cursor.fetchall()}
-            if "must_reset_password" not in user_columns:
-                self._conn.execute(
-                    "ALTER TABLE users ADD COLUMN must_reset_password INTEGER NOT NULL DEFAULT 0"
+        # Trigram tokenization keeps substring search working for Korean text.
+        try:
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS proposal_documents USING fts5(
+                    proposal_id UNINDEXED,
+                    content,
+                    tokenize = 'trigram'
                 )
-            self._conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_proposals_user_email ON proposals(user_email)"
-            )
-            self._conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_proposals_status ON proposals(status)"
+                """
             )
+        except sqlite3.OperationalError:
+            pass
+        conn.commit()
+
+    def proposal_cache_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._proposal_cache),
+                "hits": self.proposal_cache_hits,
+                "misses": self.proposal_cache_misses,
+            }
+
+    @contextlib.contextmanager
+    def _group_write(self):
+        """Runs the block's statements under the lock and commits them with others.
+
+        Concurrent writers share one transaction: each block runs in its own
+        savepoint, so a failing block only undoes its own statements. The
+        first writer of a batch waits up to ``commit_window`` while other
+        writers are still running, then commits them all with one fsync; a
+        writer on its own commits straight away. Every writer returns only
+        after that commit succeeded, and raises if it failed.
+
+        While the batch waits for its commit the connection holds writes
+        other sessions must not see yet, so reads go through
+        ``_committed_reads``, which waits for the pending commit first.
+        """
+        with self._writers:
+            self._active_writers += 1
+        try:
+            with self._lock:
+                conn = self._conn
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                conn.execute("SAVEPOINT group_write")
+                change_offset = self._change_offset
+                self._block_cached = set()
+                try:
+                    yield
+                except BaseException:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK TO group_write")
+                        conn.execute("RELEASE group_write")
+                        if self._commit_batch is None:
+                            # Nobody else is waiting on this transaction.
+                            conn.rollback()
+                        # Only this block's rows were undone. The change_log ids
+                        # it saw may be reused, so eviction resumes from before it.
+                        for proposal_id in self._block_cached:
+                            self._proposal_cache.pop(proposal_id, None)
+                        if self._change_offset is not None:
+                            self._change_offset = change_offset
+                    else:
+                        # SQLite rolled back the whole transaction, batch included.
+                        if self._commit_batch is not None:
+                            self._commit_batch.error = sqlite3.OperationalError(
+                                "The transaction was rolled back by a concurrent write."
+                            )
+                        self._reset_proposal_cache()
+                    raise
+                finally:
+                    self._block_cached = None
+                conn.execute("RELEASE group_write")
+                batch = self._commit_batch
+                leader = batch is None
+                if leader:
+                    batch = self._commit_batch = _CommitBatch()
+                batch.size += 1
+            with self._writers:
+                self._writers.notify_all()
+                if leader and self.commit_window > 0:
+                    self._writers.wait_for(
+                        lambda: batch.size >= self._active_writers, self.commit_window
+                    )
+            if leader:
+                with self._lock:
+                    self._commit_batch = None
+                    try:
+                        self._conn.commit()
+                    except Exception as exc:
+                        self._conn.rollback()
+                        self._reset_proposal_cache()
+                        batch.error = batch.error or exc
+                    else:
+                        self._skip_own_changes()
+                batch.done.set()
+            else:
+                batch.done.wait()
+            if batch.error is not None:
+                raise batch.error
+        finally:
+            with self._writers:
+                self._active_writers -= 1
+                self._writers.notify_all()
+
+    @contextlib.contextmanager
+    def _committed_reads(self):
+        """Holds the lock once no group commit is pending on the connection.
+
+        A batch leader releases the lock while it waits for more writers, and
+        reads on the same connection would see the batch before it commits.
+        """
+        while True:
+            self._lock.acquire()
+            batch = self._commit_batch
+            if batch is None:
+                break
+            self._lock.release()
+            batch.done.wait()
+        try:
+            yield
+        finally:
+            self._lock.release()
+
+    def _flush_writes(self):
+        # Callers hold self._lock. Commits grouped writes still waiting for
+        # their batch, before a statement that needs its own transaction.
+        if self._conn.in_transaction:
             self._conn.commit()
 
+    def _check_data_version(self):
+        # Callers hold self._lock.
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version:
+            return
+        self._data_version = version
+        if self._change_offset is not None:
+            truncated = self._conn.execute(
+                "SELECT value FROM maintenance_state WHERE key = ?",
+                (CHANGE_LOG_TRUNCATED_KEY,),
+            ).fetchone()
+            rows = self._conn.execute(
+                """
+                SELECT id, row_key FROM change_log
+                WHERE id > ? AND table_name = 'proposals'
+                ORDER BY id
+                LIMIT ?
+                """,
+                (self._change_offset, PROPOSAL_CACHE_SIZE),
+            ).fetchall()
+            expired = truncated is not None and int(truncated[0]) > self._change_offset
+            if not expired and len(rows) < PROPOSAL_CACHE_SIZE:
+                for row in rows:
+                    self._proposal_cache.pop(row["row_key"], None)
+                if rows:
+                    self._change_offset = rows[-1]["id"]
+                return
+        # Too far behind to catch up record by record.
+        self._proposal_cache.clear()
+        self._change_offset = _change_log_head(self._conn)
+
+    def _skip_own_changes(self):
+        # Callers hold self._lock. The cache already has this connection's
+        # writes; if no other connection committed since the last check, the
+        # records up to the head are all ours. The head is read first so a
+        # commit racing in between shows up in data_version.
+        if self._change_offset is None:
+            return
+        head = _change_log_head(self._conn)
+        if self._conn.execute("PRAGMA data_version").fetchone()[0] == self._data_version:
+            self._change_offset = head
+
+    def _reset_proposal_cache(self):
+        # Callers hold self._lock. After a rollback the change_log ids this
+        # connection saw may be reused, so the next check starts over.
+        self._proposal_cache.clear()
+        self._change_offset = None
+
+    def _cache_proposal(self, proposal: Proposal):
+        # Callers hold self._lock.
+        self._proposal_cache[proposal["id"]] = proposal
+        if self._block_cached is not None:
+            self._block_cached.add(proposal["id"])
+        self._proposal_cache.move_to_end(proposal["id"])
+        while len(self._proposal_cache) > PROPOSAL_CACHE_SIZE:
+            self._proposal_cache.popitem(last=False)
+
     def _row_to_proposal(self, row: sqlite3.Row) -> Proposal:
         return Proposal(
             id=row["id"],
@@ -123,10 +729,12 @@ class Database:
             updated_at=row["updated_at"] or row["created_at"],
             status=row["status"],
             review_results=row["review_results"] or "",
+            file_hash=row["file_hash"] or "",
+            version=row["version"],
         )
 
     def get_user(self, email: str) -> Optional[User]:
-        with self._lock:
+        with self._committed_reads():
             cursor = self._conn.execute(
                 "SELECT email, password_hash, is_admin, must_reset_password FROM users WHERE email = ?",
                 (email,),
@@ -143,7 +751,7 @@ class Database:
 
     def add_user(self, user: User):
         try:
-            with self._lock:
+            with self._group_write():
                 self._conn.execute(
                     """
                     INSERT INTO users (email, password_hash, is_admin, created_at)
@@ -156,13 +764,12 @@ class Database:
                         datetime.datetime.now().isoformat(),
                     ),
                 )
-                self._conn.commit()
         except sqlite3.IntegrityError as exc:
             raise ValueError("User already exists.") from exc
 
-    def add_proposal(self, proposal: Proposal):
-        with self._lock:
-            self._conn.execute(
+    def add_proposal(self, proposal: Proposal, actor: str = ""):
+        with self._group_write():
+            row = self._conn.execute(
                 """
                 INSERT INTO proposals (
                     id,
@@ -177,9 +784,12 @@ class Database:
                     created_at,
                     updated_at,
                     status,
-                    review_results
+                    review_results,
+                    file_hash,
+                    version
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING *
                 """,
                 (
                     proposal["id"],
@@ -195,104 +805,1208 @@ class Database:
                     proposal["updated_at"],
                     proposal["status"],
                     proposal["review_results"],
+                    proposal["file_hash"],
+                    proposal["version"],
                 ),
+            ).fetchone()
+            self._record_audit(
+                actor or proposal["user_email"],
+                "proposal",
+                proposal["id"],
+                "create",
+                {field: [None, proposal[field]] for field in AUDITED_PROPOSAL_FIELDS},
+            )
+            self._cache_proposal(self._row_to_proposal(row))
+
+    def existing_user_emails(self, emails: list[str]) -> set[str]:
+        if not emails:
+            return set()
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                f"SELECT email FROM users WHERE email IN ({', '.join('?' * len(emails))})",
+                emails,
+            )
+            return {row["email"] for row in cursor.fetchall()}
+
+    def import_users(self, users: list[User], actor: str = "") -> set[str]:
+        """Inserts a batch of users in one transaction and returns the emails added.
+
+        Emails that already have an account are skipped and not audited.
+        """
+        if not users:
+            return set()
+        now = datetime.datetime.now().isoformat()
+        emails = list(dict.fromkeys(user.email for user in users))
+        with self._group_write():
+            self._conn.executemany(
+                """
+                INSERT INTO users (email, password_hash, is_admin, must_reset_password, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(email) DO NOTHING
+                """,
+                [
+                    (
+                        user.email,
+                        user.password_hash,
+                        1 if user.is_admin else 0,
+                        1 if user.must_reset_password else 0,
+                        now,
+                    )
+                    for user in users
+                ],
+            )
+            # The write lock is held until commit, so rows carrying this
+            # batch's timestamp and a hash from it were written just now;
+            # accounts that already existed keep their own hash.
+            cursor = self._conn.execute(
+                f"""
+                SELECT email, password_hash FROM users
+                WHERE created_at = ? AND email IN ({', '.join('?' * len(emails))})
+                """,
+                [now, *emails],
+            )
+            written = {row["email"]: row["password_hash"] for row in cursor.fetchall()}
+            inserted: set[str] = set()
+            for user in users:
+                if user.email in inserted or written.get(user.email) != user.password_hash:
+                    continue
+                inserted.add(user.email)
+                self._record_audit(
+                    actor, "user", user.email, "import", {"is_admin": [None, user.is_admin]}
+                )
+        return inserted
+
+    def import_proposals(self, proposals: list[Proposal], actor: str = "") -> int:
+        """Inserts a batch of proposals in one transaction."""
+        with self._group_write():
+            cursor = self._conn.executemany(
+                """
+                INSERT INTO proposals (
+                    id, user_email, full_name, email, affiliation, phone_number, title,
+                    description, proposal_file, created_at, updated_at, status, review_results
+                )
+                VALUES (
+                    :id, :user_email, :full_name, :email, :affiliation, :phone_number, :title,
+                    :description, :proposal_file, :created_at, :updated_at, :status, :review_results
+                )
+                """,
+                proposals,
+            )
+            for proposal in proposals:
+                self._record_audit(
+                    actor,
+                    "proposal",
+                    proposal["id"],
+                    "import",
+                    {field: [None, proposal[field]] for field in AUDITED_PROPOSAL_FIELDS},
+                )
+            return cursor.rowcount
+
+    def get_user_proposals(self, email: str) -> list[Proposal]:
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                """
+                SELECT *
+                FROM proposals
+                WHERE user_email = ?
+                ORDER BY datetime(created_at) DESC
+                """,
+                (email,),
+            )
+            rows = cursor.fetchall()
+        return [self._row_to_proposal(row) for row in rows]
+
+    def get_all_proposals(self) -> list[Proposal]:
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                """
+                SELECT *
+                FROM proposals
+                ORDER BY datetime(created_at) DESC
+                """
+            )
+            rows = cursor.fetchall()
+        return [self._row_to_proposal(row) for row in rows]
+
+    def _proposal_filters(
+        self,
+        user_email: Optional[str],
+        status: str,
+        search: str,
+        search_fields: tuple[str, ...],
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if user_email is not None:
+            clauses.append("user_email = ?")
+            params.append(user_email)
+        if status and status != "All":
+            clauses.append("status = ?")
+            params.append(status)
+        if search:
+            pattern = "%" + re.sub(r"([%_\\])", r"\\\1", search) + "%"
+            matches = [f"{field} LIKE ? ESCAPE '\\'" for field in search_fields]
+            params.extend([pattern] * len(search_fields))
+            # Trigram matching needs at least three characters.
+            if self.fts_enabled and len(search) >= 3:
+                matches.append(
+                    "id IN (SELECT proposal_id FROM proposal_documents WHERE proposal_documents MATCH ?)"
+                )
+                params.append('"' + search.replace('"', '""') + '"')
+            clauses.append("(" + " OR ".join(matches) + ")")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def count_proposals(
+        self,
+        user_email: Optional[str] = None,
+        status: str = "All",
+        search: str = "",
+        search_fields: tuple[str, ...] = ("title", "description"),
+    ) -> int:
+        where, params = self._proposal_filters(user_email, status, search, search_fields)
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                f"SELECT COUNT(*) FROM proposals {where}", params
+            )
+            return cursor.fetchone()[0]
+
+    def query_proposals(
+        self,
+        user_email: Optional[str] = None,
+        status: str = "All",
+        search: str = "",
+        search_fields: tuple[str, ...] = ("title", "description"),
+        limit: int = 25,
+        offset: int = 0,
+    ) -> list[Proposal]:
+        """One page of proposals, newest first, filtered in SQL."""
+        where, params = self._proposal_filters(user_email, status, search, search_fields)
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                f"""
+                SELECT *
+                FROM proposals
+                {where}
+                ORDER BY datetime(created_at) DESC, id
+                LIMIT ? OFFSET ?
+                """,
+                [*params, limit, offset],
+            )
+            rows = cursor.fetchall()
+        return [self._row_to_proposal(row) for row in rows]
+
+    def get_proposal(self, proposal_id: str) -> Optional[Proposal]:
+        with self._committed_reads():
+            self._check_data_version()
+            cached = self._proposal_cache.get(proposal_id)
+            if cached is not None:
+                self._proposal_cache.move_to_end(proposal_id)
+                self.proposal_cache_hits += 1
+                return Proposal(**cached)
+            self.proposal_cache_misses += 1
+            cursor = self._conn.execute(
+                "SELECT * FROM proposals WHERE id = ?", (proposal_id,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            proposal = self._row_to_proposal(row)
+            self._cache_proposal(proposal)
+        return Proposal(**proposal)
+
+    def update_proposal(
+        self,
+        proposal_id: str,
+        updates: dict[str, str],
+        actor: str = "",
+        expected_version: Optional[int] = None,
+    ) -> Optional[Proposal]:
+        """Applies ``updates`` and returns the new row, or None if it does not exist.
+
+        With ``expected_version``, raises StaleProposalError instead of
+        overwriting a proposal that changed since the caller read it.
+        """
+        if not updates:
+            return None
+        with self._group_write():
+            updated = self._apply_proposal_update(
+                proposal_id, updates, actor, expected_version
+            )
+        return Proposal(**updated) if updated else None
+
+    def _apply_proposal_update(
+        self,
+        proposal_id: str,
+        updates: dict[str, str],
+        actor: str,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Proposal]:
+        # Callers hold self._lock and commit.
+        updates = dict(updates)
+        updates["updated_at"] = datetime.datetime.now().isoformat()
+        columns = ", ".join(f"{key} = ?" for key in updates)
+        self._check_data_version()
+        before = self._proposal_cache.get(proposal_id)
+        while True:
+            if before is None:
+                row = self._conn.execute(
+                    "SELECT * FROM proposals WHERE id = ?", (proposal_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+                before = self._row_to_proposal(row)
+            if expected_version is not None and before["version"] != expected_version:
+                raise StaleProposalError(Proposal(**before))
+            rows = self._conn.execute(
+                f"""
+                UPDATE proposals SET {columns}, version = version + 1
+                WHERE id = ? AND version = ?
+                RETURNING *
+                """,
+                [*updates.values(), proposal_id, before["version"]],
+            ).fetchall()
+            if rows:
+                break
+            # Another worker committed after `before` was read. The UPDATE has
+            # taken the write lock, so the re-read row cannot move again.
+            before = None
+        after = self._row_to_proposal(rows[0])
+        self._cache_proposal(after)
+        changes = {
+            key: [before[key], after[key]]
+            for key in AUDITED_PROPOSAL_FIELDS
+            if before[key] != after[key]
+        }
+        if changes:
+            action = "status" if set(changes) <= {"status", "review_results"} else "update"
+            self._record_audit(actor, "proposal", proposal_id, action, changes)
+        if "status" in changes or "review_results" in changes:
+            self._enqueue_notification(before, after)
+        return after
+
+    def update_proposal_statuses(
+        self,
+        updates: list[tuple[str, str, Optional[str], Optional[int]]],
+        actor: str = "",
+    ) -> tuple[list[str], list[str]]:
+        """Applies (id, status, review_results, expected_version) updates in one transaction.
+
+        A review_results of None keeps the stored review, and an
+        expected_version of None skips the version check. Returns the ids that
+        were updated and the ids skipped because their version had moved on.
+        """
+        updated: list[str] = []
+        stale: list[str] = []
+        with self._group_write():
+            for proposal_id, status, review_results, expected_version in updates:
+                fields = {"status": status}
+                if review_results is not None:
+                    fields["review_results"] = review_results
+                try:
+                    if self._apply_proposal_update(
+                        proposal_id, fields, actor, expected_version
+                    ):
+                        updated.append(proposal_id)
+                except StaleProposalError:
+                    stale.append(proposal_id)
+        return updated, stale
+
+    def update_proposal_status(
+        self,
+        proposal_id: str,
+        status: str,
+        review_results: Optional[str] = None,
+        actor: str = "",
+        expected_version: Optional[int] = None,
+    ) -> Optional[Proposal]:
+        """Sets the status, and the review unless ``review_results`` is None."""
+        updates = {"status": status}
+        if review_results is not None:
+            updates["review_results"] = review_results
+        return self.update_proposal(
+            proposal_id, updates, actor=actor, expected_version=expected_version
+        )
+
+    def update_user_password(
+        self, email: str, password_hash: str, must_reset: bool = False, actor: str = ""
+    ) -> bool:
+        with self._group_write():
+            cursor = self._conn.execute(
+                "UPDATE users SET password_hash = ?, must_reset_password = ? WHERE email = ?",
+                (password_hash, 1 if must_reset else 0, email),
+            )
+            if cursor.rowcount > 0:
+                # Never log the hashes themselves.
+                self._record_audit(
+                    actor or email,
+                    "user",
+                    email,
+                    "password_reset" if must_reset else "password_change",
+                    {},
+                )
+            return cursor.rowcount > 0
+
+    def delete_proposal(self, proposal_id: str, actor: str = "") -> bool:
+        with self._group_write():
+            before = self._conn.execute(
+                "SELECT * FROM proposals WHERE id = ?", (proposal_id,)
+            ).fetchone()
+            cursor = self._conn.execute(
+                "DELETE FROM proposals WHERE id = ?", (proposal_id,)
+            )
+            self._proposal_cache.pop(proposal_id, None)
+            if before is not None:
+                self._record_audit(
+                    actor,
+                    "proposal",
+                    proposal_id,
+                    "delete",
+                    {field: [before[field], None] for field in AUDITED_PROPOSAL_FIELDS},
+                )
+            self._conn.execute("DELETE FROM jobs WHERE proposal_id = ?", (proposal_id,))
+            if self.fts_enabled:
+                self._conn.execute(
+                    "DELETE FROM proposal_documents WHERE proposal_id = ?",
+                    (proposal_id,),
+                )
+            return cursor.rowcount > 0
+
+    def set_proposal_file_hash(self, proposal_id: str, file_hash: str) -> bool:
+        # Background bookkeeping: deliberately leaves updated_at untouched.
+        with self._group_write():
+            row = self._conn.execute(
+                "UPDATE proposals SET file_hash = ? WHERE id = ? RETURNING *",
+                (file_hash, proposal_id),
+            ).fetchone()
+            if row is None:
+                return False
+            self._cache_proposal(self._row_to_proposal(row))
+            return True
+
+    def enqueue_job(
+        self,
+        proposal_id: str,
+        kind: str,
+        payload: Optional[dict[str, Any]] = None,
+        max_attempts: int = 3,
+    ) -> int:
+        now = datetime.datetime.now().isoformat()
+        with self._group_write():
+            cursor = self._conn.execute(
+                """
+                INSERT INTO jobs (
+                    proposal_id, kind, payload, max_attempts, run_after, created_at, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    proposal_id,
+                    kind,
+                    json.dumps(payload or {}),
+                    max_attempts,
+                    now,
+                    now,
+                    now,
+                ),
+            )
+            return int(cursor.lastrowid)
+
+    def claim_job(self) -> Optional[dict[str, Any]]:
+        """Atomically moves the oldest due job to running and returns it."""
+        now = datetime.datetime.now().isoformat()
+        with self._group_write():
+            cursor = self._conn.execute(
+                """
+                UPDATE jobs
+                SET status = 'running', attempts = attempts + 1, locked_at = ?, updated_at = ?
+                WHERE id = (
+                    SELECT id FROM jobs
+                    WHERE status = 'queued' AND run_after <= ?
+                    ORDER BY run_after, id
+                    LIMIT 1
+                )
+                RETURNING id, proposal_id, kind, payload, attempts, max_attempts
+                """,
+                (now, now, now),
+            )
+            row = cursor.fetchone()
+        if not row:
+            return None
+        return {
+            "id": row["id"],
+            "proposal_id": row["proposal_id"],
+            "kind": row["kind"],
+            "payload": json.loads(row["payload"] or "{}"),
+            "attempts": row["attempts"],
+            "max_attempts": row["max_attempts"],
+        }
+
+    def complete_job(self, job_id: int):
+        with self._group_write():
+            self._conn.execute(
+                "UPDATE jobs SET status = 'done', last_error = '', locked_at = '', updated_at = ? WHERE id = ?",
+                (datetime.datetime.now().isoformat(), job_id),
+            )
+
+    def fail_job(self, job_id: int, error: str, retry_delay: float) -> bool:
+        """Records a failed attempt; returns True when the job will be retried."""
+        now = datetime.datetime.now()
+        run_after = (now + datetime.timedelta(seconds=retry_delay)).isoformat()
+        with self._group_write():
+            cursor = self._conn.execute(
+                """
+                UPDATE jobs
+                SET status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END,
+                    run_after = ?, last_error = ?, locked_at = '', updated_at = ?
+                WHERE id = ?
+                RETURNING status
+                """,
+                (run_after, error[:1000], now.isoformat(), job_id),
+            )
+            row = cursor.fetchone()
+        return bool(row and row["status"] == "queued")
+
+    def _enqueue_notification(self, before: Proposal, after: Proposal):
+        # Written in the caller's transaction so a status change and its
+        # notification are committed (or lost) together.
+        now = datetime.datetime.now().isoformat()
+        payload = {
+            "title": after["title"],
+            "old_status": before["status"],
+            "status": after["status"],
+            "review_results": after["review_results"],
+        }
+        self._conn.execute(
+            """
+            INSERT INTO notification_outbox (recipient, proposal_id, payload, send_after, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                before["email"] or before["user_email"],
+                before["id"],
+                json.dumps(payload, ensure_ascii=False),
+                now,
+                now,
+            ),
+        )
+
+    def claim_notifications(
+        self, settle_seconds: float, max_recipients: int
+    ) -> list[dict[str, Any]]:
+        """Claims every pending message for recipients whose oldest one has settled.
+
+        Waiting ``settle_seconds`` after the first change lets a bulk review
+        collapse into one digest per recipient.
+        """
+        now = datetime.datetime.now()
+        settled = (now - datetime.timedelta(seconds=settle_seconds)).isoformat()
+        with self._group_write():
+            cursor = self._conn.execute(
+                """
+                UPDATE notification_outbox
+                SET status = 'sending', attempts = attempts + 1, claimed_at = ?
+                WHERE status = 'pending' AND send_after <= ? AND recipient IN (
+                    SELECT recipient FROM notification_outbox
+                    WHERE status = 'pending' AND send_after <= ?
+                    GROUP BY recipient
+                    HAVING MIN(created_at) <= ?
+                    ORDER BY MIN(created_at)
+                    LIMIT ?
+                )
+                RETURNING id, recipient, proposal_id, payload, attempts
+                """,
+                (now.isoformat(), now.isoformat(), now.isoformat(), settled, max_recipients),
+            )
+            rows = cursor.fetchall()
+        return [
+            {
+                "id": row["id"],
+                "recipient": row["recipient"],
+                "proposal_id": row["proposal_id"],
+                "payload": json.loads(row["payload"] or "{}"),
+                "attempts": row["attempts"],
+            }
+            for row in sorted(rows, key=lambda row: row["id"])
+        ]
+
+    def mark_notifications_sent(self, ids: list[int]):
+        if not ids:
+            return
+        placeholders = ", ".join("?" for _ in ids)
+        with self._group_write():
+            self._conn.execute(
+                f"UPDATE notification_outbox SET status = 'sent', last_error = '' WHERE id IN ({placeholders})",
+                ids,
+            )
+
+    def fail_notifications(
+        self, ids: list[int], error: str, retry_delay: float, max_attempts: int
+    ):
+        if not ids:
+            return
+        send_after = (
+            datetime.datetime.now() + datetime.timedelta(seconds=retry_delay)
+        ).isoformat()
+        placeholders = ", ".join("?" for _ in ids)
+        with self._group_write():
+            self._conn.execute(
+                f"""
+                UPDATE notification_outbox
+                SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    send_after = ?, claimed_at = '', last_error = ?
+                WHERE id IN ({placeholders})
+                """,
+                [max_attempts, send_after, error[:500], *ids],
+            )
+
+    def release_stale_notifications(self, stale_after: float) -> int:
+        """Returns messages claimed by a dispatcher that died mid-send."""
+        cutoff = (
+            datetime.datetime.now() - datetime.timedelta(seconds=stale_after)
+        ).isoformat()
+        with self._group_write():
+            cursor = self._conn.execute(
+                """
+                UPDATE notification_outbox
+                SET status = 'pending', claimed_at = ''
+                WHERE status = 'sending' AND claimed_at < ?
+                """,
+                (cutoff,),
+            )
+            return cursor.rowcount
+
+    def requeue_stale_jobs(self, stale_after: float) -> int:
+        """Returns jobs whose worker died mid-run to the queue."""
+        now = datetime.datetime.now()
+        cutoff = (now - datetime.timedelta(seconds=stale_after)).isoformat()
+        with self._group_write():
+            cursor = self._conn.execute(
+                """
+                UPDATE jobs
+                SET status = 'queued', locked_at = '', run_after = ?, updated_at = ?
+                WHERE status = 'running' AND locked_at < ?
+                """,
+                (now.isoformat(), now.isoformat(), cutoff),
+            )
+            return cursor.rowcount
+
+    def has_pending_job(self, proposal_id: str, kind: str) -> bool:
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                """
+                SELECT 1 FROM jobs
+                WHERE proposal_id = ? AND kind = ? AND status IN ('queued', 'running')
+                LIMIT 1
+                """,
+                (proposal_id, kind),
+            )
+            return cursor.fetchone() is not None
+
+    def get_proposal_jobs(self, proposal_id: str) -> list[dict[str, str]]:
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                """
+                SELECT id, kind, status, attempts, max_attempts, last_error, updated_at
+                FROM jobs
+                WHERE proposal_id = ?
+                ORDER BY id
+                """,
+                (proposal_id,),
+            )
+            return [
+                {
+                    "id": str(row["id"]),
+                    "kind": row["kind"],
+                    "status": row["status"],
+                    "attempts": f"{row['attempts']}/{row['max_attempts']}",
+                    "last_error": row["last_error"] or "",
+                    "updated_label": (row["updated_at"] or "").replace("T", " ")[:19],
+                }
+                for row in cursor.fetchall()
+            ]
+
+    def index_proposal_document(self, proposal_id: str, content: str):
+        if not self.fts_enabled:
+            return
+        with self._group_write():
+            self._conn.execute(
+                "DELETE FROM proposal_documents WHERE proposal_id = ?", (proposal_id,)
+            )
+            if content:
+                self._conn.execute(
+                    "INSERT INTO proposal_documents (proposal_id, content) VALUES (?, ?)",
+                    (proposal_id, content),
+                )
+            # Document text is searched with the proposals, but a virtual
+            # table cannot carry the trigger.
+            self._conn.execute(
+                "UPDATE table_versions SET version = version + 1 WHERE name = 'proposals'"
+            )
+
+    def search_proposal_documents(self, query: str, limit: int = 1000) -> set[str]:
+        """Returns ids of proposals whose document text contains the query."""
+        query = query.strip()
+        # Trigram matching needs at least three characters.
+        if not self.fts_enabled or len(query) < 3:
+            return set()
+        phrase = '"' + query.replace('"', '""') + '"'
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                "SELECT proposal_id FROM proposal_documents WHERE proposal_documents MATCH ? LIMIT ?",
+                (phrase, limit),
+            )
+            return {row["proposal_id"] for row in cursor.fetchall()}
+
+    def get_maintenance_value(self, key: str, default: str = "") -> str:
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                "SELECT value FROM maintenance_state WHERE key = ?", (key,)
+            )
+            row = cursor.fetchone()
+        return row["value"] if row else default
+
+    def set_maintenance_value(self, key: str, value: str):
+        with self._group_write():
+            self._conn.execute(
+                """
+                INSERT INTO maintenance_state (key, value) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """,
+                (key, value),
+            )
+
+    def latest_change_offset(self) -> int:
+        with self._committed_reads():
+            return _change_log_head(self._conn)
+
+    def read_changes(
+        self,
+        after: int,
+        limit: int = CHANGE_LOG_READ_LIMIT,
+        tables: tuple[str, ...] = tuple(CHANGE_LOG_TABLES),
+    ) -> list[Change]:
+        """Change records with offsets above ``after``, oldest first.
+
+        Raises ChangeLogTruncatedError when retention already dropped records
+        the caller has not seen; it must then resynchronize from the tables.
+        """
+        placeholders = ", ".join("?" for _ in tables)
+        with self._committed_reads():
+            truncated = self._conn.execute(
+                "SELECT value FROM maintenance_state WHERE key = ?",
+                (CHANGE_LOG_TRUNCATED_KEY,),
+            ).fetchone()
+            if truncated and after < int(truncated[0]):
+                raise ChangeLogTruncatedError(int(truncated[0]))
+            cursor = self._conn.execute(
+                f"""
+                SELECT * FROM change_log
+                WHERE id > ? AND table_name IN ({placeholders})
+                ORDER BY id
+                LIMIT ?
+                """,
+                (after, *tables, limit),
+            )
+            rows = cursor.fetchall()
+        return [
+            Change(
+                offset=row["id"],
+                table=row["table_name"],
+                op=row["op"],
+                key=row["row_key"],
+                version=row["version"],
+                changed_at=row["changed_at"],
+            )
+            for row in rows
+        ]
+
+    def compact_change_log(self, before: float) -> int:
+        """Drops records older than ``before`` that a newer record for the same row supersedes.
+
+        Consumers still see every row's latest change, so compaction never
+        forces them to resynchronize.
+        """
+        with self._group_write():
+            cursor = self._conn.execute(
+                """
+                DELETE FROM change_log
+                WHERE changed_at < ?
+                  AND EXISTS (
+                      SELECT 1 FROM change_log AS newer
+                      WHERE newer.table_name = change_log.table_name
+                        AND newer.row_key = change_log.row_key
+                        AND newer.id > change_log.id
+                  )
+                """,
+                (before,),
             )
-            self._conn.commit()
+            return cursor.rowcount
 
-    def get_user_proposals(self, email: str) -> list[Proposal]:
-        with self._lock:
+    def expire_change_log(self, before: float) -> int:
+        """Drops every record older than ``before`` and remembers how far it went."""
+        with self._group_write():
+            last = self._conn.execute(
+                "SELECT MAX(id) FROM change_log WHERE changed_at < ?", (before,)
+            ).fetchone()[0]
+            if last is None:
+                return 0
+            cursor = self._conn.execute("DELETE FROM change_log WHERE id <= ?", (last,))
+            self._conn.execute(
+                """
+                INSERT INTO maintenance_state (key, value) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """,
+                (CHANGE_LOG_TRUNCATED_KEY, str(last)),
+            )
+            return cursor.rowcount
+
+    def get_referenced_files(self, file_names: list[str]) -> set[str]:
+        """Returns the subset of ``file_names`` that some proposal still points at."""
+        if not file_names:
+            return set()
+        placeholders = ", ".join("?" for _ in file_names)
+        with self._committed_reads():
+            cursor = self._conn.execute(
+                f"SELECT proposal_file FROM proposals WHERE proposal_file IN ({placeholders})",
+                file_names,
+            )
+            return {row["proposal_file"] for row in cursor.fetchall()}
+
+    def get_proposal_files_after(
+        self, after_id: str, limit: int
+    ) -> list[tuple[str, str]]:
+        with self._committed_reads():
             cursor = self._conn.execute(
                 """
-                SELECT *
+                SELECT id, proposal_file
                 FROM proposals
-                WHERE user_email = ?
-                ORDER BY datetime(created_at) DESC
+                WHERE id > ?
+                ORDER BY id
+                LIMIT ?
                 """,
-                (email,),
+                (after_id, limit),
             )
-            rows = cursor.fetchall()
-        return [self._row_to_proposal(row) for row in rows]
+            return [(row["id"], row["proposal_file"]) for row in cursor.fetchall()]
 
-    def get_all_proposals(self) -> list[Proposal]:
+    def take_rate_limit_token(
+        self, key: str, capacity: float, refill_per_second: float, now: float
+    ) -> float:
+        """Token bucket shared by every worker on this database.
+
+        Returns 0 when a token was taken, otherwise the seconds until one is
+        available. BEGIN IMMEDIATE serializes concurrent workers on the row.
+        """
         with self._lock:
-            cursor = self._conn.execute(
+            self._flush_writes()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                tokens = capacity
+                if row:
+                    elapsed = max(now - row["updated_at"], 0.0)
+                    tokens = min(capacity, row["tokens"] + elapsed * refill_per_second)
+                retry_after = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    retry_after = (1 - tokens) / refill_per_second
+                self._conn.execute(
+                    """
+                    INSERT INTO rate_limit_buckets (key, tokens, updated_at) VALUES (?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        tokens = excluded.tokens, updated_at = excluded.updated_at
+                    """,
+                    (key, tokens, now),
+                )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return retry_after
+
+    def get_auth_lockout(self, key: str) -> tuple[int, float]:
+        with self._committed_reads():
+            row = self._conn.execute(
+                "SELECT failures, locked_until FROM auth_failures WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return (row["failures"], row["locked_until"]) if row else (0, 0.0)
+
+    def set_auth_lockout(self, key: str, failures: int, locked_until: float):
+        with self._group_write():
+            if failures <= 0:
+                self._conn.execute("DELETE FROM auth_failures WHERE key = ?", (key,))
+            else:
+                self._conn.execute(
+                    """
+                    INSERT INTO auth_failures (key, failures, locked_until) VALUES (?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        failures = excluded.failures, locked_until = excluded.locked_until
+                    """,
+                    (key, failures, locked_until),
+                )
+
+    def add_auth_failure(
+        self, key: str, lockout_for: Callable[[int], float], now: float
+    ) -> float:
+        """Counts a failure and stores the lockout it earns; returns that lockout.
+
+        The upsert takes the write lock first, so concurrent failures in any
+        worker each add one.
+        """
+        with self._group_write():
+            failures = self._conn.execute(
                 """
-                SELECT *
-                FROM proposals
-                ORDER BY datetime(created_at) DESC
+                INSERT INTO auth_failures (key, failures, locked_until) VALUES (?, 1, 0)
+                ON CONFLICT(key) DO UPDATE SET failures = failures + 1
+                RETURNING failures
+                """,
+                (key,),
+            ).fetchone()[0]
+            lockout = lockout_for(failures)
+            self._conn.execute(
+                "UPDATE auth_failures SET locked_until = ? WHERE key = ?",
+                (now + lockout if lockout else 0.0, key),
+            )
+        return lockout
+
+    def prune_rate_limits(self, older_than: float):
+        with self._group_write():
+            self._conn.execute(
+                "DELETE FROM rate_limit_buckets WHERE updated_at < ?", (older_than,)
+            )
+
+    def _record_audit(
+        self,
+        actor: str,
+        entity: str,
+        entity_id: str,
+        action: str,
+        changes: dict[str, list[Any]],
+    ):
+        # Callers hold self._lock and commit together with their own write.
+        self._conn.execute(
+            """
+            INSERT INTO audit_events (created_at, actor, entity, entity_id, action, changes)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                datetime.datetime.now().isoformat(),
+                actor or "system",
+                entity,
+                entity_id,
+                action,
+                json.dumps(changes, ensure_ascii=False),
+            ),
+        )
+
+    def get_audit_events(
+        self, entity: str, entity_id: str, limit: int = 50
+    ) -> list[dict[str, str]]:
+        """Newest-first history for one entity, formatted for display."""
+        with self._committed_reads():
+            cursor = self._conn.execute(
                 """
+                SELECT created_at, actor, action, changes
+                FROM audit_events
+                WHERE entity = ? AND entity_id = ?
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (entity, entity_id, limit),
             )
             rows = cursor.fetchall()
-        return [self._row_to_proposal(row) for row in rows]
+        events = []
+        for row in rows:
+            changes = json.loads(row["changes"] or "{}")
+            if row["action"] in ("create", "import", "delete"):
+                summary = ""
+            else:
+                summary = "; ".join(
+                    f"{field.replace('_', ' ')}: {_audit_value(old)} → {_audit_value(new)}"
+                    for field, (old, new) in changes.items()
+                )
+            events.append(
+                {
+                    "when": (row["created_at"] or "").replace("T", " ")[:19],
+                    "actor": row["actor"],
+                    "action": row["action"].replace("_", " ").capitalize(),
+                    "summary": summary,
+                }
+            )
+        return events
 
-    def get_proposal(self, proposal_id: str) -> Optional[Proposal]:
+    def archive_audit_events(self, before: str, archive_dir: Path) -> int:
+        """Moves events older than ``before`` into one SQLite file per month."""
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        moved = 0
         with self._lock:
+            months = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT DISTINCT substr(created_at, 1, 7) FROM audit_events WHERE created_at < ?",
+                    (before,),
+                ).fetchall()
+            ]
+            for month in months:
+                self._flush_writes()
+                self._conn.execute(
+                    "ATTACH DATABASE ? AS archive",
+                    (str(archive_dir / f"audit-{month}.db"),),
+                )
+                try:
+                    self._conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS archive.audit_events (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            created_at TEXT NOT NULL,
+                            actor TEXT NOT NULL,
+                            entity TEXT NOT NULL,
+                            entity_id TEXT NOT NULL,
+                            action TEXT NOT NULL,
+                            changes TEXT NOT NULL
+                        )
+                        """
+                    )
+                    cursor = self._conn.execute(
+                        """
+                        INSERT OR IGNORE INTO archive.audit_events
+                        SELECT * FROM audit_events
+                        WHERE created_at < ? AND substr(created_at, 1, 7) = ?
+                        """,
+                        (before, month),
+                    )
+                    moved += cursor.rowcount
+                    self._conn.execute(
+                        "DELETE FROM audit_events WHERE created_at < ? AND substr(created_at, 1, 7) = ?",
+                        (before, month),
+                    )
+                    self._conn.commit()
+                except Exception:
+                    self._conn.rollback()
+                    raise
+                finally:
+                    self._conn.execute("DETACH DATABASE archive")
+        return moved
+
+    def get_owner_emails(self) -> set[str]:
+        """Every email with a user row or a proposal in this file."""
+        with self._committed_reads():
             cursor = self._conn.execute(
-                "SELECT * FROM proposals WHERE id = ?", (proposal_id,)
+                "SELECT email FROM users UNION SELECT user_email FROM proposals"
             )
-            row = cursor.fetchone()
-        if row:
-            return self._row_to_proposal(row)
-        return None
+            return {row[0] for row in cursor.fetchall()}
 
-    def update_proposal(self, proposal_id: str, updates: dict[str, str]) -> bool:
-        if not updates:
-            return False
-        updates = dict(updates)
-        updates["updated_at"] = datetime.datetime.now().isoformat()
-        columns = ", ".join(f"{key} = ?" for key in updates)
-        values = list(updates.values())
-        values.append(proposal_id)
+    def move_user_rows(self, emails: list[str], dest: Path) -> dict[str, int]:
+        """Moves users, their proposals and everything hanging off them to ``dest``.
+
+        Used by resharding while the app is stopped. Both files must be on
+        the current schema; rows are copied and deleted in one transaction.
+        """
+        moved: dict[str, int] = {}
         with self._lock:
-            cursor = self._conn.execute(
-                f"UPDATE proposals SET {columns} WHERE id = ?", values
-            )
-            self._conn.commit()
-            if cursor.rowcount > 0:
-                return True
-            exists_cursor = self._conn.execute(
-                "SELECT 1 FROM proposals WHERE id = ?", (proposal_id,)
+            self._flush_writes()
+            self._conn.execute("ATTACH DATABASE ? AS dest", (str(dest),))
+            try:
+                self._conn.execute("CREATE TEMP TABLE moving_users (email TEXT PRIMARY KEY)")
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO moving_users VALUES (?)", [(e,) for e in emails]
+                )
+                self._conn.execute(
+                    """
+                    CREATE TEMP TABLE moving_proposals AS
+                    SELECT id FROM proposals WHERE user_email IN (SELECT email FROM moving_users)
+                    """
+                )
+                selections = {
+                    "users": "email IN (SELECT email FROM moving_users)",
+                    "proposals": "id IN (SELECT id FROM moving_proposals)",
+                    "jobs": "proposal_id IN (SELECT id FROM moving_proposals)",
+                    "notification_outbox": "proposal_id IN (SELECT id FROM moving_proposals)",
+                    "audit_events": """
+                        (entity = 'proposal' AND entity_id IN (SELECT id FROM moving_proposals))
+                        OR (entity = 'user' AND entity_id IN (SELECT email FROM moving_users))
+                    """,
+                }
+                if self.fts_enabled:
+                    selections["proposal_documents"] = (
+                        "proposal_id IN (SELECT id FROM moving_proposals)"
+                    )
+                for table, where in selections.items():
+                    # By name, since migrated files may order columns differently;
+                    # AUTOINCREMENT ids are reassigned by the destination.
+                    columns = ", ".join(
+                        row["name"]
+                        for row in self._conn.execute(f"PRAGMA main.table_info({table})")
+                        if not (row["name"] == "id" and table in _AUTOINCREMENT_TABLES)
+                    )
+                    self._conn.execute(
+                        f"INSERT INTO dest.{table} ({columns}) SELECT {columns} FROM main.{table} WHERE {where} ORDER BY rowid"
+                    )
+                    moved[table] = self._conn.execute(
+                        f"DELETE FROM main.{table} WHERE {where}"
+                    ).rowcount
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            finally:
+                self._conn.execute("DROP TABLE IF EXISTS temp.moving_users")
+                self._conn.execute("DROP TABLE IF EXISTS temp.moving_proposals")
+                self._conn.execute("DETACH DATABASE dest")
+                self._reset_proposal_cache()
+        return moved
+
+    def backup_to(
+        self,
+        dest: Path,
+        pages: int = 256,
+        pause: float = 0.005,
+        max_restarts: int = 10,
+    ) -> int:
+        """Copies the live database to ``dest`` with SQLite's online backup API.
+
+        The copy runs on this connection ``pages`` pages at a time, and
+        ``self._lock`` is held only during a step. Writes made between steps go
+        through the same connection, so SQLite folds them into the copy instead
+        of restarting it, and grouped writes are committed before each step so
+        it never sees a half-finished transaction.
+        A commit from another process does restart the copy. After
+        ``max_restarts`` of those, the remainder is copied in one step.
+        Returns the number of restarts.
+        """
+        conn = self._conn
+        target = sqlite3.connect(dest)
+        restarts = 0
+        last_remaining = None
+
+        class TooManyRestarts(Exception):
+            pass
+
+        def progress(status: int, remaining: int, total: int):
+            nonlocal restarts, last_remaining
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts > max_restarts:
+                    raise TooManyRestarts
+            last_remaining = remaining
+            # Let writers in between steps.
+            self._lock.release()
+            try:
+                time.sleep(pause)
+            finally:
+                self._lock.acquire()
+            self._flush_writes()
+
+        self._lock.acquire()
+        try:
+            self._flush_writes()
+            try:
+                conn.backup(target, pages=pages, progress=progress)
+            except TooManyRestarts:
+                conn.backup(target)
+        finally:
+            self._lock.release()
+            target.close()
+        return restarts
+
+    def create_api_token(self, email: str, label: str = "") -> str:
+        """Issues a bearer token for ``email``; only its SHA-256 is stored."""
+        token = secrets.token_urlsafe(32)
+        with self._group_write():
+            self._conn.execute(
+                "INSERT INTO api_tokens (token_hash, email, label, created_at) VALUES (?, ?, ?, ?)",
+                (
+                    _token_digest(token),
+                    email,
+                    label,
+                    datetime.datetime.now().isoformat(),
+                ),
             )
-            return exists_cursor.fetchone() is not None
+        return token
 
-    def update_proposal_status(
-        self, proposal_id: str, status: str, review_results: str
-    ) -> bool:
-        return self.update_proposal(
-            proposal_id,
-            {
-                "status": status,
-                "review_results": review_results,
-            },
-        )
+    def get_api_token_email(self, token: str) -> Optional[str]:
+        with self._committed_reads():
+            row = self._conn.execute(
+                "SELECT email FROM api_tokens WHERE token_hash = ?",
+                (_token_digest(token),),
+            ).fetchone()
+        return row["email"] if row else None
 
+    def get_api_token_user(self, token: str) -> Optional[User]:
+        email = self.get_api_token_email(token)
+        return self.get_user(email) if email else None
 
-    def update_user_password(
-        self, email: str, password_hash: str, must_reset: bool = False
-    ) -> bool:
-        with self._lock:
+    def create_session(self, token: str, email: str, expires_at: float):
+        with self._group_write():
+            self._conn.execute(
+                "INSERT INTO sessions (token_hash, email, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                (_token_digest(token), email, datetime.datetime.now().isoformat(), expires_at),
+            )
+
+    def get_session(self, token: str) -> Optional[tuple[str, float]]:
+        """Returns (email, expires_at) for a live or expired session, None if revoked."""
+        with self._committed_reads():
+            row = self._conn.execute(
+                "SELECT email, expires_at FROM sessions WHERE token_hash = ?",
+                (_token_digest(token),),
+            ).fetchone()
+        return (row["email"], row["expires_at"]) if row else None
+
+    def extend_session(self, token: str, expires_at: float) -> bool:
+        with self._group_write():
             cursor = self._conn.execute(
-                "UPDATE users SET password_hash = ?, must_reset_password = ? WHERE email = ?",
-                (password_hash, 1 if must_reset else 0, email),
+                "UPDATE sessions SET expires_at = MAX(expires_at, ?) WHERE token_hash = ?",
+                (expires_at, _token_digest(token)),
             )
-            self._conn.commit()
             return cursor.rowcount > 0
-    def delete_proposal(self, proposal_id: str) -> bool:
-        with self._lock:
+
+    def delete_session(self, token: str):
+        with self._group_write():
+            self._conn.execute(
+                "DELETE FROM sessions WHERE token_hash = ?", (_token_digest(token),)
+            )
+
+    def delete_user_sessions(self, email: str, keep: Optional[str] = None) -> int:
+        """Revokes every session of ``email`` except the one for token ``keep``."""
+        with self._group_write():
             cursor = self._conn.execute(
-                "DELETE FROM proposals WHERE id = ?", (proposal_id,)
+                "DELETE FROM sessions WHERE email = ? AND token_hash != ?",
+                (email, _token_digest(keep) if keep else ""),
             )
-            self._conn.commit()
-            return cursor.rowcount > 0
+            return cursor.rowcount
 
-    def list_users(self) -> list[dict[str, str]]:
-        with self._lock:
+    def prune_sessions(self, now: float) -> int:
+        with self._group_write():
+            cursor = self._conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+            return cursor.rowcount
+
+    def table_version(self, table: str) -> int:
+        """Changes whenever a row of ``table`` (one of VERSIONED_TABLES) changes."""
+        with self._committed_reads():
+            row = self._conn.execute(
+                "SELECT version FROM table_versions WHERE name = ?", (table,)
+            ).fetchone()
+            return row[0] if row else 0
+
+    def count_users(self) -> int:
+        with self._committed_reads():
+            return self._conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def list_users(self, limit: int = -1, offset: int = 0) -> list[dict[str, str]]:
+        with self._committed_reads():
             cursor = self._conn.execute(
                 """
                 SELECT email, created_at, is_admin
                 FROM users
-                ORDER BY datetime(created_at) DESC
-                """
+                ORDER BY datetime(created_at) DESC, email
+                LIMIT ? OFFSET ?
+                """,
+                (limit, offset),
             )
             return [
                 {
@@ -305,20 +2019,469 @@ class Database:
             ]
 
 
-db = Database()
+class _Descending:
+    """Reverses the order of one component of a merge key."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: "_Descending") -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+
+def _created_key(created_at: str) -> str:
+    # The same normalization as SQLite's datetime(created_at) in ORDER BY.
+    try:
+        moment = datetime.datetime.fromisoformat(created_at)
+    except (TypeError, ValueError):
+        return ""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _newest_first(results: Iterable[list[Any]], tie: str) -> Iterator[Any]:
+    """k-way merge of per-shard rows ordered by datetime(created_at) DESC, ``tie``."""
+    return heapq.merge(
+        *results,
+        key=lambda row: (_created_key(row["created_at"]), _Descending(row[tie])),
+        reverse=True,
+    )
+
+
+class ShardedDatabase:
+    """Users and their proposals spread over several Database files by email hash.
+
+    Each shard is a full Database with its own connection, lock and group
+    commit, so writes for different users proceed in parallel. A user's
+    proposals, jobs, audit trail, notifications and document text live on
+    the user's shard; sessions, tokens, rate limits and maintenance state
+    stay on shard 0. Lookups by email go to one shard, a proposal id is
+    located once and remembered, and listings are merged from every shard.
+    Job and notification ids encode their shard. Batch writes that span
+    shards commit once per shard rather than atomically.
+    """
+
+    # Shared tables, served by shard 0.
+    _HOME_METHODS = frozenset(
+        {
+            "get_maintenance_value",
+            "set_maintenance_value",
+            "take_rate_limit_token",
+            "get_auth_lockout",
+            "set_auth_lockout",
+            "add_auth_failure",
+            "prune_rate_limits",
+            "create_api_token",
+            "get_api_token_email",
+            "create_session",
+            "get_session",
+            "extend_session",
+            "delete_session",
+            "delete_user_sessions",
+            "prune_sessions",
+        }
+    )
+
+    def __init__(self, db_path: str | Path, count: int):
+        self.db_path = Path(db_path)
+        self.shards = [Database(shard_path(self.db_path, index)) for index in range(count)]
+        self.home = self.shards[0]
+        self._locations: OrderedDict[str, Database] = OrderedDict()
+        self._locations_lock = threading.Lock()
+        self._next_job_shard = 0
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._HOME_METHODS:
+            return getattr(self.home, name)
+        raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+
+    def open(self) -> sqlite3.Connection:
+        for shard in self.shards:
+            shard.open()
+        return self.home.open()
+
+    @property
+    def lock_wait_seconds(self) -> float:
+        return max(shard.lock_wait_seconds for shard in self.shards)
+
+    def proposal_cache_stats(self) -> dict[str, int]:
+        totals = {"size": 0, "hits": 0, "misses": 0}
+        for shard in self.shards:
+            for key, value in shard.proposal_cache_stats().items():
+                totals[key] += value
+        return totals
+
+    def for_email(self, email: str) -> Database:
+        return self.shards[shard_for_email(email, len(self.shards))]
+
+    def _group_by_email(self, items: Iterable[Any], email_of) -> dict[Database, list[Any]]:
+        groups: dict[Database, list[Any]] = {}
+        for item in items:
+            groups.setdefault(self.for_email(email_of(item)), []).append(item)
+        return groups
+
+    def _remember(self, proposal_id: str, shard: Database):
+        with self._locations_lock:
+            self._locations[proposal_id] = shard
+            self._locations.move_to_end(proposal_id)
+            while len(self._locations) > PROPOSAL_LOCATION_CACHE_SIZE:
+                self._locations.popitem(last=False)
+
+    def _locate(self, proposal_id: str) -> Optional[Database]:
+        # Proposals never change shard while the app runs, so a remembered
+        # location stays right until the proposal is deleted.
+        with self._locations_lock:
+            shard = self._locations.get(proposal_id)
+            if shard is not None:
+                self._locations.move_to_end(proposal_id)
+                return shard
+        for shard in self.shards:
+            if shard.get_proposal(proposal_id) is not None:
+                self._remember(proposal_id, shard)
+                return shard
+        return None
+
+    def _global_id(self, shard: Database, local_id: int) -> int:
+        return local_id * len(self.shards) + self.shards.index(shard)
+
+    def _local_id(self, global_id: int) -> tuple[Database, int]:
+        return self.shards[global_id % len(self.shards)], global_id // len(self.shards)
+
+    def _group_ids(self, ids: list[int]) -> dict[Database, list[int]]:
+        groups: dict[Database, list[int]] = {}
+        for global_id in ids:
+            shard, local_id = self._local_id(global_id)
+            groups.setdefault(shard, []).append(local_id)
+        return groups
+
+    def get_user(self, email: str) -> Optional[User]:
+        return self.for_email(email).get_user(email)
+
+    def add_user(self, user: User):
+        self.for_email(user.email).add_user(user)
+
+    def existing_user_emails(self, emails: list[str]) -> set[str]:
+        found: set[str] = set()
+        for shard, group in self._group_by_email(emails, lambda email: email).items():
+            found |= shard.existing_user_emails(group)
+        return found
+
+    def import_users(self, users: list[User], actor: str = "") -> set[str]:
+        inserted: set[str] = set()
+        for shard, group in self._group_by_email(users, lambda user: user.email).items():
+            inserted |= shard.import_users(group, actor)
+        return inserted
+
+    def update_user_password(
+        self, email: str, password_hash: str, must_reset: bool = False, actor: str = ""
+    ) -> bool:
+        return self.for_email(email).update_user_password(
+            email, password_hash, must_reset, actor
+        )
+
+    def get_api_token_user(self, token: str) -> Optional[User]:
+        email = self.home.get_api_token_email(token)
+        return self.get_user(email) if email else None
+
+    def count_users(self) -> int:
+        return sum(shard.count_users() for shard in self.shards)
+
+    def list_users(self, limit: int = -1, offset: int = 0) -> list[dict[str, str]]:
+        window = -1 if limit < 0 else offset + limit
+        merged = _newest_first((shard.list_users(window) for shard in self.shards), "email")
+        return list(itertools.islice(merged, offset, None if limit < 0 else offset + limit))
+
+    def add_proposal(self, proposal: Proposal, actor: str = ""):
+        shard = self.for_email(proposal["user_email"])
+        shard.add_proposal(proposal, actor)
+        self._remember(proposal["id"], shard)
+
+    def import_proposals(self, proposals: list[Proposal], actor: str = "") -> int:
+        groups = self._group_by_email(proposals, lambda proposal: proposal["user_email"])
+        return sum(shard.import_proposals(group, actor) for shard, group in groups.items())
+
+    def get_user_proposals(self, email: str) -> list[Proposal]:
+        return self.for_email(email).get_user_proposals(email)
+
+    def get_all_proposals(self) -> list[Proposal]:
+        return list(_newest_first((shard.get_all_proposals() for shard in self.shards), "id"))
+
+    def count_proposals(
+        self,
+        user_email: Optional[str] = None,
+        status: str = "All",
+        search: str = "",
+        search_fields: tuple[str, ...] = ("title", "description"),
+    ) -> int:
+        if user_email is not None:
+            return self.for_email(user_email).count_proposals(
+                user_email, status, search, search_fields
+            )
+        return sum(
+            shard.count_proposals(None, status, search, search_fields) for shard in self.shards
+        )
+
+    def query_proposals(
+        self,
+        user_email: Optional[str] = None,
+        status: str = "All",
+        search: str = "",
+        search_fields: tuple[str, ...] = ("title", "description"),
+        limit: int = 25,
+        offset: int = 0,
+    ) -> list[Proposal]:
+        if user_email is not None:
+            return self.for_email(user_email).query_proposals(
+                user_email, status, search, search_fields, limit, offset
+            )
+        # Every shard returns its first offset + limit rows; the merge then
+        # skips to the requested page.
+        window = -1 if limit < 0 else offset + limit
+        pages = (
+            shard.query_proposals(None, status, search, search_fields, window, 0)
+            for shard in self.shards
+        )
+        merged = _newest_first(pages, "id")
+        return list(itertools.islice(merged, offset, None if limit < 0 else offset + limit))
+
+    def get_proposal(self, proposal_id: str) -> Optional[Proposal]:
+        shard = self._locate(proposal_id)
+        return shard.get_proposal(proposal_id) if shard else None
+
+    def update_proposal(
+        self,
+        proposal_id: str,
+        updates: dict[str, str],
+        actor: str = "",
+        expected_version: Optional[int] = None,
+    ) -> Optional[Proposal]:
+        shard = self._locate(proposal_id)
+        if shard is None:
+            return None
+        return shard.update_proposal(proposal_id, updates, actor, expected_version)
+
+    def update_proposal_statuses(
+        self,
+        updates: list[tuple[str, str, Optional[str], Optional[int]]],
+        actor: str = "",
+    ) -> tuple[list[str], list[str]]:
+        groups: dict[Database, list[tuple[str, str, Optional[str], Optional[int]]]] = {}
+        for update in updates:
+            shard = self._locate(update[0])
+            if shard is not None:
+                groups.setdefault(shard, []).append(update)
+        updated: list[str] = []
+        stale: list[str] = []
+        for shard, group in groups.items():
+            shard_updated, shard_stale = shard.update_proposal_statuses(group, actor)
+            updated.extend(shard_updated)
+            stale.extend(shard_stale)
+        return updated, stale
+
+    def update_proposal_status(
+        self,
+        proposal_id: str,
+        status: str,
+        review_results: Optional[str] = None,
+        actor: str = "",
+        expected_version: Optional[int] = None,
+    ) -> Optional[Proposal]:
+        shard = self._locate(proposal_id)
+        if shard is None:
+            return None
+        return shard.update_proposal_status(
+            proposal_id, status, review_results, actor, expected_version
+        )
+
+    def delete_proposal(self, proposal_id: str, actor: str = "") -> bool:
+        shard = self._locate(proposal_id)
+        if shard is None:
+            return False
+        deleted = shard.delete_proposal(proposal_id, actor)
+        with self._locations_lock:
+            self._locations.pop(proposal_id, None)
+        return deleted
+
+    def set_proposal_file_hash(self, proposal_id: str, file_hash: str) -> bool:
+        shard = self._locate(proposal_id)
+        return shard.set_proposal_file_hash(proposal_id, file_hash) if shard else False
+
+    def get_referenced_files(self, file_names: list[str]) -> set[str]:
+        return set().union(*(shard.get_referenced_files(file_names) for shard in self.shards))
+
+    def get_proposal_files_after(self, after_id: str, limit: int) -> list[tuple[str, str]]:
+        merged = heapq.merge(
+            *(shard.get_proposal_files_after(after_id, limit) for shard in self.shards),
+            key=lambda row: row[0],
+        )
+        return list(itertools.islice(merged, limit))
+
+    def index_proposal_document(self, proposal_id: str, content: str):
+        shard = self._locate(proposal_id)
+        if shard is not None:
+            shard.index_proposal_document(proposal_id, content)
+
+    def search_proposal_documents(self, query: str, limit: int = 1000) -> set[str]:
+        return set().union(
+            *(shard.search_proposal_documents(query, limit) for shard in self.shards)
+        )
+
+    def enqueue_job(
+        self,
+        proposal_id: str,
+        kind: str,
+        payload: Optional[dict[str, Any]] = None,
+        max_attempts: int = 3,
+    ) -> int:
+        shard = self._locate(proposal_id) or self.home
+        return self._global_id(shard, shard.enqueue_job(proposal_id, kind, payload, max_attempts))
+
+    def claim_job(self) -> Optional[dict[str, Any]]:
+        # Start from a different shard each time so no shard's queue starves.
+        start = self._next_job_shard
+        self._next_job_shard = (start + 1) % len(self.shards)
+        for shard in self.shards[start:] + self.shards[:start]:
+            job = shard.claim_job()
+            if job is not None:
+                job["id"] = self._global_id(shard, job["id"])
+                return job
+        return None
+
+    def complete_job(self, job_id: int):
+        shard, local_id = self._local_id(job_id)
+        shard.complete_job(local_id)
+
+    def fail_job(self, job_id: int, error: str, retry_delay: float) -> bool:
+        shard, local_id = self._local_id(job_id)
+        return shard.fail_job(local_id, error, retry_delay)
+
+    def requeue_stale_jobs(self, stale_after: float) -> int:
+        return sum(shard.requeue_stale_jobs(stale_after) for shard in self.shards)
+
+    def has_pending_job(self, proposal_id: str, kind: str) -> bool:
+        shard = self._locate(proposal_id)
+        return shard.has_pending_job(proposal_id, kind) if shard else False
+
+    def get_proposal_jobs(self, proposal_id: str) -> list[dict[str, str]]:
+        shard = self._locate(proposal_id)
+        if shard is None:
+            return []
+        jobs = shard.get_proposal_jobs(proposal_id)
+        for job in jobs:
+            job["id"] = str(self._global_id(shard, int(job["id"])))
+        return jobs
+
+    def claim_notifications(
+        self, settle_seconds: float, max_recipients: int
+    ) -> list[dict[str, Any]]:
+        messages = []
+        for shard in self.shards:
+            for message in shard.claim_notifications(settle_seconds, max_recipients):
+                message["id"] = self._global_id(shard, message["id"])
+                messages.append(message)
+        return messages
+
+    def mark_notifications_sent(self, ids: list[int]):
+        for shard, local_ids in self._group_ids(ids).items():
+            shard.mark_notifications_sent(local_ids)
+
+    def fail_notifications(
+        self, ids: list[int], error: str, retry_delay: float, max_attempts: int
+    ):
+        for shard, local_ids in self._group_ids(ids).items():
+            shard.fail_notifications(local_ids, error, retry_delay, max_attempts)
+
+    def release_stale_notifications(self, stale_after: float) -> int:
+        return sum(shard.release_stale_notifications(stale_after) for shard in self.shards)
+
+    def get_audit_events(
+        self, entity: str, entity_id: str, limit: int = 50
+    ) -> list[dict[str, str]]:
+        if entity == "user":
+            return self.for_email(entity_id).get_audit_events(entity, entity_id, limit)
+        shard = self._locate(entity_id) if entity == "proposal" else None
+        if shard is not None:
+            return shard.get_audit_events(entity, entity_id, limit)
+        # A deleted proposal's history stays on a shard nobody remembers.
+        for shard in self.shards:
+            events = shard.get_audit_events(entity, entity_id, limit)
+            if events:
+                return events
+        return []
+
+    def archive_audit_events(self, before: str, archive_dir: Path) -> int:
+        return sum(
+            shard.archive_audit_events(
+                before, archive_dir if index == 0 else archive_dir / f"shard{index}"
+            )
+            for index, shard in enumerate(self.shards)
+        )
+
+    def table_version(self, table: str) -> int:
+        return sum(shard.table_version(table) for shard in self.shards)
+
+
+db = (
+    ShardedDatabase(DATABASE_PATH, DATABASE_SHARDS)
+    if DATABASE_SHARDS > 1
+    else Database()
+)
+auth_limiter = build_limiter(db)
+sessions = SessionStore(db)
+upload_queue = AdmissionQueue()
+load_shedder = LoadShedder(lambda: db.lock_wait_seconds)
+SHED_MESSAGE = "The server is busy with submissions; please try again in a moment."
 admin_email = "admin@example.com"
-if not db.get_user(admin_email):
-    admin_password_hash = bcrypt.hashpw(
-        "admin123".encode("utf-8"), bcrypt.gensalt()
-    ).decode("utf-8")
+# Precomputed bcrypt hash of the default "admin123" password so seeding never
+# pays for a hash at startup.
+ADMIN_SEED_PASSWORD_HASH = "$2b$12$NnCT6fifligWa.CkUSBCbuIT6R8gMAa4aquXCILNLampHazfG9jhO"
+
+
+def ensure_admin_user():
+    if db.get_user(admin_email):
+        return
     admin_user = User(
-        email=admin_email, password_hash=admin_password_hash, is_admin=True
+        email=admin_email, password_hash=ADMIN_SEED_PASSWORD_HASH, is_admin=True
     )
-    db.add_user(admin_user)
+    try:
+        db.add_user(admin_user)
+    except ValueError:
+        pass  # Another worker seeded it first.
+
+
+SECTION_ROUTES = {
+    "dashboard": "/dashboard",
+    "create_proposal": "/proposals/new",
+    "my_proposals": "/proposals",
+    "admin_panel": "/admin",
+    "user_panel": "/admin/users",
+}
+ADMIN_SECTIONS = {"admin_panel", "user_panel"}
+LIST_PAGE_SIZE = 25
+PROPOSAL_STATUSES = ("Submitted", "Under Review", "Approved", "Rejected")
+
+
+def temporary_password() -> str:
+    return "".join(secrets.choice(string.ascii_letters + string.digits) for _ in range(12))
+
+
+def page_window(page: int, total: int, page_size: int = LIST_PAGE_SIZE) -> tuple[int, int]:
+    """Clamps a zero-based page to the available rows; returns (page, page_count)."""
+    page_count = max((total + page_size - 1) // page_size, 1)
+    return min(max(page, 0), page_count - 1), page_count
 
 
 class AuthState(rx.State):
     authenticated_user: Optional[str] = None
+    session_token: str = rx.Cookie(
+        "", name="session_token", max_age=SESSION_COOKIE_MAX_AGE, same_site="strict"
+    )
     active_page: str = "dashboard"
     email: str = ""
     password: str = ""
@@ -361,23 +2524,6 @@ class AuthState(rx.State):
         else:
             self.confirm_password_error = None
 
-    @rx.event
-    def on_email_change(self, value: str):
-        self.email = value
-        self._validate_email()
-
-    @rx.event
-    def on_password_change(self, value: str):
-        self.password = value
-        self._validate_password()
-        if self.confirm_password:
-            self._validate_confirm_password()
-
-    @rx.event
-    def on_confirm_password_change(self, value: str):
-        self.confirm_password = value
-        self._validate_confirm_password()
-
     def _validate_signup_fields(self):
         self._validate_email()
         self._validate_password()
@@ -387,8 +2533,7 @@ class AuthState(rx.State):
         self._validate_email()
         self._validate_password()
 
-    @rx.var
-    def is_signin_form_valid(self) -> bool:
+    def _is_signin_form_valid(self) -> bool:
         return bool(
             self.email
             and self.password
@@ -396,23 +2541,42 @@ class AuthState(rx.State):
             and (not self.password_error)
         )
 
-    @rx.var
-    def is_signup_form_valid(self) -> bool:
-        return self.is_signin_form_valid and bool(
+    def _is_signup_form_valid(self) -> bool:
+        return self._is_signin_form_valid() and bool(
             self.confirm_password and (not self.confirm_password_error)
         )
 
+    def _take_form(self, form_data: dict[str, Any]):
+        # The auth forms are uncontrolled; fields arrive only on submit.
+        self.email = str(form_data.get("email", "")).strip()
+        self.password = str(form_data.get("password", ""))
+        self.confirm_password = str(form_data.get("confirm_password", ""))
+
+    def _client_ip(self) -> str:
+        return self.router.session.client_ip or "unknown"
+
     @rx.event
-    def handle_signin(self):
+    def handle_signin(self, form_data: dict[str, Any]):
+        self._take_form(form_data)
         self._validate_signin_fields()
-        if not self.is_signin_form_valid:
+        if not self._is_signin_form_valid():
             return rx.toast.error("Please correct the errors before submitting.")
+        # Throttle before the user lookup and bcrypt check so floods stay cheap.
+        account = self.email.strip().lower()
+        retry_after = auth_limiter.lockout_remaining(account) or auth_limiter.admit(
+            (SIGNIN_PER_IP, self._client_ip()),
+            (SIGNIN_PER_ACCOUNT, account),
+        )
+        if retry_after:
+            return rx.toast.error(retry_message(retry_after))
         self.loading = True
         yield
         user = db.get_user(self.email)
         if user and bcrypt.checkpw(
             self.password.encode("utf-8"), user.password_hash.encode("utf-8")
         ):
+            auth_limiter.record_success(account)
+            self.session_token = sessions.create(user.email)
             self.authenticated_user = user.email
             self.loading = False
             self.show_force_password_modal = bool(getattr(user, 'must_reset_password', False))
@@ -423,13 +2587,15 @@ class AuthState(rx.State):
             yield rx.redirect("/dashboard")
             yield rx.toast.success("Signed in successfully!")
         else:
+            auth_limiter.record_failure(account)
             self.loading = False
             yield rx.toast.error("Invalid email or password.")
 
     @rx.event
-    def handle_signup(self):
+    def handle_signup(self, form_data: dict[str, Any]):
+        self._take_form(form_data)
         self._validate_signup_fields()
-        if not self.is_signup_form_valid:
+        if not self._is_signup_form_valid():
             return rx.toast.error("Please correct the errors before submitting.")
         self.loading = True
         yield
@@ -455,6 +2621,32 @@ class AuthState(rx.State):
     def set_active_page(self, page: str):
         self.active_page = page
         self._reset_fields()
+        return rx.redirect(SECTION_ROUTES.get(page, "/dashboard"))
+
+    def _sync_session(self):
+        """Re-derives the signed-in user from the session cookie."""
+        email = sessions.resolve(self.session_token)
+        if email is None:
+            self.session_token = ""
+        self.authenticated_user = email
+
+    def _has_live_session(self) -> bool:
+        """Re-checks the session before a privileged action.
+
+        Websocket events keep the state of the page that sent them, so a
+        session revoked or expired since it loaded would otherwise still work.
+        """
+        self._sync_session()
+        return self.is_authenticated
+
+    @rx.event
+    def open_section(self, page: str):
+        self._sync_session()
+        if not self.is_authenticated:
+            return rx.redirect("/signin")
+        if page in ADMIN_SECTIONS and not self.is_admin:
+            return rx.redirect("/dashboard")
+        self.active_page = page
 
     def _reset_fields(self):
         self.email = ""
@@ -469,12 +2661,10 @@ class AuthState(rx.State):
         self.issued_temp_password = ""
         self.show_password_reset_modal = False
 
-    @rx.event
-    def set_page(self, page: str):
-        pass
-
     @rx.event
     def logout(self):
+        sessions.revoke(self.session_token)
+        self.session_token = ""
         self.authenticated_user = None
         self._reset_fields()
         self.show_force_password_modal = False
@@ -483,11 +2673,11 @@ class AuthState(rx.State):
         self.new_password_error = None
         return rx.redirect("/signin")
 
-    @rx.var
+    @cached_var("authenticated_user")
     def is_authenticated(self) -> bool:
         return self.authenticated_user is not None
 
-    @rx.var
+    @cached_var("authenticated_user")
     def is_admin(self) -> bool:
         if self.authenticated_user:
             user = db.get_user(self.authenticated_user)
@@ -496,49 +2686,20 @@ class AuthState(rx.State):
 
     @rx.event
     def check_auth(self):
+        self._sync_session()
         if not self.is_authenticated:
             return rx.redirect("/signin")
 
+    @rx.event
+    def redirect_if_authenticated(self):
+        self._sync_session()
+        if self.is_authenticated:
+            return rx.redirect("/dashboard")
+
     @rx.event
     def toggle_dark_mode(self):
         self.dark_mode = not self.dark_mode
 
-    @rx.var
-    def app_shell_classes(self) -> str:
-        return (
-            "bg-gradient-to-br from-slate-900 via-slate-950 to-slate-900 text-slate-100"
-            if self.dark_mode
-            else "bg-gradient-to-br from-slate-100 via-white to-slate-50 text-slate-900"
-        )
-
-    @rx.var
-    def sidebar_classes(self) -> str:
-        return (
-            "hidden md:flex md:flex-col min-h-screen w-64 shrink-0 border-r border-white/10 bg-slate-900/60 text-slate-100 backdrop-blur-xl"
-            if self.dark_mode
-            else "hidden md:flex md:flex-col min-h-screen w-64 shrink-0 border-r border-white/40 bg-white/70 text-slate-900 backdrop-blur-xl"
-        )
-
-    @rx.var
-    def surface_card(self) -> str:
-        return (
-            "bg-white/80 border border-white/30 shadow-xl backdrop-blur-xl"
-            if not self.dark_mode
-            else "bg-white/10 border border-white/10 shadow-2xl backdrop-blur-2xl"
-        )
-
-    @rx.var
-    def muted_text_class(self) -> str:
-        return "text-slate-400" if self.dark_mode else "text-slate-500"
-
-    @rx.var
-    def accent_button(self) -> str:
-        return (
-            "bg-gradient-to-r from-teal-500 to-cyan-600 hover:from-teal-500 hover:to-emerald-500 text-white"
-            if not self.dark_mode
-            else "bg-gradient-to-r from-cyan-400 to-blue-500 hover:from-cyan-300 hover:to-indigo-400 text-slate-900"
-        )
-
     @rx.event
     def open_password_reset_modal(self):
         self.reset_email = (self.email or "").strip()
@@ -576,15 +2737,22 @@ class AuthState(rx.State):
 
     @rx.event
     def submit_new_password(self):
-        if not self.authenticated_user:
+        if not self._has_live_session():
             return rx.toast.error("You must be signed in.")
         if not self._validate_new_passwords():
             return
         hashed = bcrypt.hashpw(
             self.new_password.strip().encode("utf-8"), bcrypt.gensalt()
         ).decode("utf-8")
-        if not db.update_user_password(self.authenticated_user, hashed, must_reset=False):
+        if not db.update_user_password(
+            self.authenticated_user,
+            hashed,
+            must_reset=False,
+            actor=self.authenticated_user,
+        ):
             return rx.toast.error("Unable to update password. Please try again.")
+        # Other browsers signed in with the old password are signed out.
+        sessions.revoke_user(self.authenticated_user, keep=self.session_token)
         self.new_password = ""
         self.new_password_confirm = ""
         self.new_password_error = None
@@ -615,18 +2783,29 @@ class AuthState(rx.State):
             return
         lookup_email = self.reset_email.strip()
         self.reset_email = lookup_email
+        retry_after = auth_limiter.admit(
+            (RESET_PER_IP, self._client_ip()),
+            (RESET_PER_ACCOUNT, lookup_email.lower()),
+        )
+        if retry_after:
+            self.reset_error = retry_message(retry_after)
+            return
         user = db.get_user(lookup_email)
         if not user:
             self.reset_error = "No account found with this email."
             return
-        temp_password = "".join(
-            secrets.choice(string.ascii_letters + string.digits) for _ in range(12)
-        )
+        temp_password = temporary_password()
         password_hash = bcrypt.hashpw(
             temp_password.encode("utf-8"), bcrypt.gensalt()
         ).decode("utf-8")
-        if not db.update_user_password(user.email, password_hash, must_reset=True):
+        if not db.update_user_password(
+            user.email,
+            password_hash,
+            must_reset=True,
+            actor=f"self-service reset from {self._client_ip()}",
+        ):
             return rx.toast.error("Failed to update password.")
+        sessions.revoke_user(user.email)
         self.show_password_reset_modal = True
         self.show_force_password_modal = False
         self.new_password = ""
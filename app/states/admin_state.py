@@ -1,9 +1,31 @@
 import reflex as rx
+import asyncio
 import datetime
-from pathlib import Path
-from typing import Any
-from app.state import AuthState, db, Proposal
-from app.states.proposal_state import ProposalState
+from typing import Any, Callable
+from app.state import (
+    AuthState,
+    LIST_PAGE_SIZE,
+    SHED_MESSAGE,
+    db,
+    load_shedder,
+    page_window,
+    Proposal,
+    StaleProposalError,
+)
+from app.states.selection_state import SelectionState
+from app.services.previews import ensure_preview
+from app.services.storage import remove_upload
+from app.services.var_profile import cached_var
+from app.services.query_cache import SharedQueryCache
+
+ADMIN_SEARCH_FIELDS = ("title", "description", "full_name", "user_email")
+STALE_PROPOSAL_MESSAGE = "Another administrator changed this proposal first. Showing the latest version."
+# Every admin sees the same listings, so sessions share one copy of each page.
+admin_listings = SharedQueryCache()
+
+
+def _shared_listing(table: str, key: tuple, compute: Callable[[], Any]) -> Any:
+    return admin_listings.get((table, db.table_version(table), *key), compute)
 
 
 class AdminState(AuthState):
@@ -11,43 +33,84 @@ class AdminState(AuthState):
     refresh_token: str = ""
     search_query: str = ""
     status_filter: str = "All"
+    admin_proposal_page: int = 0
+    user_page: int = 0
     pending_search_query: str = ""
     admin_delete_dialog_open: bool = False
     admin_pending_delete: Proposal | None = None
+    importing: bool = False
+    import_summary: str = ""
+    import_errors: list[str] = []
 
-    @rx.var
-    def all_proposals(self) -> list[Proposal]:
+    @cached_var("refresh_token", "status_filter", "search_query", AuthState.is_admin)
+    def filtered_admin_proposal_count(self) -> int:
         if not self.is_admin:
-            return []
-        _ = self.refresh_token
-        return db.get_all_proposals()
+            return 0
+        status, search = self.status_filter, self.search_query
+        return _shared_listing(
+            "proposals",
+            ("count", status, search),
+            lambda: db.count_proposals(
+                status=status, search=search, search_fields=ADMIN_SEARCH_FIELDS
+            ),
+        )
+
+    @cached_var("admin_proposal_page", "filtered_admin_proposal_count")
+    def admin_proposal_page_count(self) -> int:
+        return page_window(self.admin_proposal_page, self.filtered_admin_proposal_count)[1]
+
+    @cached_var("admin_proposal_page", "filtered_admin_proposal_count")
+    def current_admin_proposal_page(self) -> int:
+        return page_window(self.admin_proposal_page, self.filtered_admin_proposal_count)[0] + 1
 
-    @rx.var
+    @cached_var(
+        "refresh_token",
+        "status_filter",
+        "search_query",
+        "admin_proposal_page",
+        "filtered_admin_proposal_count",
+        AuthState.is_admin,
+    )
     def filtered_admin_proposals(self) -> list[Proposal]:
         if not self.is_admin:
             return []
-        _ = self.refresh_token
-        proposals = db.get_all_proposals()
-        search_lower = self.search_query.lower()
-        return [
-            proposal
-            for proposal in proposals
-            if (self.status_filter == "All" or proposal["status"] == self.status_filter)
-            and (
-                search_lower in proposal["title"].lower()
-                or search_lower in proposal["description"].lower()
-                or search_lower in proposal["full_name"].lower()
-                or search_lower in proposal["user_email"].lower()
-            )
-        ]
+        page, _ = page_window(self.admin_proposal_page, self.filtered_admin_proposal_count)
+        status, search = self.status_filter, self.search_query
+        return _shared_listing(
+            "proposals",
+            ("page", status, search, page),
+            lambda: db.query_proposals(
+                status=status,
+                search=search,
+                search_fields=ADMIN_SEARCH_FIELDS,
+                limit=LIST_PAGE_SIZE,
+                offset=page * LIST_PAGE_SIZE,
+            ),
+        )
 
     @rx.event
     def set_search_query(self, value: str):
+        if load_shedder.shedding():
+            return rx.toast.warning(SHED_MESSAGE)
         self.search_query = value
+        self.admin_proposal_page = 0
 
     @rx.event
     def set_status_filter(self, value: str):
+        if load_shedder.shedding():
+            return rx.toast.warning(SHED_MESSAGE)
         self.status_filter = value
+        self.admin_proposal_page = 0
+
+    @rx.event
+    def next_admin_proposal_page(self):
+        self.admin_proposal_page = min(
+            self.current_admin_proposal_page, self.admin_proposal_page_count - 1
+        )
+
+    @rx.event
+    def prev_admin_proposal_page(self):
+        self.admin_proposal_page = max(self.current_admin_proposal_page - 2, 0)
 
     @rx.event
     def on_search_input_change(self, value: str):
@@ -55,6 +118,8 @@ class AdminState(AuthState):
 
     @rx.event
     def apply_search_query(self, form_data: dict[str, Any]):
+        if load_shedder.shedding():
+            return rx.toast.warning(SHED_MESSAGE)
         value = (
             form_data.get("search", "") if isinstance(form_data, dict) else ""
         ).strip()
@@ -62,46 +127,25 @@ class AdminState(AuthState):
             value = self.pending_search_query.strip()
         self.search_query = value
         self.pending_search_query = value
+        self.admin_proposal_page = 0
         return rx.toast.success("Search applied.")
 
     def _delete_proposal_and_files(self, proposal_id: str) -> tuple[bool, str]:
         current = db.get_proposal(proposal_id)
         if not current:
             return False, "Proposal not found."
-        deleted = db.delete_proposal(proposal_id)
+        deleted = db.delete_proposal(proposal_id, actor=self.authenticated_user or "")
         if not deleted:
             return False, "Failed to delete the proposal."
         file_name = current.get("proposal_file")
         if isinstance(file_name, str) and file_name:
-            upload_dir = rx.get_upload_dir()
-            project_upload_dir = (
-                Path(__file__).resolve().parent.parent / "uploaded_files"
-            )
-            candidate_paths: list[Path] = []
-            try:
-                candidate_paths.append((upload_dir / file_name).resolve())
-            except Exception:
-                pass
-            try:
-                candidate_paths.append((project_upload_dir / file_name).resolve())
-            except Exception:
-                pass
-            seen: set[Path] = set()
-            for path in candidate_paths:
-                if path in seen:
-                    continue
-                seen.add(path)
-                try:
-                    if path.exists():
-                        path.unlink()
-                except OSError:
-                    pass
+            remove_upload(file_name)
         self.refresh_token = datetime.datetime.now().isoformat()
         return True, "Proposal deleted successfully."
 
     @rx.event
     def prompt_delete_proposal_admin(self, proposal_id: str):
-        if not self.is_admin:
+        if not self._has_live_session() or not self.is_admin:
             return rx.toast.error("You are not authorized to perform this action.")
         proposal = db.get_proposal(proposal_id)
         if not proposal:
@@ -116,21 +160,16 @@ class AdminState(AuthState):
 
     @rx.event
     async def confirm_delete_proposal_admin(self):
-        if not self.is_admin:
+        if not self._has_live_session() or not self.is_admin:
             return rx.toast.error("You are not authorized to perform this action.")
         if not self.admin_pending_delete:
             self.admin_delete_dialog_open = False
             return rx.toast.error("No proposal selected for deletion.")
         proposal_id = self.admin_pending_delete["id"]
         success, message = self._delete_proposal_and_files(proposal_id)
-        proposal_state = await self.get_state(ProposalState)
         if success:
-            if (
-                proposal_state.selected_proposal
-                and proposal_state.selected_proposal["id"] == proposal_id
-            ):
-                proposal_state.selected_proposal = None
-                proposal_state.show_detail_modal = False
+            selection = await self.get_state(SelectionState)
+            selection.replace(None, proposal_id)
             self.admin_pending_delete = None
             self.admin_delete_dialog_open = False
             return rx.toast.success(message)
@@ -144,80 +183,80 @@ class AdminState(AuthState):
 
     @rx.event
     async def update_proposal_status(
-        self, proposal_id: str, status: str, review_results: str | None = None
+        self, proposal_id: str, status: str, expected_version: int = 0
     ):
-        if not self.is_admin:
+        if not self._has_live_session() or not self.is_admin:
             return rx.toast.error("You are not authorized to perform this action.")
-        latest = db.get_proposal(proposal_id)
-        if not latest:
-            return rx.toast.error("Proposal not found.")
-        review_value = (
-            review_results
-            if review_results is not None
-            else latest.get("review_results", "")
-        )
-        updated = db.update_proposal_status(proposal_id, status, review_value)
+        try:
+            updated = db.update_proposal_status(
+                proposal_id,
+                status,
+                actor=self.authenticated_user or "",
+                expected_version=expected_version or None,
+            )
+        except StaleProposalError as exc:
+            await self._show_latest(exc.current)
+            return rx.toast.error(STALE_PROPOSAL_MESSAGE)
         if not updated:
             return rx.toast.error("Proposal not found.")
-        proposal_state = await self.get_state(ProposalState)
-        refreshed = db.get_proposal(proposal_id)
-        if refreshed:
-            if (
-                proposal_state.selected_proposal
-                and proposal_state.selected_proposal["id"] == proposal_id
-            ):
-                proposal_state.selected_proposal = refreshed
-            if refreshed["id"] == proposal_id:
-                self.review_results_input = refreshed.get("review_results", "")
+        await self._show_latest(updated)
         return rx.toast.success("Status and review updated successfully!")
 
     @rx.event
     async def save_review_results(self):
-        if not self.is_admin:
+        if not self._has_live_session() or not self.is_admin:
             return rx.toast.error("You are not authorized to perform this action.")
-        proposal_state = await self.get_state(ProposalState)
-        if not proposal_state.selected_proposal:
+        selection = await self.get_state(SelectionState)
+        selected = selection.selected_proposal
+        if not selected:
             return rx.toast.error("No proposal selected.")
-        proposal_id = proposal_state.selected_proposal["id"]
-        latest = db.get_proposal(proposal_id)
-        if not latest:
-            return rx.toast.error("Proposal not found.")
-        status = latest.get("status", "Submitted")
-        updated = db.update_proposal_status(
-            proposal_id, status, self.review_results_input
-        )
+        try:
+            updated = db.update_proposal(
+                selected["id"],
+                {"review_results": self.review_results_input},
+                actor=self.authenticated_user or "",
+                expected_version=selected.get("version") or None,
+            )
+        except StaleProposalError as exc:
+            await self._show_latest(exc.current, keep_review_input=True)
+            return rx.toast.error(STALE_PROPOSAL_MESSAGE)
         if not updated:
             return rx.toast.error("Proposal not found.")
-        refreshed = db.get_proposal(proposal_id)
-        if refreshed:
-            proposal_state.selected_proposal = refreshed
+        await self._show_latest(updated, keep_review_input=True)
         return rx.toast.success("Review results saved.")
 
+    async def _show_latest(self, proposal: Proposal, keep_review_input: bool = False):
+        """Shows ``proposal`` in the list and detail view after a write or a conflict."""
+        self.refresh_token = datetime.datetime.now().isoformat()
+        selection = await self.get_state(SelectionState)
+        if selection.selected_proposal and selection.selected_proposal["id"] == proposal["id"]:
+            selection.replace(proposal)
+            if not keep_review_input:
+                self.review_results_input = proposal.get("review_results", "")
+
     @rx.event
     async def view_proposal_details_admin(self, proposal_id: str):
-        if not self.is_admin:
+        if not self._has_live_session() or not self.is_admin:
             return rx.toast.error("You are not authorized to perform this action.")
-        proposal_state = await self.get_state(ProposalState)
         selected = db.get_proposal(proposal_id)
         if not selected:
             return rx.toast.error("Proposal not found.")
         self.review_results_input = selected.get("review_results", "")
-        proposal_state.selected_proposal = selected
-        proposal_state.show_detail_modal = True
+        selection = await self.get_state(SelectionState)
+        selection.show(selected)
+        ensure_preview(selected)
 
     @rx.event
     async def refresh_admin_data(self):
-        if not self.is_admin:
+        if not self._has_live_session() or not self.is_admin:
             return rx.toast.error("You are not authorized to perform this action.")
+        if load_shedder.shedding():
+            return rx.toast.warning(SHED_MESSAGE)
         self.refresh_token = datetime.datetime.now().isoformat()
-        proposal_state = await self.get_state(ProposalState)
-        if proposal_state.selected_proposal:
-            latest = db.get_proposal(proposal_state.selected_proposal["id"])
-            if latest:
-                proposal_state.selected_proposal = latest
-            else:
-                proposal_state.selected_proposal = None
-                proposal_state.show_detail_modal = False
+        selection = await self.get_state(SelectionState)
+        if selection.selected_proposal:
+            proposal_id = selection.selected_proposal["id"]
+            selection.replace(db.get_proposal(proposal_id), proposal_id)
         if (
             self.admin_pending_delete
             and not db.get_proposal(self.admin_pending_delete["id"])
@@ -226,13 +265,104 @@ class AdminState(AuthState):
             self.admin_delete_dialog_open = False
         return rx.toast.success("Admin data refreshed.")
 
-    @rx.var
+    @cached_var("refresh_token", AuthState.is_admin)
+    def user_count(self) -> int:
+        if not self.is_admin:
+            return 0
+        return _shared_listing("users", ("count",), db.count_users)
+
+    @cached_var("user_page", "user_count")
+    def user_page_count(self) -> int:
+        return page_window(self.user_page, self.user_count)[1]
+
+    @cached_var("user_page", "user_count")
+    def current_user_page(self) -> int:
+        return page_window(self.user_page, self.user_count)[0] + 1
+
+    @cached_var("refresh_token", "user_page", "user_count", AuthState.is_admin)
     def user_list(self) -> list[dict[str, str]]:
         if not self.is_admin:
             return []
-        _ = self.refresh_token
-        return db.list_users()
+        page, _ = page_window(self.user_page, self.user_count)
+        return _shared_listing(
+            "users",
+            ("page", page),
+            lambda: db.list_users(limit=LIST_PAGE_SIZE, offset=page * LIST_PAGE_SIZE),
+        )
 
-    @rx.var
-    def user_count(self) -> int:
-        return len(self.user_list)
+    @rx.event
+    def next_user_page(self):
+        if load_shedder.shedding():
+            return rx.toast.warning(SHED_MESSAGE)
+        self.user_page = min(self.current_user_page, self.user_page_count - 1)
+
+    @rx.event
+    def prev_user_page(self):
+        if load_shedder.shedding():
+            return rx.toast.warning(SHED_MESSAGE)
+        self.user_page = max(self.current_user_page - 2, 0)
+
+    async def _run_import(self, files: list[rx.UploadFile], kind: str) -> Any:
+        """Imports the first uploaded file as "users" or "proposals"; returns the ImportReport."""
+        # The importers pull in bcrypt hashing, CSV/XLSX parsing and a thread
+        # pool; only the admin import handlers need them.
+        from app.services import imports
+
+        if kind == "users":
+            columns, importer = imports.USER_COLUMNS, imports.import_users
+        else:
+            columns, importer = imports.PROPOSAL_COLUMNS, imports.import_proposals
+        if not files:
+            raise ValueError("Choose a CSV or XLSX file to import.")
+        upload = files[0]
+        rows = imports.read_rows(upload.file, upload.name or "", columns)
+        # Rows stream from the spooled upload while the import runs off the event loop.
+        return await asyncio.to_thread(importer, rows, self.authenticated_user or "")
+
+    @rx.event
+    async def handle_user_import(self, files: list[rx.UploadFile]):
+        if not self._has_live_session() or not self.is_admin:
+            yield rx.toast.error("You are not authorized to perform this action.")
+            return
+        self.importing = True
+        self.import_summary = ""
+        self.import_errors = []
+        yield
+        try:
+            report = await self._run_import(files, "users")
+        except ValueError as exc:
+            self.importing = False
+            yield rx.toast.error(str(exc))
+            return
+        self.importing = False
+        self.import_summary = report.summary("users")
+        self.import_errors = report.error_lines()
+        self.refresh_token = datetime.datetime.now().isoformat()
+        yield rx.clear_selected_files("user_import")
+        if report.credentials:
+            yield rx.download(
+                data=report.credentials_csv(), filename="temporary-passwords.csv"
+            )
+        yield rx.toast.success(self.import_summary)
+
+    @rx.event
+    async def handle_proposal_import(self, files: list[rx.UploadFile]):
+        if not self._has_live_session() or not self.is_admin:
+            yield rx.toast.error("You are not authorized to perform this action.")
+            return
+        self.importing = True
+        self.import_summary = ""
+        self.import_errors = []
+        yield
+        try:
+            report = await self._run_import(files, "proposals")
+        except ValueError as exc:
+            self.importing = False
+            yield rx.toast.error(str(exc))
+            return
+        self.importing = False
+        self.import_summary = report.summary("proposals")
+        self.import_errors = report.error_lines()
+        self.refresh_token = datetime.datetime.now().isoformat()
+        yield rx.clear_selected_files("proposal_import")
+        yield rx.toast.success(self.import_summary)
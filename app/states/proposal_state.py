@@ -1,14 +1,82 @@
 import reflex as rx
-from app.state import AuthState, db, Proposal
+from app.state import (
+    AuthState,
+    LIST_PAGE_SIZE,
+    SHED_MESSAGE,
+    db,
+    load_shedder,
+    page_window,
+    upload_queue,
+    Proposal,
+    StaleProposalError,
+)
+from app.services.admission import QUEUE_POSITION_REFRESH_SECONDS
+from app.services.jobs import enqueue_post_submission
+from app.services.previews import ensure_preview
+from app.states.selection_state import SelectionState
+from app.services.storage import remove_upload
+from app.services.var_profile import cached_var
+import asyncio
+import os
 import re
 import uuid
 import datetime
 from pathlib import Path
+from typing import Any, BinaryIO
 from reflex.event import PointerEventInfo
 
 
 MAX_UPLOAD_SIZE_BYTES = 50 * 1024 * 1024  # 50 MB
 ALLOWED_EXTENSIONS = {".pdf", ".doc", ".docx", ".ppt", ".pptx", ".hwp", ".hwpx"}
+# Also rendered as maxLength on the form inputs so browsers enforce them first.
+FIELD_MAX_LENGTHS = {
+    "full_name": 200,
+    "email": 254,
+    "affiliation": 200,
+    "phone_number": 40,
+    "title": 300,
+    "description": 20000,
+}
+
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _copy_upload(source: BinaryIO, file_path: Path) -> bool:
+    """Writes an upload to disk in chunks; False if it exceeds the size limit."""
+    size = 0
+    with file_path.open("wb") as f:
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_UPLOAD_SIZE_BYTES:
+                return False
+            f.write(chunk)
+        f.flush()
+        os.fsync(f.fileno())
+    return True
+
+
+def proposal_field_errors(values: dict[str, str], require_file: bool = True) -> dict[str, str]:
+    """Form validation rules, keyed by Proposal field; shared with bulk import."""
+    errors = {}
+    if not values.get("full_name"):
+        errors["full_name"] = "Full name is required."
+    if not re.match("[^@]+@[^@]+\\.[^@]+", values.get("email", "")):
+        errors["email"] = "Invalid email address."
+    if not values.get("affiliation"):
+        errors["affiliation"] = "Affiliation is required."
+    if not values.get("phone_number"):
+        errors["phone_number"] = "Phone number is required."
+    if not values.get("title"):
+        errors["title"] = "Proposal title is required."
+    if not values.get("description"):
+        errors["description"] = "Description is required."
+    for field, limit in FIELD_MAX_LENGTHS.items():
+        if field not in errors and len(values.get(field, "")) > limit:
+            errors[field] = f"Must be at most {limit} characters."
+    if require_file and not values.get("proposal_file"):
+        errors["proposal_file"] = "A proposal document is required."
+    return errors
 
 
 class ProposalState(AuthState):
@@ -27,40 +95,19 @@ class ProposalState(AuthState):
     description_error: str = ""
     proposal_file_error: str = ""
     loading: bool = False
+    upload_queue_position: int = 0
     search_query: str = ""
     status_filter: str = "All"
-    show_detail_modal: bool = False
-    selected_proposal: Proposal | None = None
+    proposal_page: int = 0
     is_editing: bool = False
     edit_proposal_id: str = ""
+    edit_proposal_version: int = 0
     refresh_token: str = ""
     show_delete_confirm: bool = False
     pending_delete_proposal: Proposal | None = None
 
-    @rx.var
-    def selected_proposal_files(self) -> list[str]:
-        """Returns the file names associated with the selected proposal."""
-        if self.selected_proposal:
-            value = self.selected_proposal["proposal_file"]
-            if isinstance(value, list):
-                return [str(item) for item in value if item]
-            if isinstance(value, str) and value:
-                return [value]
-        return []
-
-    @rx.var
-    def has_selected_proposal_files(self) -> bool:
-        if self.selected_proposal:
-            value = self.selected_proposal["proposal_file"]
-            if isinstance(value, list):
-                return any(value)
-            if isinstance(value, str):
-                return bool(value)
-        return False
-
-    @rx.var
+    @cached_var("refresh_token", AuthState.authenticated_user)
     def proposal_summary(self) -> dict[str, int]:
-        _ = self.refresh_token
         proposals = db.get_user_proposals(self.authenticated_user or "")
         summary = {
             "total": len(proposals),
@@ -78,51 +125,80 @@ class ProposalState(AuthState):
                 summary["approved"] += 1
         return summary
 
-    @rx.var
+    @cached_var("proposal_summary")
     def total_proposals_count(self) -> int:
         return self.proposal_summary["total"]
 
-    @rx.var
+    @cached_var("proposal_summary")
     def under_review_count(self) -> int:
         return self.proposal_summary["under_review"]
 
-    @rx.var
+    @cached_var("proposal_summary")
     def approved_count(self) -> int:
         return self.proposal_summary["approved"]
 
     def _validate_form(self) -> bool:
-        self.full_name_error = "" if self.full_name else "Full name is required."
-        self.proposal_email_error = (
-            ""
-            if re.match("[^@]+@[^@]+\\.[^@]+", self.proposal_email)
-            else "Invalid email address."
-        )
-        self.affiliation_error = "" if self.affiliation else "Affiliation is required."
-        self.phone_number_error = (
-            "" if self.phone_number else "Phone number is required."
+        errors = proposal_field_errors(
+            {
+                "full_name": self.full_name,
+                "email": self.proposal_email,
+                "affiliation": self.affiliation,
+                "phone_number": self.phone_number,
+                "title": self.title,
+                "description": self.description,
+                "proposal_file": self.proposal_file,
+            },
+            require_file=not self.is_editing,
         )
-        self.title_error = "" if self.title else "Proposal title is required."
-        self.description_error = "" if self.description else "Description is required."
+        self.full_name_error = errors.get("full_name", "")
+        self.proposal_email_error = errors.get("email", "")
+        self.affiliation_error = errors.get("affiliation", "")
+        self.phone_number_error = errors.get("phone_number", "")
+        self.title_error = errors.get("title", "")
+        self.description_error = errors.get("description", "")
         if not self.is_editing:
-            self.proposal_file_error = (
-                "" if self.proposal_file else "A proposal document is required."
-            )
-        return not any(
-            [
-                self.full_name_error,
-                self.proposal_email_error,
-                self.affiliation_error,
-                self.phone_number_error,
-                self.title_error,
-                self.description_error,
-                self.proposal_file_error,
-            ]
-        )
+            self.proposal_file_error = errors.get("proposal_file", "")
+        return not errors and not self.proposal_file_error
 
     @rx.event
-    async def handle_create_proposal(self, files: list[rx.UploadFile]):
+    def submit_form_fields(self, form_data: dict[str, Any]):
+        """Receives every field at submit time; inputs do not sync per keystroke."""
+        self.full_name = str(form_data.get("full_name", "")).strip()
+        self.proposal_email = str(form_data.get("email", "")).strip()
+        self.affiliation = str(form_data.get("affiliation", "")).strip()
+        self.phone_number = str(form_data.get("phone_number", "")).strip()
+        self.title = str(form_data.get("title", "")).strip()
+        self.description = str(form_data.get("description", "")).strip()
+
+    @rx.event
+    async def handle_submit_proposal(self, files: list[rx.UploadFile]):
+        # Only MAX_CONCURRENT_UPLOADS submissions are processed at once; the
+        # rest wait in arrival order and see their place in line. The files
+        # were already received by now: the queue limits processing only.
+        ticket = upload_queue.join()
+        try:
+            while not ticket.admitted:
+                self.loading = True
+                self.upload_queue_position = upload_queue.position(ticket)
+                yield
+                await upload_queue.wait(ticket, QUEUE_POSITION_REFRESH_SECONDS)
+            self.upload_queue_position = 0
+            handler = self._update_proposal if self.is_editing else self._create_proposal
+            async for update in handler(files):
+                yield update
+        finally:
+            self.upload_queue_position = 0
+            upload_queue.leave(ticket)
+
+    async def _create_proposal(self, files: list[rx.UploadFile]):
+        # Not an event: submissions must go through handle_submit_proposal so
+        # they wait their turn in the upload queue.
         self.loading = True
         yield
+        if not self._has_live_session():
+            self.loading = False
+            yield rx.redirect("/signin")
+            return
         if not files:
             self.proposal_file_error = "A proposal document is required."
             self.loading = False
@@ -142,24 +218,24 @@ class ProposalState(AuthState):
             self.loading = False
             yield rx.toast.error("Unsupported file type uploaded.")
             return
-        upload_data = await upload.read()
-        if len(upload_data) > MAX_UPLOAD_SIZE_BYTES:
-            self.proposal_file_error = "File exceeds the 50 MB size limit."
-            self.loading = False
-            yield rx.toast.error("Uploaded file is too large.")
-            return
         timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
         safe_path = Path(original_name)
         unique_name = f"{safe_path.stem}_{timestamp}{safe_path.suffix}"
         file_path = rx.get_upload_dir() / unique_name
         try:
-            with file_path.open("wb") as f:
-                f.write(upload_data)
+            within_limit = await asyncio.to_thread(_copy_upload, upload.file, file_path)
         except OSError:
+            self._remove_uploaded_file(unique_name)
             self.proposal_file_error = "Failed to save the uploaded file."
             self.loading = False
             yield rx.toast.error("Could not store the uploaded file.")
             return
+        if not within_limit:
+            self._remove_uploaded_file(unique_name)
+            self.proposal_file_error = "File exceeds the 50 MB size limit."
+            self.loading = False
+            yield rx.toast.error("Uploaded file is too large.")
+            return
         self.proposal_file = unique_name
         if not self._validate_form():
             self.loading = False
@@ -182,18 +258,24 @@ class ProposalState(AuthState):
             updated_at=timestamp,
             status="Submitted",
             review_results="",
+            file_hash="",
+            version=1,
         )
-        db.add_proposal(new_proposal)
+        db.add_proposal(new_proposal, actor=self.authenticated_user or "")
+        enqueue_post_submission(new_proposal["id"], unique_name)
         self.refresh_token = datetime.datetime.now().isoformat()
         self.loading = False
         self._reset_proposal_form()
         yield rx.toast.success("Proposal submitted successfully!")
         yield self.set_active_page("my_proposals")
 
-    @rx.event
-    async def handle_update_proposal(self, files: list[rx.UploadFile]):
+    async def _update_proposal(self, files: list[rx.UploadFile]):
         self.loading = True
         yield
+        if not self._has_live_session():
+            self.loading = False
+            yield rx.redirect("/signin")
+            return
         if not self.edit_proposal_id:
             self.loading = False
             yield rx.toast.error("Proposal not found.")
@@ -228,24 +310,24 @@ class ProposalState(AuthState):
                 self.loading = False
                 yield rx.toast.error("Unsupported file type uploaded.")
                 return
-            upload_data = await upload.read()
-            if len(upload_data) > MAX_UPLOAD_SIZE_BYTES:
-                self.proposal_file_error = "File exceeds the 10 MB size limit."
-                self.loading = False
-                yield rx.toast.error("Uploaded file is too large.")
-                return
             timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
             safe_path = Path(original_name)
             unique_name = f"{safe_path.stem}_{timestamp}{safe_path.suffix}"
             file_path = rx.get_upload_dir() / unique_name
             try:
-                with file_path.open("wb") as f:
-                    f.write(upload_data)
+                within_limit = await asyncio.to_thread(_copy_upload, upload.file, file_path)
             except OSError:
+                self._remove_uploaded_file(unique_name)
                 self.proposal_file_error = "Failed to save the uploaded file."
                 self.loading = False
                 yield rx.toast.error("Could not store the uploaded file.")
                 return
+            if not within_limit:
+                self._remove_uploaded_file(unique_name)
+                self.proposal_file_error = "File exceeds the 50 MB size limit."
+                self.loading = False
+                yield rx.toast.error("Uploaded file is too large.")
+                return
             new_file_name = unique_name
             self.proposal_file = unique_name
             self.proposal_file_error = ""
@@ -258,20 +340,37 @@ class ProposalState(AuthState):
                 self.proposal_file = current.get("proposal_file", "")
             yield rx.toast.error("Please correct the errors in the form.")
             return
-        updated = False
+        updated = None
         if self.edit_proposal_id:
-            updated = db.update_proposal(
-                self.edit_proposal_id,
-                {
-                    "full_name": self.full_name,
-                    "email": self.proposal_email,
-                    "affiliation": self.affiliation,
-                    "phone_number": self.phone_number,
-                    "title": self.title,
-                    "description": self.description,
-                    "proposal_file": self.proposal_file,
-                },
-            )
+            updates = {
+                "full_name": self.full_name,
+                "email": self.proposal_email,
+                "affiliation": self.affiliation,
+                "phone_number": self.phone_number,
+                "title": self.title,
+                "description": self.description,
+                "proposal_file": self.proposal_file,
+            }
+            if new_file_name:
+                updates["file_hash"] = ""
+            try:
+                updated = db.update_proposal(
+                    self.edit_proposal_id,
+                    updates,
+                    actor=self.authenticated_user or "",
+                    expected_version=self.edit_proposal_version or None,
+                )
+            except StaleProposalError as exc:
+                self.loading = False
+                if new_file_name:
+                    self._remove_uploaded_file(new_file_name)
+                    self.proposal_file = current.get("proposal_file", "")
+                selection = await self.get_state(SelectionState)
+                selection.replace(exc.current)
+                yield rx.toast.error(
+                    "This proposal was changed since you opened it. Reopen it and try again."
+                )
+                return
         self.loading = False
         if not updated:
             if new_file_name:
@@ -280,38 +379,19 @@ class ProposalState(AuthState):
             yield rx.toast.error("Proposal not found.")
             return
         if new_file_name:
+            enqueue_post_submission(self.edit_proposal_id, new_file_name)
             old_file = current.get("proposal_file")
             if isinstance(old_file, str) and old_file and old_file != new_file_name:
                 self._remove_uploaded_file(old_file)
-        latest = db.get_proposal(self.edit_proposal_id)
-        if latest:
-            self.selected_proposal = latest
+        selection = await self.get_state(SelectionState)
+        selection.replace(updated)
         self.refresh_token = datetime.datetime.now().isoformat()
         yield ProposalState.cancel_edit()
         yield rx.toast.success("Proposal updated successfully!")
         yield self.set_active_page("my_proposals")
 
     def _remove_uploaded_file(self, file_name: str):
-        if not file_name:
-            return
-        upload_dir = rx.get_upload_dir()
-        project_upload_dir = Path(__file__).resolve().parent.parent / "uploaded_files"
-        candidate_paths = []
-        for base in (upload_dir, project_upload_dir):
-            try:
-                candidate_paths.append((base / file_name).resolve())
-            except Exception:
-                continue
-        seen_paths: set[Path] = set()
-        for path in candidate_paths:
-            if path in seen_paths:
-                continue
-            seen_paths.add(path)
-            try:
-                if path.exists():
-                    path.unlink()
-            except OSError:
-                pass
+        remove_upload(file_name)
 
     def _reset_proposal_form(self):
         self.full_name = ""
@@ -331,41 +411,46 @@ class ProposalState(AuthState):
         rx.clear_selected_files("proposal_upload")
 
     @rx.event
-    def load_proposal_for_edit(self):
-        if not self.selected_proposal:
+    async def load_proposal_for_edit(self):
+        selection = await self.get_state(SelectionState)
+        selected = selection.selected_proposal
+        if not selected:
             return rx.toast.error("No proposal selected.")
-        if self.selected_proposal.get("status") != "Submitted":
+        if selected.get("status") != "Submitted":
             return rx.toast.error(
                 "This proposal cannot be edited because it is already under review."
             )
         self.is_editing = True
-        self.edit_proposal_id = self.selected_proposal["id"]
-        self.full_name = self.selected_proposal["full_name"]
-        self.proposal_email = self.selected_proposal["email"]
-        self.affiliation = self.selected_proposal["affiliation"]
-        self.phone_number = self.selected_proposal["phone_number"]
-        self.title = self.selected_proposal["title"]
-        self.description = self.selected_proposal["description"]
-        self.proposal_file = self.selected_proposal["proposal_file"]
-        self.show_detail_modal = False
+        self.edit_proposal_id = selected["id"]
+        self.edit_proposal_version = selected.get("version", 0)
+        self.full_name = selected["full_name"]
+        self.proposal_email = selected["email"]
+        self.affiliation = selected["affiliation"]
+        self.phone_number = selected["phone_number"]
+        self.title = selected["title"]
+        self.description = selected["description"]
+        self.proposal_file = selected["proposal_file"]
+        selection.show_detail_modal = False
         return self.set_active_page("create_proposal")
 
     @rx.event
     def cancel_edit(self):
         self.is_editing = False
         self.edit_proposal_id = ""
+        self.edit_proposal_version = 0
         self._reset_proposal_form()
         return self.set_active_page("my_proposals")
 
     @rx.event
-    def start_new_proposal(self):
+    async def start_new_proposal(self):
         """Prepare the state for creating a brand new proposal."""
         self.is_editing = False
         self.edit_proposal_id = ""
-        self.selected_proposal = None
-        self.show_detail_modal = False
+        self.edit_proposal_version = 0
+        selection = await self.get_state(SelectionState)
+        selection.clear()
         self._reset_proposal_form()
-        self.active_page = "create_proposal"
+        return self.set_active_page("create_proposal")
 
     @rx.event
     def remove_selected_upload(self, event: PointerEventInfo | None = None):
@@ -391,7 +476,9 @@ class ProposalState(AuthState):
         self.pending_delete_proposal = None
         self.show_delete_confirm = False
 
-    def _delete_proposal_internal(self, proposal_id: str):
+    async def _delete_proposal_internal(self, proposal_id: str):
+        if not self._has_live_session():
+            return rx.redirect("/signin")
         current = db.get_proposal(proposal_id)
         if not current or current.get("user_email") != (self.authenticated_user or ""):
             return rx.toast.error("You cannot delete this proposal.")
@@ -399,109 +486,115 @@ class ProposalState(AuthState):
             return rx.toast.error(
                 "Only proposals in Submitted status can be deleted."
             )
-        deleted = db.delete_proposal(proposal_id)
+        deleted = db.delete_proposal(proposal_id, actor=self.authenticated_user or "")
         if not deleted:
             return rx.toast.error("Failed to delete the proposal.")
         file_name = current.get("proposal_file")
         if isinstance(file_name, str) and file_name:
-            upload_dir = rx.get_upload_dir()
-            project_upload_dir = Path(__file__).resolve().parent.parent / "uploaded_files"
-            candidate_paths = []
-            try:
-                candidate_paths.append((upload_dir / file_name).resolve())
-            except Exception:
-                pass
-            try:
-                candidate_paths.append((project_upload_dir / file_name).resolve())
-            except Exception:
-                pass
-            seen_paths = set()
-            for path in candidate_paths:
-                if path in seen_paths:
-                    continue
-                seen_paths.add(path)
-                try:
-                    if path.exists():
-                        path.unlink()
-                except OSError:
-                    pass
-        if self.selected_proposal and self.selected_proposal["id"] == proposal_id:
-            self.selected_proposal = None
-            self.show_detail_modal = False
+            remove_upload(file_name)
+        selection = await self.get_state(SelectionState)
+        selection.replace(None, proposal_id)
         self.refresh_token = datetime.datetime.now().isoformat()
         return rx.toast.success("Proposal deleted successfully.")
 
     @rx.event
-    def delete_proposal(self, proposal_id: str):
-        result = self._delete_proposal_internal(proposal_id)
+    async def delete_proposal(self, proposal_id: str):
+        result = await self._delete_proposal_internal(proposal_id)
         if self.pending_delete_proposal and self.pending_delete_proposal["id"] == proposal_id:
             self.pending_delete_proposal = None
             self.show_delete_confirm = False
         return result
 
     @rx.event
-    def confirm_delete_proposal(self):
+    async def confirm_delete_proposal(self):
         if not self.pending_delete_proposal:
             self.show_delete_confirm = False
             return rx.toast.error("Proposal not found.")
         proposal_id = self.pending_delete_proposal["id"]
-        result = self._delete_proposal_internal(proposal_id)
+        result = await self._delete_proposal_internal(proposal_id)
         self.pending_delete_proposal = None
         self.show_delete_confirm = False
         return result
 
-    @rx.var
+    @cached_var(
+        "refresh_token", "status_filter", "search_query", AuthState.authenticated_user
+    )
+    def filtered_proposal_count(self) -> int:
+        return db.count_proposals(
+            user_email=self.authenticated_user or "",
+            status=self.status_filter,
+            search=self.search_query,
+        )
+
+    @cached_var("proposal_page", "filtered_proposal_count")
+    def proposal_page_count(self) -> int:
+        return page_window(self.proposal_page, self.filtered_proposal_count)[1]
+
+    @cached_var("proposal_page", "filtered_proposal_count")
+    def current_proposal_page(self) -> int:
+        return page_window(self.proposal_page, self.filtered_proposal_count)[0] + 1
+
+    @cached_var(
+        "refresh_token",
+        "status_filter",
+        "search_query",
+        "proposal_page",
+        "filtered_proposal_count",
+        AuthState.authenticated_user,
+    )
     def filtered_proposals(self) -> list[Proposal]:
-        """Filters proposals based on search query and status."""
-        _ = self.refresh_token
-        proposals = db.get_user_proposals(self.authenticated_user or "")
-        search_lower = self.search_query.lower()
-        return [
-            p
-            for p in proposals
-            if (self.status_filter == "All" or p["status"] == self.status_filter)
-            and (
-                search_lower in p["title"].lower()
-                or search_lower in p["description"].lower()
-            )
-        ]
+        """The current page of proposals matching the search query and status."""
+        page, _ = page_window(self.proposal_page, self.filtered_proposal_count)
+        return db.query_proposals(
+            user_email=self.authenticated_user or "",
+            status=self.status_filter,
+            search=self.search_query,
+            limit=LIST_PAGE_SIZE,
+            offset=page * LIST_PAGE_SIZE,
+        )
+
+    @rx.event
+    def set_search_query(self, value: str):
+        if load_shedder.shedding():
+            return rx.toast.warning(SHED_MESSAGE)
+        self.search_query = value
+        self.proposal_page = 0
+
+    @rx.event
+    def set_status_filter(self, value: str):
+        self.status_filter = value
+        self.proposal_page = 0
 
     @rx.event
-    def view_proposal_details(self, proposal: Proposal):
+    def next_proposal_page(self):
+        self.proposal_page = min(self.current_proposal_page, self.proposal_page_count - 1)
+
+    @rx.event
+    def prev_proposal_page(self):
+        self.proposal_page = max(self.current_proposal_page - 2, 0)
+
+    @rx.event
+    async def view_proposal_details(self, proposal: Proposal):
         """Sets the selected proposal and shows the detail modal."""
+        selection = await self.get_state(SelectionState)
         latest = db.get_proposal(proposal["id"])
         if latest and latest.get("user_email") == (self.authenticated_user or ""):
-            self.selected_proposal = latest
-            self.show_detail_modal = True
+            selection.show(latest)
+            ensure_preview(latest)
         else:
-            self.selected_proposal = None
-            self.show_detail_modal = False
+            selection.clear()
             return rx.toast.error("Unable to load the latest proposal details.")
 
     @rx.event
-    def close_detail_modal(self):
-        """Closes the detail modal and resets the selected proposal."""
-        self.show_detail_modal = False
-        self.selected_proposal = None
-
-    @rx.event
-    def download_proposal_file(
-        self, event: PointerEventInfo | None = None, filename: str | None = None
-    ):
-        """Downloads the proposal file for the selected proposal."""
-        if self.selected_proposal:
-            target = filename or self.selected_proposal["proposal_file"]
-            if target:
-                return rx.download(filename=target)
-
-    @rx.event
-    def refresh_proposals(self):
-        if self.selected_proposal:
-            latest = db.get_proposal(self.selected_proposal["id"])
-            if latest and latest.get("user_email") == (self.authenticated_user or ""):
-                self.selected_proposal = latest
-            else:
-                self.selected_proposal = None
-                self.show_detail_modal = False
+    async def refresh_proposals(self):
+        if load_shedder.shedding():
+            return rx.toast.warning(SHED_MESSAGE)
+        selection = await self.get_state(SelectionState)
+        if selection.selected_proposal:
+            proposal_id = selection.selected_proposal["id"]
+            latest = db.get_proposal(proposal_id)
+            if latest and latest.get("user_email") != (self.authenticated_user or ""):
+                latest = None
+            selection.replace(latest, proposal_id)
         self.refresh_token = datetime.datetime.now().isoformat()
         return rx.toast.success("Proposals refreshed from the latest data.")
@@ -0,0 +1,103 @@
+import reflex as rx
+import datetime
+from reflex.event import PointerEventInfo
+from app.state import AuthState, Proposal, db
+from app.services.jobs import job_label
+from app.services.previews import get_preview
+from app.services.var_profile import cached_var
+
+
+class SelectionState(AuthState):
+    """The proposal open in the detail modal, shared by the user and admin views.
+
+    Kept apart from ProposalState and AdminState so that opening, refreshing
+    or closing the modal only loads this small substate.
+    """
+
+    selected_proposal: Proposal | None = None
+    show_detail_modal: bool = False
+    refresh_token: str = ""
+
+    def show(self, proposal: Proposal):
+        self.selected_proposal = proposal
+        self.show_detail_modal = True
+        self.refresh_token = datetime.datetime.now().isoformat()
+
+    def replace(self, proposal: Proposal | None, proposal_id: str = ""):
+        """Swaps in the latest copy of the selected proposal; None closes the modal.
+
+        Does nothing unless ``proposal_id`` (default: the proposal's own id) is
+        the one currently selected.
+        """
+        proposal_id = proposal_id or (proposal["id"] if proposal else "")
+        if not self.selected_proposal or self.selected_proposal["id"] != proposal_id:
+            return
+        if proposal:
+            self.selected_proposal = proposal
+            self.refresh_token = datetime.datetime.now().isoformat()
+        else:
+            self.clear()
+
+    def clear(self):
+        self.selected_proposal = None
+        self.show_detail_modal = False
+
+    @cached_var("selected_proposal")
+    def selected_proposal_files(self) -> list[str]:
+        """Returns the file names associated with the selected proposal."""
+        if self.selected_proposal:
+            value = self.selected_proposal["proposal_file"]
+            if isinstance(value, list):
+                return [str(item) for item in value if item]
+            if isinstance(value, str) and value:
+                return [value]
+        return []
+
+    @cached_var("selected_proposal")
+    def has_selected_proposal_files(self) -> bool:
+        if self.selected_proposal:
+            value = self.selected_proposal["proposal_file"]
+            if isinstance(value, list):
+                return any(value)
+            if isinstance(value, str):
+                return bool(value)
+        return False
+
+    @cached_var("selected_proposal", "refresh_token")
+    def selected_proposal_jobs(self) -> list[dict[str, str]]:
+        """Background processing status for the selected proposal."""
+        if not self.selected_proposal:
+            return []
+        jobs = db.get_proposal_jobs(self.selected_proposal["id"])
+        for job in jobs:
+            job["label"] = job_label(job["kind"])
+        return jobs
+
+    @cached_var("selected_proposal", "refresh_token")
+    def selected_proposal_history(self) -> list[dict[str, str]]:
+        """Audit trail for the selected proposal, newest first."""
+        if not self.selected_proposal:
+            return []
+        return db.get_audit_events("proposal", self.selected_proposal["id"])
+
+    @cached_var("selected_proposal", "refresh_token")
+    def selected_proposal_preview(self) -> dict[str, str]:
+        """Cached first-page image and/or text excerpt for the selected upload."""
+        if not self.selected_proposal:
+            return {}
+        return get_preview(self.selected_proposal.get("file_hash", "")) or {}
+
+    @rx.event
+    def close_detail_modal(self):
+        """Closes the detail modal and resets the selected proposal."""
+        self.clear()
+
+    @rx.event
+    def download_proposal_file(
+        self, event: PointerEventInfo | None = None, filename: str | None = None
+    ):
+        """Downloads the proposal file for the selected proposal."""
+        if self.selected_proposal:
+            target = filename or self.selected_proposal["proposal_file"]
+            if target:
+                return rx.download(filename=target)
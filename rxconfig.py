@@ -2,6 +2,15 @@ import reflex as rx
 
 config = rx.Config(
     app_name="app",
-    plugins=[rx.plugins.TailwindV3Plugin()],
+    plugins=[
+        rx.plugins.TailwindV3Plugin(
+            config={
+                "plugins": ["@tailwindcss/typography@0.5.19"],
+                # "selector" also matches the element carrying the dark class,
+                # so page roots and dialog portals can theme themselves.
+                "darkMode": "selector",
+            }
+        )
+    ],
     disable_plugins=["reflex.plugins.sitemap.SitemapPlugin"],
 )
@@ -0,0 +1,41 @@
+import datetime
+import uuid
+
+import pytest
+
+from app.state import Database, Proposal
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = Database(tmp_path / "test.db")
+    database.open()
+    return database
+
+
+@pytest.fixture
+def make_proposal():
+    def make(user_email: str = "owner@example.com", **fields) -> Proposal:
+        now = fields.pop("created_at", datetime.datetime.now().isoformat())
+        return Proposal(
+            **{
+                "id": str(uuid.uuid4()),
+                "user_email": user_email,
+                "full_name": "Owner",
+                "email": user_email,
+                "affiliation": "Lab",
+                "phone_number": "000",
+                "title": "Title",
+                "description": "Description",
+                "proposal_file": "",
+                "created_at": now,
+                "updated_at": now,
+                "status": "Submitted",
+                "review_results": "",
+                "file_hash": "",
+                "version": 1,
+                **fields,
+            }
+        )
+
+    return make
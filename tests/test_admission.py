@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from app.services import admission
+from app.services.admission import AdmissionQueue, LoadShedder
+
+
+def test_waiters_are_admitted_in_arrival_order():
+    async def scenario():
+        queue = AdmissionQueue(slots=2)
+        tickets = [queue.join() for _ in range(5)]
+        assert [queue.position(ticket) for ticket in tickets] == [0, 0, 1, 2, 3]
+
+        queue.leave(tickets[1])
+        assert await queue.wait(tickets[2], timeout=1)
+        assert not await queue.wait(tickets[3], timeout=0.01)
+        assert [queue.position(ticket) for ticket in tickets[2:]] == [0, 1, 2]
+
+        queue.leave(tickets[0])
+        assert [queue.position(ticket) for ticket in tickets[3:]] == [0, 1]
+        assert queue.queued == 1
+
+    asyncio.run(scenario())
+
+
+def test_waiter_that_gives_up_leaves_the_line():
+    async def scenario():
+        queue = AdmissionQueue(slots=1)
+        running, abandoned, patient = queue.join(), queue.join(), queue.join()
+
+        queue.leave(abandoned)
+        assert queue.position(patient) == 1
+
+        queue.leave(running)
+        assert await queue.wait(patient, timeout=1)
+        assert not abandoned.admitted
+
+    asyncio.run(scenario())
+
+
+def test_waiter_is_woken_when_a_slot_frees():
+    async def scenario():
+        queue = AdmissionQueue(slots=1)
+        running, waiting = queue.join(), queue.join()
+        admitted = asyncio.create_task(queue.wait(waiting, timeout=5))
+        await asyncio.sleep(0)
+
+        queue.leave(running)
+
+        assert await admitted
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def recheck_every_call(monkeypatch):
+    monkeypatch.setattr(admission, "SHED_CHECK_INTERVAL_SECONDS", 0)
+
+
+def test_sheds_while_the_lock_wait_is_over_the_limit(recheck_every_call):
+    lock_wait = [0.0]
+    shedder = LoadShedder(lambda: lock_wait[0], lock_wait_limit=0.2, memory_limit=1 << 62)
+
+    assert not shedder.shedding()
+    lock_wait[0] = 0.5
+    assert shedder.shedding()
+    lock_wait[0] = 0.1
+    assert not shedder.shedding()
+
+
+def test_sheds_while_memory_is_over_the_limit(recheck_every_call, monkeypatch):
+    shedder = LoadShedder(lambda: 0.0, lock_wait_limit=0.2, memory_limit=1000)
+
+    monkeypatch.setattr(admission, "_resident_bytes", lambda: 2000)
+    assert shedder.shedding()
+    monkeypatch.setattr(admission, "_resident_bytes", lambda: None)
+    assert not shedder.shedding()
+
+
+def test_shedding_decision_is_reused_within_the_check_interval():
+    calls = []
+    shedder = LoadShedder(lambda: calls.append(1) or 1.0, lock_wait_limit=0.2)
+
+    assert shedder.shedding() and shedder.shedding()
+    assert len(calls) == 1
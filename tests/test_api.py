@@ -0,0 +1,104 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app import api
+from app.state import User
+
+
+@pytest.fixture
+def call(database):
+    """Sends one request to an API app serving ``database``."""
+    app = api.build_api(database)
+
+    def send(method, path, token=None, **kwargs):
+        async def run():
+            headers = {"authorization": f"Bearer {token}"} if token else {}
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test", headers=headers
+            ) as client:
+                return await client.request(method, path, **kwargs)
+
+        return asyncio.run(run())
+
+    return send
+
+
+@pytest.fixture
+def tokens(database):
+    database.add_user(User("admin@example.com", "x", is_admin=True))
+    database.add_user(User("partner@example.com", "x"))
+    return (
+        database.create_api_token("admin@example.com"),
+        database.create_api_token("partner@example.com"),
+    )
+
+
+def test_requests_without_a_valid_token_are_refused(call, tokens):
+    assert call("GET", "/api/v1/proposals").status_code == 401
+    assert call("GET", "/api/v1/proposals", token="wrong").status_code == 401
+
+
+def test_partners_see_only_their_own_proposals(database, call, tokens, make_proposal):
+    admin, partner = tokens
+    own = make_proposal("partner@example.com", title="Own")
+    other = make_proposal("other@example.com", title="Other")
+    database.import_proposals([own, other])
+
+    listing = call("GET", "/api/v1/proposals", token=partner, params={"fields": "id,title"})
+
+    assert listing.json()["items"] == [{"id": own["id"], "title": "Own"}]
+    assert call("GET", f"/api/v1/proposals/{other['id']}", token=partner).status_code == 404
+    assert call("GET", "/api/v1/proposals", token=admin).json()["total"] == 2
+
+
+def test_status_updates_report_conflicts_and_missing(database, call, tokens, make_proposal):
+    admin, partner = tokens
+    fresh, stale = make_proposal(), make_proposal()
+    database.import_proposals([fresh, stale])
+    body = {
+        "updates": [
+            {"id": fresh["id"], "status": "Approved", "version": 1},
+            {"id": stale["id"], "status": "Approved", "version": 7},
+            {"id": "nope", "status": "Approved"},
+        ]
+    }
+
+    assert call("POST", "/api/v1/proposals/status", token=partner, json=body).status_code == 403
+    response = call("POST", "/api/v1/proposals/status", token=admin, json=body)
+
+    assert response.json() == {"updated": 1, "missing": ["nope"], "conflicts": [stale["id"]]}
+    assert database.get_proposal(fresh["id"])["status"] == "Approved"
+
+
+def test_created_proposal_is_stored_with_its_jobs(
+    database, call, tokens, tmp_path, monkeypatch
+):
+    _, partner = tokens
+    monkeypatch.setattr(api.rx, "get_upload_dir", lambda: tmp_path)
+    fields = {
+        "full_name": "Partner Person",
+        "email": "partner@example.com",
+        "affiliation": "Lab",
+        "phone_number": "+1 555 0100",
+        "title": "New instrument time",
+        "description": "We would like beam time.",
+    }
+
+    response = call(
+        "POST",
+        "/api/v1/proposals",
+        token=partner,
+        data=fields,
+        files={"file": ("plan.pdf", b"%PDF-1.4 plan", "application/pdf")},
+    )
+
+    assert response.status_code == 201, response.text
+    proposal = database.get_proposal(response.json()["id"])
+    assert proposal["user_email"] == "partner@example.com"
+    assert (tmp_path / proposal["proposal_file"]).read_bytes() == b"%PDF-1.4 plan"
+    assert {job["kind"] for job in database.get_proposal_jobs(proposal["id"])} == {
+        "hash_file",
+        "extract_text",
+    }
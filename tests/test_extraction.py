@@ -0,0 +1,82 @@
+import time
+import zipfile
+import zlib
+
+import pytest
+
+from app.services import extraction
+from app.services.extraction import ExtractionError
+
+
+def _docx(path, *paragraphs):
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "word/document.xml", f'<w:document xmlns:w="urn:w"><w:body>{body}</w:body></w:document>'
+        )
+    return path
+
+
+def _hang(path):
+    time.sleep(60)
+
+
+def _echo(path):
+    return path
+
+
+def test_text_stops_at_the_character_cap(tmp_path):
+    document = _docx(tmp_path / "long.docx", "a" * 50, "b" * 50)
+
+    assert extraction.extract_text(document, max_chars=60) == "a" * 50 + "\n" + "b" * 9
+
+
+def test_oversized_pdf_is_refused_unread(tmp_path, monkeypatch):
+    document = tmp_path / "big.pdf"
+    document.write_bytes(b"%PDF-1.4\n" + b"0" * 1000)
+    monkeypatch.setattr(extraction, "MAX_DOCUMENT_BYTES", 100)
+    monkeypatch.setattr(type(document), "read_bytes", lambda self: pytest.fail("file was read"))
+
+    with pytest.raises(ExtractionError, match="larger than 100 bytes"):
+        extraction.extract_text(document)
+
+
+def test_zip_part_over_the_stream_cap_is_refused(tmp_path, monkeypatch):
+    document = _docx(tmp_path / "bomb.docx", "x" * 5000)
+    monkeypatch.setattr(extraction, "MAX_STREAM_BYTES", 1000)
+
+    with pytest.raises(ExtractionError, match="exceeds the size limit"):
+        extraction.extract_text(document)
+
+
+def test_deflate_stream_over_the_cap_is_refused(monkeypatch):
+    monkeypatch.setattr(extraction, "MAX_STREAM_BYTES", 1000)
+
+    assert extraction._inflate(zlib.compress(b"x" * 1000)) == b"x" * 1000
+    with pytest.raises(ExtractionError, match="exceeds the size limit"):
+        extraction._inflate(zlib.compress(b"x" * 1001))
+
+
+def test_timed_out_worker_is_killed_and_the_pool_replaced(monkeypatch):
+    monkeypatch.setattr(extraction, "EXTRACTION_TIMEOUT_SECONDS", 2)
+    workers = []
+    discard = extraction._discard_pool
+
+    def record_workers(pool, kill=False):
+        workers.extend(pool._processes.values())
+        discard(pool, kill)
+
+    monkeypatch.setattr(extraction, "_discard_pool", record_workers)
+    try:
+        hung_pool = extraction._get_pool()
+        with pytest.raises(ExtractionError, match="took longer than 2 s"):
+            extraction._run_in_pool(_hang, "slow.pdf")
+        for worker in workers:
+            worker.join(5)
+
+        assert extraction._pool is None
+        assert workers and not any(worker.is_alive() for worker in workers)
+        assert extraction._run_in_pool(_echo, "next.pdf") == "next.pdf"
+        assert extraction._pool is not hung_pool
+    finally:
+        extraction.shutdown_pool()
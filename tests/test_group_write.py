@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+
+from app.state import Database, User
+
+
+def _hold_batch_open(database: Database):
+    """Counts a phantom writer so the next batch leader waits for the commit window."""
+    with database._writers:
+        database._active_writers += 1
+
+
+def _release_batch(database: Database):
+    with database._writers:
+        database._active_writers -= 1
+        database._writers.notify_all()
+
+
+def _wait_for_batch(database: Database):
+    deadline = time.monotonic() + 5
+    while database._commit_batch is None:
+        assert time.monotonic() < deadline, "no batch was started"
+        time.sleep(0.01)
+
+
+def test_failed_block_keeps_other_cached_rows(database, make_proposal):
+    first, second = make_proposal(title="First"), make_proposal(title="Second")
+    database.add_proposal(first)
+    database.add_proposal(second)
+
+    with pytest.raises(ValueError):
+        with database._group_write():
+            database._apply_proposal_update(first["id"], {"title": "Changed"}, "tester")
+            raise ValueError
+
+    assert first["id"] not in database._proposal_cache
+    assert second["id"] in database._proposal_cache
+    assert database.get_proposal(first["id"])["title"] == "First"
+
+
+def test_failed_block_leaves_the_rest_of_its_batch(database, tmp_path, make_proposal):
+    database.commit_window = 5
+    kept = make_proposal(title="Kept")
+    _hold_batch_open(database)
+    writer = threading.Thread(target=database.add_proposal, args=(kept,))
+    writer.start()
+    try:
+        _wait_for_batch(database)
+        with pytest.raises(ValueError):
+            with database._group_write():
+                database._conn.execute(
+                    "UPDATE proposals SET title = 'Undone' WHERE id = ?", (kept["id"],)
+                )
+                raise ValueError
+    finally:
+        _release_batch(database)
+        writer.join()
+
+    other = Database(tmp_path / "test.db")
+    assert other.get_proposal(kept["id"])["title"] == "Kept"
+    assert database.get_proposal(kept["id"])["title"] == "Kept"
+
+
+def test_reads_wait_for_the_pending_group_commit(database, tmp_path):
+    database.commit_window = 5
+    _hold_batch_open(database)
+    writer = threading.Thread(target=database.add_user, args=(User("new@example.com", "x"),))
+    writer.start()
+    _wait_for_batch(database)
+    release = threading.Timer(0.2, _release_batch, args=(database,))
+    release.start()
+    started = time.monotonic()
+    user = database.get_user("new@example.com")
+    waited = time.monotonic() - started
+    writer.join()
+    release.join()
+
+    assert user is not None
+    assert waited >= 0.15
+    assert Database(tmp_path / "test.db").get_user("new@example.com") is not None
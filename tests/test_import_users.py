@@ -0,0 +1,43 @@
+from app.services import imports
+from app.state import User
+
+
+def test_import_users_skips_and_does_not_audit_existing_emails(database):
+    database.add_user(User("taken@example.com", "x"))
+    history = database.get_audit_events("user", "taken@example.com")
+
+    inserted = database.import_users(
+        [User("taken@example.com", "y"), User("fresh@example.com", "y")], "admin"
+    )
+
+    assert inserted == {"fresh@example.com"}
+    assert database.get_audit_events("user", "taken@example.com") == history
+    assert [event["action"] for event in database.get_audit_events("user", "fresh@example.com")] == [
+        "Import"
+    ]
+
+
+def test_user_import_reports_emails_taken_after_the_precheck(database, monkeypatch):
+    database.add_user(User("raced@example.com", "x"))
+    monkeypatch.setattr(imports, "db", database)
+    # The account appears between the existence check and the insert.
+    monkeypatch.setattr(database, "existing_user_emails", lambda emails: set())
+
+    report = imports.import_users(
+        [(2, {"email": "raced@example.com"}), (3, {"email": "fresh@example.com"})], "admin"
+    )
+
+    assert report.imported == 1
+    assert [email for email, _ in report.credentials] == ["fresh@example.com"]
+    assert report.errors == [(2, "raced@example.com already has an account.")]
+
+
+def test_import_users_adds_a_repeated_email_once(database):
+    inserted = database.import_users(
+        [User("twice@example.com", "first", is_admin=True), User("twice@example.com", "second")],
+        "admin",
+    )
+
+    assert inserted == {"twice@example.com"}
+    assert database.get_user("twice@example.com").password_hash == "first"
+    assert len(database.get_audit_events("user", "twice@example.com")) == 1
@@ -0,0 +1,120 @@
+import hashlib
+import zipfile
+
+import pytest
+
+from app.services import extraction, jobs, previews
+from app.state import Database
+
+
+@pytest.fixture
+def queue(database, tmp_path, monkeypatch):
+    """A worker pool on the test database, reading uploads from ``tmp_path / 'uploads'``."""
+    uploads = tmp_path / "uploads"
+    uploads.mkdir()
+    monkeypatch.setattr(jobs, "db", database)
+    monkeypatch.setattr(
+        jobs,
+        "locate_upload",
+        lambda name: uploads / name if name and (uploads / name).is_file() else None,
+    )
+    monkeypatch.setattr(previews, "PREVIEW_CACHE_DIR", tmp_path / "previews")
+    yield jobs.JobWorkerPool(workers=1), uploads
+    extraction.shutdown_pool()
+
+
+def _statuses(database, proposal_id):
+    return {
+        job["kind"]: (job["status"], job["attempts"])
+        for job in database.get_proposal_jobs(proposal_id)
+    }
+
+
+def _drain(pool, limit=10):
+    for _ in range(limit):
+        if not pool.run_once():
+            return
+    raise AssertionError("the queue did not drain")
+
+
+@pytest.fixture
+def flaky(monkeypatch):
+    calls = []
+
+    def handler(proposal_id, payload):
+        calls.append(proposal_id)
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(jobs._handlers, "flaky", handler)
+    return calls
+
+
+def test_failed_job_waits_out_its_backoff(database, queue, flaky):
+    pool, _ = queue
+    database.enqueue_job("p1", "flaky", max_attempts=2)
+
+    assert pool.run_once()
+
+    assert _statuses(database, "p1") == {"flaky": ("queued", "1/2")}
+    assert not pool.run_once()
+
+
+def test_failed_job_is_retried_until_max_attempts(database, queue, flaky, monkeypatch):
+    pool, _ = queue
+    monkeypatch.setattr(jobs, "RETRY_BASE_DELAY_SECONDS", 0)
+    database.enqueue_job("p1", "flaky", max_attempts=2)
+
+    _drain(pool)
+
+    assert flaky == ["p1", "p1"]
+    assert _statuses(database, "p1") == {"flaky": ("failed", "2/2")}
+    assert database.get_proposal_jobs("p1")[0]["last_error"] == "RuntimeError: boom"
+
+
+def test_job_is_claimed_once_across_connections(database, tmp_path):
+    job_id = database.enqueue_job("p1", "hash_file")
+    other_worker = Database(tmp_path / "test.db")
+
+    claimed = database.claim_job()
+
+    assert claimed["id"] == job_id
+    assert database.claim_job() is None
+    assert other_worker.claim_job() is None
+
+
+def test_running_job_of_a_dead_worker_is_requeued(database, tmp_path):
+    job_id = database.enqueue_job("p1", "hash_file")
+    database.claim_job()
+
+    assert Database(tmp_path / "test.db").requeue_stale_jobs(-1) == 1
+    reclaimed = database.claim_job()
+
+    assert reclaimed["id"] == job_id
+    assert reclaimed["attempts"] == 2
+
+
+def test_submission_chain_hashes_indexes_and_previews(database, queue, make_proposal):
+    pool, uploads = queue
+    upload = uploads / "proposal.docx"
+    with zipfile.ZipFile(upload, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="urn:w"><w:body><w:p><w:r><w:t>Quantum widgets</w:t>'
+            "</w:r></w:p></w:body></w:document>",
+        )
+    proposal = make_proposal(proposal_file=upload.name)
+    database.add_proposal(proposal)
+
+    jobs.enqueue_post_submission(proposal["id"], upload.name)
+    _drain(pool)
+
+    file_hash = hashlib.sha256(upload.read_bytes()).hexdigest()
+    assert database.get_proposal(proposal["id"])["file_hash"] == file_hash
+    assert _statuses(database, proposal["id"]) == {
+        "hash_file": ("done", "1/3"),
+        "extract_text": ("done", "1/3"),
+        "preview": ("done", "1/3"),
+    }
+    assert "Quantum widgets" in previews.get_preview(file_hash)["excerpt"]
+    if database.fts_enabled:
+        assert proposal["id"] in database.search_proposal_documents("widgets")
@@ -0,0 +1,33 @@
+import pytest
+
+from app.state import Database, StaleProposalError
+
+
+def test_update_with_stale_version_raises_with_current_row(database, make_proposal):
+    proposal = make_proposal()
+    database.add_proposal(proposal)
+    database.update_proposal(proposal["id"], {"title": "Second"}, "tester", expected_version=1)
+
+    with pytest.raises(StaleProposalError) as error:
+        database.update_proposal(proposal["id"], {"title": "Third"}, "tester", expected_version=1)
+
+    assert error.value.current["version"] == 2
+    assert error.value.current["title"] == "Second"
+    assert database.get_proposal(proposal["id"])["title"] == "Second"
+
+
+def test_update_rereads_rows_changed_by_another_connection(database, tmp_path, make_proposal):
+    proposal = make_proposal()
+    database.add_proposal(proposal)
+    database.get_proposal(proposal["id"])
+    Database(tmp_path / "test.db").update_proposal(proposal["id"], {"title": "Elsewhere"})
+
+    with pytest.raises(StaleProposalError):
+        database.update_proposal(proposal["id"], {"title": "Here"}, expected_version=1)
+    updated = database.update_proposal(proposal["id"], {"status": "Approved"}, expected_version=2)
+
+    assert updated["version"] == 3
+    assert updated["title"] == "Elsewhere"
+    assert database.get_proposal(proposal["id"]) == Database(tmp_path / "test.db").get_proposal(
+        proposal["id"]
+    )
@@ -0,0 +1,65 @@
+import threading
+import time
+
+import pytest
+
+from app.services.query_cache import SharedQueryCache
+
+
+def test_concurrent_misses_compute_once():
+    cache = SharedQueryCache()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return [{"id": "p1"}]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("page", compute)))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats()["waits"] < 5 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [[{"id": "p1"}]] * 6
+    assert cache.stats() == {"size": 1, "hits": 0, "misses": 1, "waits": 5}
+
+
+def test_failed_compute_is_not_cached():
+    cache = SharedQueryCache()
+
+    with pytest.raises(ZeroDivisionError):
+        cache.get("page", lambda: 1 / 0)
+
+    assert cache.get("page", lambda: 1) == 1
+
+
+def test_callers_get_private_copies():
+    cache = SharedQueryCache()
+    first = cache.get("page", lambda: [{"id": "p1"}])
+
+    first[0]["id"] = "changed"
+
+    assert cache.get("page", lambda: pytest.fail("recomputed")) == [{"id": "p1"}]
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = SharedQueryCache(size=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+
+    cache.get("c", lambda: 3)
+
+    assert cache.get("a", lambda: pytest.fail("recomputed")) == 1
+    assert cache.get("b", lambda: "again") == "again"
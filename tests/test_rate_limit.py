@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from app.services import rate_limit
+from app.services.rate_limit import (
+    DatabaseStore,
+    MemoryStore,
+    RateLimitPolicy,
+    RateLimiter,
+)
+
+
+@pytest.fixture(params=["memory", "database"])
+def store(request, database):
+    if request.param == "database":
+        return DatabaseStore(database)
+    return MemoryStore()
+
+
+def test_bucket_admits_its_capacity_then_asks_to_wait(store):
+    limiter = RateLimiter(store)
+    policy = RateLimitPolicy("test", 3, 60)
+
+    assert [limiter.admit((policy, "1.2.3.4")) for _ in range(3)] == [0.0, 0.0, 0.0]
+    retry_after = limiter.admit((policy, "1.2.3.4"))
+
+    assert 0 < retry_after <= 20
+    assert limiter.admit((policy, "5.6.7.8")) == 0.0
+
+
+def test_bucket_refills_over_time(store):
+    store.take_token("test:key", 1, 1.0, now=100.0)
+
+    assert store.take_token("test:key", 1, 1.0, now=100.5) == pytest.approx(0.5)
+    assert store.take_token("test:key", 1, 1.0, now=102.0) == 0.0
+
+
+def test_lockout_starts_at_the_threshold_and_doubles(store):
+    limiter = RateLimiter(store)
+
+    lockouts = [
+        limiter.record_failure("a@example.com")
+        for _ in range(rate_limit.LOCKOUT_THRESHOLD + 2)
+    ]
+
+    base = rate_limit.LOCKOUT_BASE_SECONDS
+    assert lockouts == [0] * (rate_limit.LOCKOUT_THRESHOLD - 1) + [base, 2 * base, 4 * base]
+    assert limiter.lockout_remaining("a@example.com") > 3 * base
+    assert limiter.lockout_remaining("b@example.com") == 0
+
+
+def test_success_clears_the_failure_count(store):
+    limiter = RateLimiter(store)
+    for _ in range(rate_limit.LOCKOUT_THRESHOLD):
+        limiter.record_failure("a@example.com")
+
+    limiter.record_success("a@example.com")
+
+    assert limiter.lockout_remaining("a@example.com") == 0
+    assert limiter.record_failure("a@example.com") == 0
+
+
+def test_concurrent_failures_are_all_counted(store):
+    limiter = RateLimiter(store)
+    barrier = threading.Barrier(8)
+
+    def fail():
+        barrier.wait()
+        for _ in range(5):
+            limiter.record_failure("a@example.com")
+
+    threads = [threading.Thread(target=fail) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.get_lockout("lockout:a@example.com")[0] == 40
+
+
+def test_memory_store_prunes_idle_entries(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_MEMORY_PRUNE_SIZE", 2)
+    store = MemoryStore()
+    store.take_token("old", 5, 1.0, now=0.0)
+    store.add_failure("lockout:old", lambda failures: 0, now=0.0)
+    store.add_failure("lockout:locked", lambda failures: 10_000, now=0.0)
+
+    store.take_token("new", 5, 1.0, now=2 * 60 * 60)
+    store.take_token("newer", 5, 1.0, now=2 * 60 * 60)
+    store.add_failure("lockout:new", lambda failures: 0, now=2 * 60 * 60)
+
+    assert set(store._buckets) == {"new", "newer"}
+    assert set(store._failures) == {"lockout:locked", "lockout:new"}
@@ -0,0 +1,97 @@
+import pytest
+
+from app.services import sessions
+from app.services.sessions import SessionStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(sessions.time, "time", lambda: now[0])
+    return now
+
+
+def test_token_resolves_to_its_user(database):
+    store = SessionStore(database)
+
+    token = store.create("a@example.com")
+
+    assert store.resolve(token) == "a@example.com"
+    assert SessionStore(database).resolve(token) == "a@example.com"
+    assert store.resolve("not-a-token") is None
+    assert store.resolve("") is None
+
+
+def test_revoked_token_no_longer_resolves(database):
+    store = SessionStore(database)
+    token = store.create("a@example.com")
+
+    store.revoke(token)
+
+    assert store.resolve(token) is None
+    assert database.get_session(token) is None
+
+
+def test_session_expires_after_inactivity(database, clock):
+    store = SessionStore(database, ttl=600, cache_seconds=0)
+    token = store.create("a@example.com")
+
+    clock[0] += 601
+
+    assert store.resolve(token) is None
+    assert database.get_session(token) is None
+
+
+def test_activity_extends_the_session(database, clock):
+    ttl = sessions.SESSION_EXTEND_INTERVAL_SECONDS * 2
+    store = SessionStore(database, ttl=ttl, cache_seconds=0)
+    token = store.create("a@example.com")
+    expires_at = database.get_session(token)[1]
+
+    clock[0] += sessions.SESSION_EXTEND_INTERVAL_SECONDS + 1
+    assert store.resolve(token) == "a@example.com"
+
+    assert database.get_session(token)[1] == clock[0] + ttl > expires_at
+
+
+def test_revoke_user_keeps_only_the_current_session(database):
+    store = SessionStore(database)
+    current = store.create("a@example.com")
+    other = store.create("a@example.com")
+    someone_else = store.create("b@example.com")
+
+    assert store.revoke_user("a@example.com", keep=current) == 1
+
+    assert store.resolve(current) == "a@example.com"
+    assert store.resolve(other) is None
+    assert store.resolve(someone_else) == "b@example.com"
+
+
+def test_cached_session_skips_the_database(database, monkeypatch):
+    store = SessionStore(database)
+    token = store.create("a@example.com")
+    monkeypatch.setattr(database, "get_session", lambda token: pytest.fail("database was asked"))
+
+    assert store.resolve(token) == "a@example.com"
+
+
+def test_revocation_by_another_worker_shows_after_the_cache_period(database, clock):
+    store = SessionStore(database, cache_seconds=60)
+    token = store.create("a@example.com")
+
+    SessionStore(database).revoke(token)
+    assert store.resolve(token) == "a@example.com"
+
+    clock[0] += 61
+    assert store.resolve(token) is None
+
+
+def test_cache_keeps_the_most_recently_used_sessions(database):
+    store = SessionStore(database, cache_size=2)
+    first, second = store.create("a@example.com"), store.create("b@example.com")
+    store.resolve(first)
+
+    store.create("c@example.com")
+
+    assert first in store._cache
+    assert second not in store._cache
@@ -0,0 +1,63 @@
+import pytest
+
+from app.state import Database, ShardedDatabase
+
+
+OWNERS = [f"owner{number}@example.com" for number in range(7)]
+
+
+@pytest.fixture
+def pair(tmp_path, make_proposal):
+    """The same proposals in one file and spread over three shards."""
+    single = Database(tmp_path / "single.db")
+    sharded = ShardedDatabase(tmp_path / "sharded.db", 3)
+    single.open()
+    sharded.open()
+    proposals = [
+        make_proposal(
+            OWNERS[number % len(OWNERS)],
+            # Proposals share timestamps in pairs, so ties are ordered by id.
+            created_at=f"2026-01-01T00:{number // 2:02d}:00",
+            status="Approved" if number % 4 == 0 else "Submitted",
+            title=f"Proposal {number}",
+        )
+        for number in range(40)
+    ]
+    single.import_proposals(proposals)
+    sharded.import_proposals(proposals)
+    return single, sharded
+
+
+def _ids(proposals):
+    return [proposal["id"] for proposal in proposals]
+
+
+@pytest.mark.parametrize("limit, offset", [(10, 0), (10, 10), (7, 33), (25, 30), (5, 40)])
+def test_sharded_pages_match_single_file(pair, limit, offset):
+    single, sharded = pair
+
+    assert _ids(sharded.query_proposals(limit=limit, offset=offset)) == _ids(
+        single.query_proposals(limit=limit, offset=offset)
+    )
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{"status": "Approved"}, {"search": "Proposal 1"}, {"user_email": OWNERS[3]}],
+)
+def test_sharded_filtered_pages_match_single_file(pair, filters):
+    single, sharded = pair
+
+    assert sharded.count_proposals(**filters) == single.count_proposals(**filters)
+    for offset in range(0, 40, 6):
+        assert _ids(sharded.query_proposals(**filters, limit=6, offset=offset)) == _ids(
+            single.query_proposals(**filters, limit=6, offset=offset)
+        )
+
+
+def test_sharded_proposals_are_spread_and_complete(pair):
+    single, sharded = pair
+
+    assert all(shard.count_proposals() for shard in sharded.shards)
+    assert sharded.count_proposals() == single.count_proposals() == 40
+    assert sorted(_ids(sharded.get_all_proposals())) == sorted(_ids(single.get_all_proposals()))
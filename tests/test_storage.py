@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from app.services import storage
+
+
+@pytest.fixture
+def upload_dirs(tmp_path, monkeypatch):
+    primary, fallback = tmp_path / "primary", tmp_path / "fallback"
+    primary.mkdir()
+    fallback.mkdir()
+    monkeypatch.setattr(storage, "upload_dirs", lambda: [primary, fallback])
+    return primary, fallback
+
+
+def test_batches_visit_every_upload_once_in_name_order(upload_dirs):
+    primary, fallback = upload_dirs
+    for number in range(0, 30, 2):
+        (primary / f"file{number:02d}.pdf").write_bytes(b"x")
+    for number in range(0, 30, 3):
+        (fallback / f"file{number:02d}.pdf").write_bytes(b"x")
+    (primary / ".partial").write_bytes(b"x")
+    (primary / "subdir").mkdir()
+    expected = sorted(set(os.listdir(primary)) | set(os.listdir(fallback)))
+    expected = [name for name in expected if name.endswith(".pdf")]
+
+    visited, cursor = [], ""
+    while True:
+        names = storage._iter_upload_names(cursor, 4)
+        visited.extend(names)
+        if len(names) < 4:
+            break
+        cursor = names[-1]
+
+    assert visited == expected
+
+
+def test_missing_upload_directory_is_skipped(upload_dirs):
+    primary, fallback = upload_dirs
+    (primary / "a.pdf").write_bytes(b"x")
+    fallback.rmdir()
+
+    assert storage._iter_upload_names("", 10) == ["a.pdf"]
+
+
+def test_orphans_are_reported_and_the_cursor_saved(
+    database, upload_dirs, monkeypatch, make_proposal
+):
+    primary, _ = upload_dirs
+    monkeypatch.setattr(storage, "db", database)
+    for name in ("kept.pdf", "orphan1.pdf", "orphan2.pdf"):
+        (primary / name).write_bytes(b"x")
+    database.add_proposal(make_proposal(proposal_file="kept.pdf"))
+
+    first = storage.reconcile_batch(batch_size=2, grace_seconds=0, scan_rows=False)
+    second = storage.reconcile_batch(batch_size=2, grace_seconds=0, scan_rows=False)
+
+    assert first["orphans"] == ["orphan1.pdf"] and not first["files_done"]
+    assert second["orphans"] == ["orphan2.pdf"] and second["files_done"]
+    assert database.get_maintenance_value(storage._FILE_CURSOR_KEY) == ""
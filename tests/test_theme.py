@@ -0,0 +1,16 @@
+import pytest
+
+from app.components.theme import themed
+
+
+def test_dark_only_classes_get_the_dark_variant():
+    assert themed("p-4 text-white shadow-lg", "p-4 text-slate-900 shadow") == (
+        "p-4 text-slate-900 shadow dark:text-white dark:shadow-lg"
+    )
+
+
+def test_light_only_class_without_a_dark_override_is_refused():
+    with pytest.raises(ValueError, match="shadow"):
+        themed("p-4 backdrop-blur", "p-4 shadow")
+    with pytest.raises(ValueError, match="hover:bg-slate-100"):
+        themed("bg-white/5", "bg-white hover:bg-slate-100")